@@ -108,6 +108,8 @@ from mesh_master import (
 )
 from mesh_master.alarm_timer_manager import AlarmTimerManager
 from mesh_master.command_utils import promote_bare_command
+from mesh_master import relay_manager
+from mesh_master import telegram_notify
 # Make sure DEBUG_ENABLED exists before any logger/filter classes use it
 # -----------------------------
 # Global Debug & Noise Patterns
@@ -2116,20 +2118,8 @@ RADIO_WATCHDOG_STATE = {
     "generic": 0.0,
 }
 
-# Shortname relay cache: maps lowercase shortnames to node_ids
-# Updated automatically whenever a node is seen (heartbeat, message, etc.)
-SHORTNAME_TO_NODE_CACHE: Dict[str, str] = {}
-SHORTNAME_CACHE_LOCK = threading.Lock()
-
-# Relay queue system for robust handling under heavy load
-RELAY_QUEUE: queue.Queue = queue.Queue(maxsize=100)  # Limit queue size to prevent memory issues
-RELAY_WORKERS_COUNT = 3  # Number of concurrent relay worker threads
-RELAY_WORKERS_STARTED = False
-
-# Track pending relay ACKs: {packet_id: {sender_id, target_shortname, message, ack_event, ack_node}}
-PENDING_RELAY_ACKS: Dict[int, Dict[str, Any]] = {}
-RELAY_ACK_LOCK = threading.Lock()
-RELAY_ACK_TIMEOUT = 20  # seconds
+# The shortname cache, relay queue, worker pool and ACK tracking live in
+# mesh_master.relay_manager; this module wires them to the radio interface.
 
 # Track last relay sender for auto-route replies: {recipient_key: sender_node_id}
 LAST_RELAY_SENDER: Dict[str, str] = {}
@@ -2262,7 +2252,7 @@ def _try_deliver_offline_relays(target_node_id: str):
         }
 
         try:
-            RELAY_QUEUE.put(relay_task, block=False)
+            relay_manager.enqueue_relay(relay_task)
             clean_log(f"Queued offline relay delivery to {target_shortname} (attempt {msg_data['attempts']})", "📬")
         except queue.Full:
             # Relay queue full, put back in offline queue
@@ -3929,6 +3919,7 @@ try:
 except (TypeError, ValueError):
     OFFLINE_DDG_MAX_ENTRIES = 600
 OFFLINE_DDG_MULTI_LANGUAGE = bool(config.get("offline_ddg_multi_language", True))
+OFFLINE_DDG_SQLITE = bool(config.get("offline_ddg_sqlite", False))
 OFFLINE_DDG_STORES: Dict[str, OfflineDDGStore] = {}
 
 
@@ -3949,7 +3940,7 @@ def _get_ddg_store_for_lang(language_hint: Optional[str]) -> Optional[OfflineDDG
     except Exception:
         pass
     try:
-        store = OfflineDDGStore(index_file, base_dir=base_dir)
+        store = OfflineDDGStore(index_file, base_dir=base_dir, use_sqlite=OFFLINE_DDG_SQLITE)
         OFFLINE_DDG_STORES[key] = store
         return store
     except Exception as exc:
@@ -3958,7 +3949,7 @@ def _get_ddg_store_for_lang(language_hint: Optional[str]) -> Optional[OfflineDDG
 
 
 OFFLINE_DDG_STORE = (
-    OfflineDDGStore(OFFLINE_DDG_DIR / "index.json", base_dir=OFFLINE_DDG_DIR)
+    OfflineDDGStore(OFFLINE_DDG_DIR / "index.json", base_dir=OFFLINE_DDG_DIR, use_sqlite=OFFLINE_DDG_SQLITE)
     if OFFLINE_DDG_ENABLED and not OFFLINE_DDG_MULTI_LANGUAGE
     else None
 )
@@ -4558,19 +4549,20 @@ def _persist_offline_crawl(
             parsed.scheme + "://" + display_host if parsed.scheme else "",
         }
         alias_candidates.add(display_host.replace('.', ' '))
-        result = store.store_crawl(
-            title=title,
-            summary=summary,
-            context=context,
-            source=start_url,
-            fetched_at=timestamp,
-            pages=pages,
-            contacts=contacts,
-            contact_page=contact_page,
-            aliases=[alias for alias in alias_candidates if alias],
-            language=_wiki_lang_code(language_hint),
-        )
-        store.prune_by_max(OFFLINE_CRAWL_MAX_ENTRIES)
+        with store.batch_writes():
+            result = store.store_crawl(
+                title=title,
+                summary=summary,
+                context=context,
+                source=start_url,
+                fetched_at=timestamp,
+                pages=pages,
+                contacts=contacts,
+                contact_page=contact_page,
+                aliases=[alias for alias in alias_candidates if alias],
+                language=_wiki_lang_code(language_hint),
+            )
+            store.prune_by_max(OFFLINE_CRAWL_MAX_ENTRIES)
         slug = result.get("slug") if isinstance(result, dict) else None
         label = slug or title
         author_suffix = f" by {author_label}" if author_label else ""
@@ -10170,7 +10162,7 @@ def process_responses_worker():
                     if is_telegram_query and response_text:
                         # Telegram query - send via Telegram HTTP API
                         try:
-                            chat_id = int(sender_node.replace("telegram_", ""))
+                            chat_id = telegram_notify.parse_chat_id(sender_node)
                             add_script_log(f"Sending AI response to Telegram chat {chat_id}")
 
                             # Get bot token from the telegram_app (already running bot)
@@ -10179,18 +10171,15 @@ def process_responses_worker():
                             max_telegram_len = 4096
 
                             def send_to_telegram_sync():
-                                import requests
-                                url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-
                                 try:
                                     if len(response_text) <= max_telegram_len:
-                                        r = requests.post(url, json={"chat_id": chat_id, "text": response_text}, timeout=10)
+                                        r = telegram_notify.post_message(chat_id, response_text)
                                         add_script_log(f"HTTP response: {r.status_code}, {r.text[:100]}")
                                     else:
                                         # Send in chunks
                                         for i in range(0, len(response_text), max_telegram_len):
                                             chunk = response_text[i:i+max_telegram_len]
-                                            r = requests.post(url, json={"chat_id": chat_id, "text": chunk}, timeout=10)
+                                            r = telegram_notify.post_message(chat_id, chunk)
                                             add_script_log(f"HTTP chunk response: {r.status_code}")
                                             if chunk_delay:
                                                 time.sleep(chunk_delay)
@@ -11268,184 +11257,33 @@ def _handle_pending_save_response(sender_id: Any, sender_key: str, text: str) ->
     return _save_conversation_for_user(origin_id, sender_key, cleaned, lang, auto_title=False)
 
 
-def _relay_worker():
-    """Worker thread that processes relay queue items."""
-    while True:
-        try:
-            # Get relay task from queue (blocks until available)
-            relay_task = RELAY_QUEUE.get(timeout=1)
-
-            sender_id = relay_task['sender_id']
-            target_shortname = relay_task['target_shortname']
-            target_node_id = relay_task['target_node_id']
-            relay_text = relay_task['relay_text']
-            message = relay_task['message']
-
-            # Send message and track packet ID for ACK monitoring
-            try:
-                if not interface:
-                    send_direct_chunks(interface, "❌ Radio interface not available", sender_id)
-                    continue
-
-                # Create threading event to wait for ACK
-                ack_event = threading.Event()
-                packet_id = None
-
-                # Split message into chunks to handle long messages
-                chunks = split_message(relay_text)
-                if not chunks:
-                    failure_msg = f"❌ Failed to prepare relay to {target_shortname}"
-                    send_direct_chunks(interface, failure_msg, sender_id)
-                    continue
-
-                # Send all chunks and collect packet IDs
-                packet_ids = []
-                send_errors = []
-
-                for chunk_idx, chunk in enumerate(chunks):
-                    send_result = {'packet_id': None, 'error': None}
-
-                    def _send_relay_chunk(chunk_text=chunk):
-                        try:
-                            mesh_packet = interface.sendText(chunk_text, destinationId=target_node_id, wantAck=True)
-                            # Extract packet ID from MeshPacket object
-                            if hasattr(mesh_packet, 'id'):
-                                send_result['packet_id'] = mesh_packet.id
-                            elif isinstance(mesh_packet, int):
-                                send_result['packet_id'] = mesh_packet
-                        except Exception as e:
-                            send_result['error'] = str(e)
-
-                    send_thread = threading.Thread(target=_send_relay_chunk, daemon=True)
-                    send_thread.start()
-                    send_thread.join(timeout=2.0)
-
-                    if send_result['packet_id']:
-                        packet_ids.append(send_result['packet_id'])
-                        clean_log(f"Relay chunk {chunk_idx + 1}/{len(chunks)} sent (ID={send_result['packet_id']})", "📨", show_always=False)
-                        # Record relay stat on first successful chunk
-                        if chunk_idx == 0:
-                            try:
-                                STATS.record_relay(target_node_id)
-                            except Exception:
-                                pass
-                    elif send_result['error']:
-                        send_errors.append(f"Chunk {chunk_idx + 1}: {send_result['error']}")
-
-                    # Small delay between chunks
-                    if chunk_idx < len(chunks) - 1:
-                        time.sleep(0.5)
-
-                if not packet_ids:
-                    # All chunks failed
-                    failure_msg = f"❌ Failed to send to {target_shortname}"
-                    send_direct_chunks(interface, failure_msg, sender_id)
-                    clean_log(f"Relay send error: {'; '.join(send_errors)}", "⚠️")
-                    continue
-
-                # Create shared ACK tracking event for all chunks
-                ack_events = []
-                for packet_id in packet_ids:
-                    chunk_ack_event = threading.Event()
-                    ack_events.append(chunk_ack_event)
-                    with RELAY_ACK_LOCK:
-                        PENDING_RELAY_ACKS[packet_id] = {
-                            'sender_id': sender_id,
-                            'target_shortname': target_shortname,
-                            'target_node_id': target_node_id,
-                            'message': message,
-                            'ack_event': chunk_ack_event,
-                            'ack_node': None,
-                            'timestamp': time.time()
-                        }
-
-                # Wait up to 20 seconds for ACKs from all chunks
-                start_time = time.time()
-                final_ack_node = None
-                all_acks_received = False
-
-                while (time.time() - start_time) < RELAY_ACK_TIMEOUT:
-                    # Check if all chunks have ACKed
-                    all_acked = all(event.is_set() for event in ack_events)
-
-                    if all_acked:
-                        # All chunks ACKed - get the ACK node from any chunk
-                        with RELAY_ACK_LOCK:
-                            for packet_id in packet_ids:
-                                if packet_id in PENDING_RELAY_ACKS:
-                                    ack_node = PENDING_RELAY_ACKS[packet_id].get('ack_node')
-                                    if ack_node:
-                                        final_ack_node = ack_node
-                                        if same_node_id(ack_node, target_node_id):
-                                            # Full ACK from intended recipient
-                                            all_acks_received = True
-                                            break
-
-                        if all_acks_received:
-                            break
-
-                        # Got ACKs but not from target - keep waiting
-                        if final_ack_node:
-                            all_acks_received = True
-                            break
-
-                    time.sleep(1.0)
-
-                # Clean up tracking entries
-                with RELAY_ACK_LOCK:
-                    for packet_id in packet_ids:
-                        ack_info = PENDING_RELAY_ACKS.pop(packet_id, None)
-                        if ack_info and not final_ack_node:
-                            final_ack_node = ack_info.get('ack_node')
-
-                if all_acks_received and final_ack_node:
-                    # All chunks ACKed
-                    ack_shortname = get_node_shortname(final_ack_node)
-                    success_msg = f"✅ ACK by {ack_shortname}"
-                    send_direct_chunks(interface, success_msg, sender_id)
-                    clean_log(f"Relay ACK: {ack_shortname} ({len(packet_ids)} chunks)", "✅")
-                else:
-                    # Timeout or partial ACKs - queue for offline delivery
-                    queued = _queue_offline_relay(sender_id, target_node_id, target_shortname, message)
-                    if queued:
-                        failure_msg = f"❌ No ACK from {target_shortname}\n\n📬 Message queued for delivery when they come online."
-                        clean_log(f"Relay timeout: {target_shortname} - queued for offline delivery", "📬")
-                    else:
-                        failure_msg = f"❌ No ACK from {target_shortname}\n\nMessage: \"{message}\"\n\n⚠️ Offline queue full - message not saved."
-                        clean_log(f"Relay timeout: {target_shortname} - offline queue full", "⚠️")
-                    send_direct_chunks(interface, failure_msg, sender_id)
-
-            except Exception as e:
-                # Unexpected error in worker
-                dprint(f"Relay worker exception: {e}")
-                failure_msg = f"❌ Relay error to {target_shortname}"
-                send_direct_chunks(interface, failure_msg, sender_id)
-
-        except queue.Empty:
-            # Queue empty, loop will continue
-            continue
-        except Exception as e:
-            dprint(f"Relay worker error: {e}")
-        finally:
-            # Mark task as done
-            try:
-                RELAY_QUEUE.task_done()
-            except Exception:
-                pass
+def _relay_no_ack_message(relay_task: Dict[str, Any]) -> str:
+    """Queue an unACKed relay for offline delivery and word the sender's notice."""
+    target_shortname = relay_task['target_shortname']
+    message = relay_task['message']
+    queued = _queue_offline_relay(relay_task['sender_id'], relay_task['target_node_id'], target_shortname, message)
+    if queued:
+        clean_log(f"Relay timeout: {target_shortname} - queued for offline delivery", "📬")
+        return f"❌ No ACK from {target_shortname}\n\n📬 Message queued for delivery when they come online."
+    clean_log(f"Relay timeout: {target_shortname} - offline queue full", "⚠️")
+    return f"❌ No ACK from {target_shortname}\n\nMessage: \"{message}\"\n\n⚠️ Offline queue full - message not saved."
 
 
 def _start_relay_workers():
     """Start relay worker pool (called once at startup)."""
-    global RELAY_WORKERS_STARTED
-    if RELAY_WORKERS_STARTED:
-        return
-
-    for i in range(RELAY_WORKERS_COUNT):
-        worker = threading.Thread(target=_relay_worker, daemon=True, name=f"RelayWorker-{i+1}")
-        worker.start()
-
-    RELAY_WORKERS_STARTED = True
-    clean_log(f"Started {RELAY_WORKERS_COUNT} relay workers", "📨", show_always=False)
+    relay_manager.start_relay_workers(
+        None,
+        split_message,
+        send_direct_chunks,
+        get_node_shortname,
+        same_node_id,
+        clean_log,
+        # The interface global is replaced on reconnect
+        get_interface_func=lambda: interface,
+        record_relay_func=STATS.record_relay,
+        no_ack_message_func=_relay_no_ack_message,
+        debug_log_func=dprint,
+    )
 
 
 def _handle_shortname_relay(
@@ -11456,8 +11294,6 @@ def _handle_shortname_relay(
     message: str
 ) -> Optional[PendingReply]:
     """Handle shortname-first relay: 'snmo hello' -> relay to SnMo with reply option."""
-    sender_short = get_node_shortname(sender_id)
-
     # Check if target has opted out of relay
     if _is_relay_opted_out(target_node_id):
         return PendingReply(
@@ -11465,26 +11301,18 @@ def _handle_shortname_relay(
             "relay opt-out"
         )
 
-    # Ensure relay workers are started
-    _start_relay_workers()
-
-    # Send the relay message to target - no mail system involvement
-    relay_text = f"📨 Relay from {sender_short}:\n{message}\n\n💬 To reply: {sender_short.lower()} <your message>"
-
-    # Add to relay queue (non-blocking with timeout)
-    relay_task = {
-        'sender_id': sender_id,
-        'target_shortname': target_shortname,
-        'target_node_id': target_node_id,
-        'relay_text': relay_text,
-        'message': message
-    }
-
-    try:
-        RELAY_QUEUE.put(relay_task, block=False)
-    except queue.Full:
-        # Queue is full - reject relay
-        return PendingReply(f"⚠️ Relay queue full. Try again in a moment.", "shortname relay")
+    reply = relay_manager.handle_shortname_relay(
+        sender_id,
+        sender_key,
+        target_shortname,
+        target_node_id,
+        message,
+        get_node_shortname,
+        _start_relay_workers,
+    )
+    if reply is not None:
+        # Queue full or a relay to this target already in flight
+        return reply
 
     # Return special PendingReply to indicate relay was queued (prevents "[no response]" log)
     # This is a silent relay confirmation - actual ACK will come async
@@ -12069,42 +11897,11 @@ def get_node_shortname(node_id):
 
 def update_shortname_cache(node_id, shortname=None):
     """Update the shortname-to-node_id cache. Auto-extracts shortname if not provided."""
-    global SHORTNAME_TO_NODE_CACHE
-    if not node_id:
-        return
-
-    # Auto-extract shortname if not provided
-    if shortname is None:
-        shortname = get_node_shortname(node_id)
-
-    # Only cache real shortnames (not "Node_xxx" fallbacks)
-    if shortname and not shortname.startswith("Node_"):
-        with SHORTNAME_CACHE_LOCK:
-            SHORTNAME_TO_NODE_CACHE[shortname.lower()] = str(node_id)
+    relay_manager.update_shortname_cache(node_id, shortname, get_node_shortname)
 
 def get_node_id_from_shortname(shortname):
     """Lookup node_id by shortname (case-insensitive). Returns None if not found."""
-    if not shortname:
-        return None
-
-    # First check cache
-    with SHORTNAME_CACHE_LOCK:
-        cached = SHORTNAME_TO_NODE_CACHE.get(shortname.lower())
-    if cached:
-        return cached
-
-    # Fallback: search interface.nodes directly
-    if interface and hasattr(interface, "nodes"):
-        shortname_lower = shortname.lower()
-        for node_id, node_data in interface.nodes.items():
-            user_dict = node_data.get("user", {})
-            node_short = user_dict.get("shortName", "")
-            if node_short.lower() == shortname_lower:
-                # Cache it for next time
-                update_shortname_cache(node_id, node_short)
-                return str(node_id)
-
-    return None
+    return relay_manager.get_node_id_from_shortname(shortname, interface, update_shortname_cache)
 
 def _to_int_node(x):
   try:
@@ -12916,7 +12713,7 @@ def _activate_find_result(
             store = _get_crawl_store_for_lang(lang_code) or OFFLINE_CRAWL_STORE
             if not store:
                 return PendingReply("⚠️ Offline crawl library unavailable right now.", "/find select")
-            record, suggestions = store.lookup(lookup_key)
+            record, suggestions = store.lookup(lookup_key, fields={"contact_page"})
             if not record:
                 hint = f" Did you mean {suggestions[0]}?" if suggestions else ""
                 return PendingReply(f"⚠️ I couldn't load that crawl.{hint}", "/find select")
@@ -16622,7 +16419,7 @@ def parse_incoming_text(text, sender_id, is_direct, channel_idx, thread_root_ts=
       potential_shortname = words[0]
       target_node_id = get_node_id_from_shortname(potential_shortname)
       dprint(f"[RELAY DEBUG] potential_shortname={potential_shortname}, target_node_id={target_node_id}, sender_id={sender_id}")
-      dprint(f"[RELAY DEBUG] Cache contents: {SHORTNAME_TO_NODE_CACHE}")
+      dprint(f"[RELAY DEBUG] Cache contents: {relay_manager.SHORTNAME_TO_NODE_CACHE}")
       # Only relay if target exists and is NOT the sender (prevent self-relay)
       if target_node_id and not same_node_id(target_node_id, sender_id):
         # Found a match! Relay the message
@@ -17140,15 +16937,7 @@ def on_receive(packet=None, interface=None, **kwargs):
       request_id = decoded.get('requestId') if isinstance(decoded, dict) else None
 
       if request_id:
-        with RELAY_ACK_LOCK:
-          if request_id in PENDING_RELAY_ACKS:
-            # This is an ACK for a relay we're tracking
-            relay_info = PENDING_RELAY_ACKS[request_id]
-            # Convert sender_node to string to avoid unhashable type issues
-            relay_info['ack_node'] = str(sender_node) if sender_node else None
-            ack_event = relay_info.get('ack_event')
-            if ack_event:
-              ack_event.set()  # Signal the waiting relay worker
+        relay_manager.handle_relay_ack(request_id, sender_node)
     except Exception as e:
       dprint(f"Error processing routing packet: {e}")
     return  # Don't process routing packets further
@@ -29474,7 +29263,6 @@ def send_to_telegram(message: str):
     # Send to all authorized chats using synchronous HTTP to avoid event loop issues
     add_script_log(f"TG sending to {len(authorized_ids)} chats (len={len(message)})")
     import threading
-    import requests
 
     def send_sync():
         bot_token = telegram_app.bot.token if telegram_app and telegram_app.bot else ""
@@ -29482,16 +29270,9 @@ def send_to_telegram(message: str):
             clean_log(f"❌ No bot token available", "❌", show_always=True, rate_limit=False)
             return
 
-        url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-
         for chat_id in authorized_ids:
             try:
-                response = requests.post(
-                    url,
-                    json={"chat_id": chat_id, "text": message},
-                    timeout=10
-                )
-                response.raise_for_status()
+                telegram_notify.post_message(chat_id, message).raise_for_status()
                 add_script_log(f"TG sent to {chat_id}")
             except Exception as e:
                 add_script_log(f"TG send failed to {chat_id}: {e}")
@@ -29607,16 +29388,10 @@ if TELEGRAM_AVAILABLE:
                             try:
                                 interface.sendText(message_text, destinationId=target_node_id)
                                 # Send simple confirmation to Telegram
-                                import requests
-                                bot_token = telegram_app.bot.token if telegram_app and telegram_app.bot else ""
-                                url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-                                requests.post(url, json={"chat_id": chat_id, "text": f"📨 Sent to {target_name}"}, timeout=10)
+                                telegram_notify.post_message(chat_id, f"📨 Sent to {target_name}")
                             except Exception as e:
                                 # Send error to Telegram
-                                import requests
-                                bot_token = telegram_app.bot.token if telegram_app and telegram_app.bot else ""
-                                url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-                                requests.post(url, json={"chat_id": chat_id, "text": f"❌ Send failed: {e}"}, timeout=10)
+                                telegram_notify.post_message(chat_id, f"❌ Send failed: {e}")
 
                         # Send in background thread
                         thread = threading.Thread(target=send_dm, daemon=True)
@@ -29654,10 +29429,7 @@ if TELEGRAM_AVAILABLE:
 
                                 # Send via HTTP (sync)
                                 try:
-                                    import requests
-                                    bot_token = telegram_app.bot.token if telegram_app and telegram_app.bot else ""
-                                    url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-                                    requests.post(url, json={"chat_id": chat_id, "text": result_msg}, timeout=10)
+                                    telegram_notify.post_message(chat_id, result_msg)
                                 except Exception as e:
                                     clean_log(f"❌ Channel ack notify failed: {e}", "❌", show_always=True, rate_limit=False)
 
@@ -490,19 +490,22 @@ def format_help_entry(command: str, entry: Dict, include_examples: bool = True)
     return "\n".join(lines)
 
 
+def _build_category_index() -> Dict[str, List[str]]:
+    index: Dict[str, List[str]] = {}
+    for cmd, entry in HELP_DATABASE.items():
+        index.setdefault(entry.get("category", "General"), []).append(cmd)
+    return {category: sorted(commands) for category, commands in sorted(index.items())}
+
+
+# HELP_DATABASE is static, so category -> sorted commands is built once here
+_CATEGORY_INDEX: Dict[str, List[str]] = _build_category_index()
+
+
 def get_all_categories() -> List[str]:
     """Get all unique categories in the help database."""
-    categories = set()
-    for entry in HELP_DATABASE.values():
-        cat = entry.get("category", "General")
-        categories.add(cat)
-    return sorted(categories)
+    return list(_CATEGORY_INDEX)
 
 
 def get_commands_by_category(category: str) -> List[str]:
     """Get all commands in a specific category."""
-    commands = []
-    for cmd, entry in HELP_DATABASE.items():
-        if entry.get("category", "General") == category:
-            commands.append(cmd)
-    return sorted(commands)
+    return list(_CATEGORY_INDEX.get(category, ()))
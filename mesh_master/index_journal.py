@@ -0,0 +1,84 @@
+"""Append-only change log shared by the JSON index stores.
+
+A store keeps its full manifest in ``index.json`` and appends one JSON line
+per put/delete to ``index.log`` beside it, so a change costs a short append
+instead of a full rewrite. Loading replays the log over the manifest; once
+the log grows past a threshold the store rewrites ``index.json`` and the log
+starts over.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+import json
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - orjson is optional; stdlib json is the fallback
+    orjson = None  # type: ignore
+
+JOURNAL_SUFFIX = ".log"
+# Journal lines tolerated before index.json is rewritten (also scales with entry count)
+JOURNAL_COMPACT_MIN = 64
+
+
+class IndexJournal:
+    """The change log beside one ``index.json``. Callers serialize access."""
+
+    def __init__(self, index_file: Path) -> None:
+        self.path = Path(index_file).with_suffix(JOURNAL_SUFFIX)
+        # Ops appended since index.json was last written
+        self.pending = 0
+
+    def read(self) -> Tuple[List[Dict[str, object]], bool]:
+        """Return journal ops and whether the log ended on a complete line."""
+        try:
+            raw = self.path.read_bytes()
+        except FileNotFoundError:
+            return [], True
+        loads = orjson.loads if orjson is not None else json.loads
+        ops: List[Dict[str, object]] = []
+        for line in raw.splitlines():
+            try:
+                op = loads(line)
+            except Exception:
+                # A crash mid-append can leave a torn final line
+                continue
+            if isinstance(op, dict):
+                ops.append(op)
+        return ops, not raw or raw.endswith(b"\n")
+
+    def append(self, ops: List[Dict[str, object]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("ab") as f:
+            f.write(b"".join(_dump_line(op) for op in ops))
+        self.pending += len(ops)
+
+    def needs_compaction(self, entry_count: int) -> bool:
+        return self.pending > max(JOURNAL_COMPACT_MIN, entry_count // 2)
+
+    def clear(self) -> None:
+        """Drop the log once everything in it is folded into index.json."""
+        self.path.unlink(missing_ok=True)
+        self.pending = 0
+
+
+def replay(
+    rows: Dict[str, Dict[str, object]],
+    ops: List[Dict[str, object]],
+    normalize: Callable[[object], str],
+) -> Dict[str, Dict[str, object]]:
+    """Apply journal ``ops`` to manifest ``rows`` (normalized key -> row) in place."""
+    for op in ops:
+        key = normalize(op.get("key"))
+        if op.get("op") == "del":
+            rows.pop(key, None)
+        else:
+            rows[key] = op
+    return rows
+
+
+def _dump_line(payload: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
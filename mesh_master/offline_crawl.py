@@ -1,11 +1,18 @@
 """Offline storage utilities for persisted web crawl results."""
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+import bisect
+import difflib
+import heapq
 import json
+import marshal
+import os
+import sys
 import threading
 
 try:
@@ -14,6 +21,20 @@ except Exception:  # pragma: no cover - fallback for environments without unidec
     def unidecode(value: str) -> str:
         return value
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - orjson is optional; stdlib json is the fallback
+    orjson = None
+
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+except Exception:  # pragma: no cover - rapidfuzz is optional; difflib is the fallback
+    _rf_fuzz = None
+    _rf_process = None
+
+# Alias removals tolerated before _alias_map is copied to shed deleted slots
+_ALIAS_COMPACT_MIN = 1024
+
 
 @dataclass
 class OfflineCrawlRecord:
@@ -43,6 +64,12 @@ class _IndexEntry:
     fetched_at: Optional[str] = None
     aliases: Tuple[str, ...] = field(default_factory=tuple)
     language: Optional[str] = None
+    rel_path: str = ""  # posix path relative to base_dir, computed once
+    title_lower: str = ""  # listing sort key, computed once
+
+    def __post_init__(self) -> None:
+        if not self.title_lower:
+            self.title_lower = self.title.lower()
 
 
 class OfflineCrawlStore:
@@ -51,11 +78,23 @@ class OfflineCrawlStore:
     def __init__(self, index_file: Path, *, base_dir: Optional[Path] = None) -> None:
         self.index_file = Path(index_file)
         self.base_dir = Path(base_dir) if base_dir else self.index_file.parent
+        # Binary sidecar of index.json; index.json stays the exported format.
+        # marshal is used for load speed only: it is not secure against
+        # crafted data, so the sidecar is trusted exactly as far as the
+        # directory holding index.json, and any load error is a cache miss.
+        self.cache_file = self.index_file.with_name(f"{self.index_file.name}.cache")
         self._entries: Dict[str, _IndexEntry] = {}
         self._alias_map: Dict[str, str] = {}
+        self._key_aliases: Dict[str, Set[str]] = {}  # reverse of _alias_map
+        self._alias_removals = 0
+        self._sorted_keys: List[str] = []
+        self._sorted_titles: List[Tuple[str, str]] = []  # (title_lower, key) in listing order
         self._loaded = False
         self._load_error: Optional[str] = None
         self._lock = threading.RLock()
+        self._index_dirty = False
+        self._index_last_bytes: Optional[bytes] = None
+        self._batch_depth = 0
         self._load_index()
 
     # ------------------------------------------------------------------
@@ -67,12 +106,56 @@ class OfflineCrawlStore:
     def error_message(self) -> Optional[str]:
         return self._load_error
 
+    def reload(self) -> None:
+        """Re-read the index from disk, flushing any pending changes first."""
+        with self._lock:
+            self.flush_index()
+            self._loaded = False
+            self._load_index()
+
+    @contextmanager
+    def batch_writes(self) -> Iterator["OfflineCrawlStore"]:
+        """Defer index rewrites until the outermost batch exits.
+
+        Mutations inside the block only mark the index dirty; a single
+        ``flush_index`` runs on exit so bulk imports serialize it once.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.flush_index()
+
+    def flush_index(self) -> bool:
+        """Write pending index changes to disk. Returns True if the file changed."""
+        with self._lock:
+            if not self._index_dirty:
+                return False
+            payload = self._index_payload()
+            data = (json.dumps(payload, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+            self._index_dirty = False
+            if data == self._index_last_bytes:
+                return False
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_file.with_name(f"{self.index_file.name}.tmp")
+            with tmp.open("wb") as f:
+                f.write(data)
+            os.replace(tmp, self.index_file)
+            self._index_last_bytes = data
+            self._write_index_cache(payload, self._index_stamp())
+            return True
+
     def list_entries(self) -> List[Dict[str, object]]:
         entries: List[Dict[str, object]] = []
         with self._lock:
-            if not self._loaded:
-                self._load_index()
-            for key, entry in sorted(self._entries.items(), key=lambda kv: kv[1].title.lower()):
+            fromtimestamp = datetime.fromtimestamp
+            now = datetime.now(tz=timezone.utc)
+            for _, key in self._sorted_titles:
+                entry = self._entries[key]
                 try:
                     st = entry.path.stat()
                     size = int(getattr(st, "st_size", 0))
@@ -80,19 +163,13 @@ class OfflineCrawlStore:
                 except Exception:
                     size = 0
                     mtime = None
-                rel_path = entry.path
-                try:
-                    rel_path = entry.path.relative_to(self.base_dir)
-                except Exception:
-                    rel_path = entry.path
                 mtime_iso = None
                 age_days = None
                 if isinstance(mtime, (int, float)) and mtime > 0:
                     try:
-                        from datetime import datetime as _dt
-                        mdt = _dt.utcfromtimestamp(mtime).replace(tzinfo=timezone.utc)
+                        mdt = fromtimestamp(mtime, tz=timezone.utc)
                         mtime_iso = mdt.isoformat()
-                        age_days = int(max(0, (_dt.now(tz=timezone.utc) - mdt).days))
+                        age_days = int(max(0, (now - mdt).days))
                     except Exception:
                         mtime_iso, age_days = None, None
                 entries.append(
@@ -104,7 +181,7 @@ class OfflineCrawlStore:
                         "fetched_at": entry.fetched_at or "",
                         "language": entry.language or "",
                         "aliases": list(entry.aliases) if entry.aliases else [],
-                        "path": rel_path.as_posix(),
+                        "path": entry.rel_path,
                         "size_bytes": size,
                         "mtime_iso": mtime_iso,
                         "age_days": age_days,
@@ -112,13 +189,22 @@ class OfflineCrawlStore:
                 )
         return entries
 
-    def lookup(self, identifier: str) -> Tuple[Optional[OfflineCrawlRecord], List[str]]:
+    def lookup(
+        self,
+        identifier: str,
+        *,
+        fields: Optional[Set[str]] = None,
+    ) -> Tuple[Optional[OfflineCrawlRecord], List[str]]:
+        """Resolve a crawl by title, key, or alias.
+
+        ``fields`` names the heavy payload fields to materialize (``pages``,
+        ``contacts``, ``contact_page``); the rest are left empty. ``None``
+        loads everything.
+        """
         normalized = _normalize(identifier)
         if not normalized:
             return None, []
         with self._lock:
-            if not self._loaded:
-                self._load_index()
             key = self._resolve_key(normalized)
             matched_alias = None
             if key is None:
@@ -130,7 +216,7 @@ class OfflineCrawlStore:
             if not entry:
                 suggestions = self._suggest(normalized)
                 return None, suggestions
-            record = self._load_record(entry)
+            record = self._load_record(entry, fields=fields)
             if not record:
                 suggestions = self._suggest(normalized)
                 return None, suggestions
@@ -142,8 +228,6 @@ class OfflineCrawlStore:
         if not normalized:
             return False
         with self._lock:
-            if not self._loaded:
-                self._load_index()
             key = self._resolve_key(normalized) or normalized
             entry = self._entries.get(key)
             if not entry:
@@ -153,7 +237,8 @@ class OfflineCrawlStore:
             except Exception:
                 pass
             self._entries.pop(key, None)
-            self._alias_map = {a: tgt for a, tgt in self._alias_map.items() if tgt != key}
+            self._unindex_entry(entry)
+            self._drop_aliases(key)
             self._write_index()
             self._load_error = None
             return True
@@ -161,8 +246,6 @@ class OfflineCrawlStore:
     def prune_by_max(self, max_entries: int) -> Dict[str, int]:
         max_entries = max(0, int(max_entries))
         with self._lock:
-            if not self._loaded:
-                self._load_index()
             items = list(self._entries.items())
             before = len(items)
             if before <= max_entries:
@@ -176,17 +259,19 @@ class OfflineCrawlStore:
                     mtime = 0
                 return (mtime, entry.path.as_posix())
 
-            items.sort(key=sort_key)
             to_remove = before - max_entries
+            # Usually only one or two entries go, so avoid sorting the whole archive
+            victims = heapq.nsmallest(to_remove, items, key=sort_key)
             removed = 0
-            for key, entry in items[:to_remove]:
+            for key, entry in victims:
                 try:
                     entry.path.unlink(missing_ok=True)
                 except Exception:
                     pass
                 self._entries.pop(key, None)
+                self._unindex_entry(entry)
+                self._drop_aliases(key)
                 removed += 1
-            self._alias_map = {a: tgt for a, tgt in self._alias_map.items() if tgt in self._entries}
             self._write_index()
             after = len(self._entries)
             return {"before": before, "removed": removed, "after": after}
@@ -226,28 +311,36 @@ class OfflineCrawlStore:
             "contacts": contacts or [],
             "contact_page": contact_page,
         }
+        # Dedupe raw aliases first so repeated crawl URLs are transliterated once
+        alias_set = {alias for alias in (aliases or []) if alias}
+        normalized_aliases = tuple(
+            _intern(alias) for alias in {_normalize(a) for a in alias_set} if alias and alias != normalized_title
+        )
+        key = _intern(_normalize(f"{title} {fetched_iso}"))
         with self._lock:
             with target.open("w", encoding="utf-8") as f:
                 json.dump(payload, f, indent=2, ensure_ascii=False)
                 f.write("\n")
-            alias_list = [alias for alias in (aliases or []) if alias]
-            normalized_aliases = tuple({alias for alias in (_normalize(a) for a in alias_list) if alias and alias != normalized_title})
-            key = _normalize(f"{title} {fetched_iso}")
             entry = _IndexEntry(
                 key=key,
                 title=title,
                 path=target,
                 summary=summary,
-                source=source,
+                source=_intern(source),
                 fetched_at=fetched_iso,
                 aliases=normalized_aliases,
-                language=language,
+                language=_intern(language),
+                rel_path=rel_path.as_posix(),
             )
+            existing = self._entries.get(key)
+            if existing is not None:
+                self._unindex_entry(existing)
             self._entries[key] = entry
+            self._index_entry(entry)
             for alias in normalized_aliases:
-                self._alias_map[alias] = key
-            self._alias_map[normalized_title] = key
-            self._alias_map[_normalize(rel_path.stem)] = key
+                self._add_alias(alias, key)
+            self._add_alias(_intern(normalized_title), key)
+            self._add_alias(_intern(_normalize(rel_path.stem)), key)
             self._write_index()
             self._load_error = None
             return {"key": key, "slug": rel_path.stem}
@@ -263,6 +356,32 @@ class OfflineCrawlStore:
             return alias_target
         return None
 
+    def _add_alias(self, alias: str, key: str) -> None:
+        previous = self._alias_map.get(alias)
+        if previous is not None and previous != key:
+            self._key_aliases.get(previous, set()).discard(alias)
+        self._alias_map[alias] = key
+        self._key_aliases.setdefault(key, set()).add(alias)
+
+    def _drop_aliases(self, key: str) -> None:
+        for alias in self._key_aliases.pop(key, ()):
+            if self._alias_map.get(alias) == key:
+                del self._alias_map[alias]
+                self._alias_removals += 1
+        # Deleted dict slots linger until a resize; copy once churn outweighs
+        # the live aliases so lookups keep probing a dense table.
+        if self._alias_removals > max(_ALIAS_COMPACT_MIN, len(self._alias_map)):
+            self._alias_map = dict(self._alias_map)
+            self._alias_removals = 0
+
+    def _index_entry(self, entry: _IndexEntry) -> None:
+        bisect.insort(self._sorted_keys, entry.key)
+        bisect.insort(self._sorted_titles, (entry.title_lower, entry.key))
+
+    def _unindex_entry(self, entry: _IndexEntry) -> None:
+        _remove_sorted(self._sorted_keys, entry.key)
+        _remove_sorted(self._sorted_titles, (entry.title_lower, entry.key))
+
     def _load_index(self) -> None:
         if self._loaded:
             return
@@ -270,20 +389,33 @@ class OfflineCrawlStore:
             if not self.index_file.is_file():
                 self._entries.clear()
                 self._alias_map.clear()
+                self._key_aliases.clear()
+                self._sorted_keys = []
+                self._sorted_titles = []
                 self._loaded = True
                 self._load_error = "Index missing"
                 return
-            with self.index_file.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            stamp = self._index_stamp()
+            data = self._read_index_cache(stamp)
+            if data is None:
+                with self.index_file.open("r", encoding="utf-8") as f:
+                    data = json.load(f)
+                self._write_index_cache(data, stamp)
         except FileNotFoundError:
             self._entries.clear()
             self._alias_map.clear()
+            self._key_aliases.clear()
+            self._sorted_keys = []
+            self._sorted_titles = []
             self._loaded = True
             self._load_error = "Index missing"
             return
         except Exception as exc:
             self._entries.clear()
             self._alias_map.clear()
+            self._key_aliases.clear()
+            self._sorted_keys = []
+            self._sorted_titles = []
             self._loaded = True
             self._load_error = f"Failed to load index: {exc}"
             return
@@ -294,14 +426,14 @@ class OfflineCrawlStore:
         for entry in entries_raw or []:
             if not isinstance(entry, dict):
                 continue
-            key = _normalize(entry.get("key"))
+            key = _intern(_normalize(entry.get("key")))
             title = entry.get("title") or ""
             path_raw = entry.get("path") or ""
             summary = entry.get("summary") or ""
-            source = entry.get("source") or None
+            source = _intern(entry.get("source") or None)
             fetched_at = entry.get("fetched_at") or None
             aliases = entry.get("aliases") or []
-            language = entry.get("language") or None
+            language = _intern(entry.get("language") or None)
             if not key or not title or not path_raw:
                 continue
             path = self.base_dir / Path(path_raw)
@@ -312,34 +444,78 @@ class OfflineCrawlStore:
                 summary=summary,
                 source=source,
                 fetched_at=fetched_at,
-                aliases=tuple(_normalize(alias) for alias in aliases if alias),
+                aliases=tuple(_intern(_normalize(alias)) for alias in aliases if alias),
                 language=language,
+                rel_path=Path(path_raw).as_posix(),
             )
             entries[key] = idx_entry
-            alias_map[_normalize(title)] = key
+            alias_map[_intern(_normalize(title))] = key
             for alias in idx_entry.aliases:
                 if alias:
                     alias_map[alias] = key
             if source:
-                alias_map[_normalize(source)] = key
+                alias_map[_intern(_normalize(source))] = key
+        key_aliases: Dict[str, Set[str]] = {}
+        for alias, target in alias_map.items():
+            key_aliases.setdefault(target, set()).add(alias)
         self._entries = entries
         self._alias_map = alias_map
+        self._key_aliases = key_aliases
+        self._alias_removals = 0
+        self._sorted_keys = sorted(entries)
+        self._sorted_titles = sorted((entry.title_lower, key) for key, entry in entries.items())
         self._loaded = True
         self._load_error = None if entries else "Index has no entries"
 
     def _write_index(self) -> None:
+        self._index_dirty = True
+        if self._batch_depth == 0:
+            self.flush_index()
+
+    def _index_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = self.index_file.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _read_index_cache(self, stamp: Optional[Tuple[int, int]]) -> Optional[Dict[str, object]]:
+        """Return the cached manifest if it was built from exactly this index.json.
+
+        An mtime ordering check is not enough: cp -p, rsync -a and tar install
+        an index whose mtime is older than an existing cache.
+        """
+        if stamp is None:
+            return None
+        try:
+            cached = marshal.loads(self.cache_file.read_bytes())
+        except Exception:
+            return None
+        if not isinstance(cached, dict) or tuple(cached.get("stamp") or ()) != stamp:
+            return None
+        data = cached.get("data")
+        return data if isinstance(data, dict) else None
+
+    def _write_index_cache(self, payload: object, stamp: Optional[Tuple[int, int]]) -> None:
+        if stamp is None:
+            return
+        try:
+            tmp = self.cache_file.with_name(f"{self.cache_file.name}.tmp")
+            with tmp.open("wb") as f:
+                f.write(marshal.dumps({"stamp": stamp, "data": payload}))
+            os.replace(tmp, self.cache_file)
+        except Exception:
+            pass
+
+    def _index_payload(self) -> Dict[str, object]:
         entries = []
-        for entry in sorted(self._entries.values(), key=lambda e: e.title.lower()):
-            rel_path = entry.path
-            try:
-                rel_path = entry.path.relative_to(self.base_dir)
-            except Exception:
-                rel_path = entry.path
+        for _, key in self._sorted_titles:
+            entry = self._entries[key]
             entries.append(
                 {
                     "key": entry.key,
                     "title": entry.title,
-                    "path": rel_path.as_posix(),
+                    "path": entry.rel_path,
                     "summary": entry.summary,
                     "source": entry.source,
                     "fetched_at": entry.fetched_at,
@@ -347,18 +523,20 @@ class OfflineCrawlStore:
                     "aliases": [alias for alias in entry.aliases if alias],
                 }
             )
-        payload = {"entries": entries}
-        self.index_file.parent.mkdir(parents=True, exist_ok=True)
-        with self.index_file.open("w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False)
-            f.write("\n")
+        return {"entries": entries}
 
-    def _load_record(self, entry: _IndexEntry) -> Optional[OfflineCrawlRecord]:
+    def _load_record(
+        self,
+        entry: _IndexEntry,
+        *,
+        fields: Optional[Set[str]] = None,
+    ) -> Optional[OfflineCrawlRecord]:
         try:
-            with entry.path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_json(entry.path)
         except Exception:
             return None
+        if not isinstance(data, dict):
+            return None
         title = data.get("title") or entry.title
         summary = data.get("summary") or entry.summary or ""
         context = data.get("context") or ""
@@ -367,9 +545,9 @@ class OfflineCrawlStore:
         source = data.get("source") or entry.source
         fetched_at = data.get("fetched_at") or entry.fetched_at
         language = data.get("language") or entry.language
-        pages = data.get("pages") or []
-        contacts = data.get("contacts") or []
-        contact_page = data.get("contact_page") or None
+        pages = data.get("pages") if fields is None or "pages" in fields else None
+        contacts = data.get("contacts") if fields is None or "contacts" in fields else None
+        contact_page = data.get("contact_page") if fields is None or "contact_page" in fields else None
         return OfflineCrawlRecord(
             title=title,
             summary=summary,
@@ -385,14 +563,23 @@ class OfflineCrawlStore:
     def _suggest(self, normalized: str) -> List[str]:
         if not self._entries:
             return []
-        keys = list(self._entries.keys())
-        import difflib
-
-        close_matches = difflib.get_close_matches(normalized, keys, n=5, cutoff=0.6)
+        keys = self._sorted_keys
+        if _rf_process is not None:
+            matches = _rf_process.extract(normalized, keys, scorer=_rf_fuzz.WRatio, limit=5, score_cutoff=60)
+            close_matches = [match[0] for match in matches]
+        else:
+            close_matches = difflib.get_close_matches(normalized, keys, n=5, cutoff=0.6)
         titles = [self._entries[k].title for k in close_matches]
         if titles:
             return titles
-        prefix_matches = [entry.title for entry in self._entries.values() if entry.key.startswith(normalized[:4])][:5]
+        # Keys are kept sorted, so prefix matches form one contiguous run
+        prefix = normalized[:4]
+        prefix_matches: List[str] = []
+        for pos in range(bisect.bisect_left(keys, prefix), len(keys)):
+            key = keys[pos]
+            if not key.startswith(prefix) or len(prefix_matches) >= 5:
+                break
+            prefix_matches.append(self._entries[key].title)
         return prefix_matches
 
 
@@ -403,6 +590,17 @@ def _normalize(value: Optional[str]) -> str:
     return " ".join(lowered.split())
 
 
+def _remove_sorted(items: List, value: object) -> None:
+    pos = bisect.bisect_left(items, value)
+    if pos < len(items) and items[pos] == value:
+        del items[pos]
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Share one copy of strings repeated across entries (sources, languages, aliases)."""
+    return sys.intern(str(value)) if value else value
+
+
 def _slugify(value: str) -> str:
     slug = unidecode(value or "").lower()
     slug = slug.replace("'", "")
@@ -414,6 +612,13 @@ def _slugify(value: str) -> str:
     return slug or "crawl"
 
 
+def _read_json(path: Path) -> object:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 def _isoformat(value: datetime) -> str:
     if value.tzinfo is None:
         value = value.replace(tzinfo=timezone.utc)
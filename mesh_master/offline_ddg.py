@@ -1,12 +1,25 @@
 """Offline storage utilities for DuckDuckGo search snapshots."""
 from __future__ import annotations
 
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+import bisect
+import functools
 import json
+import mmap
+import os
+import re
+import sqlite3
+import sys
 import threading
+import time
+
+from .index_journal import IndexJournal, replay
 
 try:
     from unidecode import unidecode
@@ -14,6 +27,39 @@ except Exception:  # pragma: no cover
     def unidecode(value: str) -> str:  # type: ignore
         return value
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - orjson is optional; stdlib json is the fallback
+    orjson = None  # type: ignore
+
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+except Exception:  # pragma: no cover - rapidfuzz is optional; difflib is the fallback
+    _rf_fuzz = None  # type: ignore
+    _rf_process = None  # type: ignore
+
+# difflib is only needed on the suggestion miss path without rapidfuzz; import it once on demand
+_difflib = None
+
+
+def _get_difflib():
+    global _difflib
+    if _difflib is None:
+        import difflib as _d
+
+        _difflib = _d
+    return _difflib
+
+# Seconds a record file's size/mtime is reused before it is stat'ed again
+_STAT_TTL = 5.0
+# Prunes removing at least this many files unlink them from a small thread pool
+_PARALLEL_UNLINK_MIN = 16
+_UNLINK_WORKERS = 8
+# Smaller files are cheaper to read() than to map
+_MMAP_MIN_BYTES = 16 * 1024
+# Parsed record payloads kept in memory per store
+_RECORD_CACHE_SIZE = 256
+
 
 @dataclass
 class OfflineDDGRecord:
@@ -41,19 +87,88 @@ class _IndexEntry:
     fetched_at: Optional[str] = None
     aliases: Tuple[str, ...] = field(default_factory=tuple)
     language: Optional[str] = None
+    # (size, mtime, cached_at) from the last stat of ``path``
+    _stat_cache: Optional[Tuple[int, Optional[float], float]] = field(default=None, repr=False, compare=False)
+
+
+class _RWLock:
+    """Shared/exclusive lock: many readers or one writer, waiting writers go first.
+
+    Not re-entrant; internal helpers must not take it again.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        with self._cond:
+            self._writers_waiting += 1
+            try:
+                while self._writer or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
 
 
 class OfflineDDGStore:
-    """Manages on-disk DDG query archives under a simple index manifest."""
+    """Manages on-disk DDG query archives under a simple index manifest.
+
+    Record payloads live in one JSON file per query by default. With
+    ``use_sqlite`` they are kept as blobs in a single ``records.sqlite3``
+    archive instead; legacy JSON files are still read and migrated on access.
+    """
 
-    def __init__(self, index_file: Path, *, base_dir: Optional[Path] = None) -> None:
+    def __init__(self, index_file: Path, *, base_dir: Optional[Path] = None, use_sqlite: bool = False) -> None:
         self.index_file = Path(index_file)
         self.base_dir = Path(base_dir) if base_dir else self.index_file.parent
+        self.archive_file = self.base_dir / "records.sqlite3"
+        # Record paths are built as base_dir / rel, so a text prefix strip recovers rel
+        base_posix = self.base_dir.as_posix()
+        self._base_posix = "" if base_posix == "." else base_posix.rstrip("/") + "/"
+        self._db: Optional[sqlite3.Connection] = self._open_archive() if use_sqlite else None
+        # Append-only log of index changes since index.json was last written
+        self._journal = IndexJournal(self.index_file)
+        self.journal_file = self._journal.path
         self._entries: Dict[str, _IndexEntry] = {}
         self._alias_map: Dict[str, str] = {}
+        self._key_aliases: Dict[str, Set[str]] = {}  # reverse of _alias_map
+        self._sorted_keys: List[str] = []
+        self._title_order: List[Tuple[str, str]] = []  # (title_lower, key) in listing order
+        # path -> (version, parsed payload), least recently used first
+        self._record_cache: "OrderedDict[str, Tuple[object, Dict[str, object]]]" = OrderedDict()
         self._loaded = False
         self._load_error: Optional[str] = None
-        self._lock = threading.RLock()
+        # Lookups and listings share the index; store/delete/prune take it exclusively
+        self._lock = _RWLock()
+        # Guards _record_cache, _unmigrated and the SQLite connection, which readers also touch
+        self._record_lock = threading.Lock()
+        # Legacy JSON record files read under the shared lock, awaiting a move into the archive
+        self._unmigrated: Set[Path] = set()
         self._load_index()
 
     # ------------------------------------------------------------------
@@ -67,22 +182,17 @@ class OfflineDDGStore:
 
     def list_entries(self) -> List[Dict[str, object]]:
         entries: List[Dict[str, object]] = []
-        with self._lock:
-            if not self._loaded:
-                self._load_index()
-            for key, entry in sorted(self._entries.items(), key=lambda kv: kv[1].title.lower()):
-                try:
-                    st = entry.path.stat()
-                    size = int(getattr(st, "st_size", 0))
-                    mtime = getattr(st, "st_mtime", None)
-                except Exception:
-                    size = 0
-                    mtime = None
-                rel_path = entry.path
-                try:
-                    rel_path = entry.path.relative_to(self.base_dir)
-                except Exception:
-                    rel_path = entry.path
+        with self._lock.read():
+            archived = self._archive_stats()
+            now = time.monotonic()
+            scan = None
+            if archived is None and any(_stat_stale(entry, now) for entry in self._entries.values()):
+                scan = self._scan_base_dir()
+            for _, key in self._title_order:
+                entry = self._entries[key]
+                rel_path = self._rel_posix(entry.path)
+                stat = archived.get(rel_path) if archived else None
+                size, mtime = stat if stat is not None else _cached_stat(entry, scan=scan)
                 mtime_iso = None
                 age_days = None
                 if isinstance(mtime, (int, float)) and mtime > 0:
@@ -102,7 +212,7 @@ class OfflineDDGStore:
                         "fetched_at": entry.fetched_at or "",
                         "language": entry.language or "",
                         "aliases": list(entry.aliases) if entry.aliases else [],
-                        "path": rel_path.as_posix(),
+                        "path": rel_path,
                         "size_bytes": size,
                         "mtime_iso": mtime_iso,
                         "age_days": age_days,
@@ -114,9 +224,14 @@ class OfflineDDGStore:
         normalized = _normalize(identifier)
         if not normalized:
             return None, []
-        with self._lock:
-            if not self._loaded:
-                self._load_index()
+        try:
+            return self._lookup(normalized)
+        finally:
+            if self._unmigrated:
+                self._migrate_records()
+
+    def _lookup(self, normalized: str) -> Tuple[Optional[OfflineDDGRecord], List[str]]:
+        with self._lock.read():
             key = self._resolve_key(normalized)
             matched_alias = None
             if key is None:
@@ -139,53 +254,50 @@ class OfflineDDGStore:
         normalized = _normalize(identifier)
         if not normalized:
             return False
-        with self._lock:
-            if not self._loaded:
-                self._load_index()
+        with self._lock.write():
             key = self._resolve_key(normalized) or normalized
             entry = self._entries.get(key)
             if not entry:
                 return False
-            try:
-                entry.path.unlink(missing_ok=True)
-            except Exception:
-                pass
+            self._drop_records([entry.path])
             self._entries.pop(key, None)
-            self._alias_map = {a: tgt for a, tgt in self._alias_map.items() if tgt != key}
-            self._write_index()
+            _remove_sorted(self._sorted_keys, key)
+            _remove_sorted(self._title_order, (entry.title.lower(), key))
+            self._drop_aliases(key)
+            self._append_journal([{"op": "del", "key": key}])
             self._load_error = None
             return True
 
     def prune_by_max(self, max_entries: int) -> Dict[str, int]:
         max_entries = max(0, int(max_entries))
-        with self._lock:
-            if not self._loaded:
-                self._load_index()
+        with self._lock.write():
             items = list(self._entries.items())
             before = len(items)
             if before <= max_entries:
                 return {"before": before, "removed": 0, "after": before}
 
+            archived = self._archive_stats()
+
             def sort_key(kv: Tuple[str, _IndexEntry]):
                 entry = kv[1]
-                try:
-                    mtime = entry.path.stat().st_mtime
-                except Exception:
-                    mtime = 0
-                return (mtime, entry.path.as_posix())
+                stat = archived.get(self._archive_key(entry.path)) if archived else None
+                mtime = stat[1] if stat is not None else _cached_stat(entry)[1]
+                return (mtime or 0, entry.path.as_posix())
 
             items.sort(key=sort_key)
             to_remove = before - max_entries
+            victims = items[:to_remove]
+            self._drop_records([entry.path for _, entry in victims])
             removed = 0
-            for key, entry in items[:to_remove]:
-                try:
-                    entry.path.unlink(missing_ok=True)
-                except Exception:
-                    pass
+            ops = []
+            for key, entry in victims:
                 self._entries.pop(key, None)
+                _remove_sorted(self._sorted_keys, key)
+                _remove_sorted(self._title_order, (entry.title.lower(), key))
+                self._drop_aliases(key)
+                ops.append({"op": "del", "key": key})
                 removed += 1
-            self._alias_map = {a: tgt for a, tgt in self._alias_map.items() if tgt in self._entries}
-            self._write_index()
+            self._append_journal(ops)
             after = len(self._entries)
             return {"before": before, "removed": removed, "after": after}
 
@@ -210,7 +322,6 @@ class OfflineDDGStore:
         slug = _slugify(slug_source)
         rel_path = Path(f"{slug}.json")
         target = self.base_dir / rel_path
-        target.parent.mkdir(parents=True, exist_ok=True)
         payload = {
             "query": query,
             "title": query,
@@ -221,10 +332,8 @@ class OfflineDDGStore:
             "fetched_at": fetched_iso,
             "language": language,
         }
-        with self._lock:
-            with target.open("w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2, ensure_ascii=False)
-                f.write("\n")
+        with self._lock.write():
+            self._put_record(target, _dump_json(payload))
             alias_list = [alias for alias in (aliases or []) if alias]
             normalized_aliases = tuple({alias for alias in (_normalize(a) for a in alias_list) if alias})
             key = _normalize(f"{query} {fetched_iso}")
@@ -239,11 +348,17 @@ class OfflineDDGStore:
                 aliases=normalized_aliases,
                 language=language,
             )
+            existing = self._entries.get(key)
+            if existing is None:
+                bisect.insort(self._sorted_keys, key)
+            else:
+                _remove_sorted(self._title_order, (existing.title.lower(), key))
+            bisect.insort(self._title_order, (entry.title.lower(), key))
             self._entries[key] = entry
             for alias in normalized_aliases:
-                self._alias_map[alias] = key
-            self._alias_map[normalized_query] = key
-            self._write_index()
+                self._add_alias(alias, key)
+            self._add_alias(normalized_query, key)
+            self._append_journal([dict(self._entry_row(entry), op="put")])
             self._load_error = None
             return {"key": key, "slug": rel_path.stem}
 
@@ -258,13 +373,28 @@ class OfflineDDGStore:
             return alias_target
         return None
 
+    def _add_alias(self, alias: str, key: str) -> None:
+        previous = self._alias_map.get(alias)
+        if previous is not None and previous != key:
+            self._key_aliases.get(previous, set()).discard(alias)
+        self._alias_map[alias] = key
+        self._key_aliases.setdefault(key, set()).add(alias)
+
+    def _drop_aliases(self, key: str) -> None:
+        for alias in self._key_aliases.pop(key, ()):
+            if self._alias_map.get(alias) == key:
+                del self._alias_map[alias]
+
     def _load_index(self) -> None:
         if self._loaded:
             return
         try:
-            if not self.index_file.is_file():
+            if not self.index_file.is_file() and not self.journal_file.is_file():
                 self._entries.clear()
                 self._alias_map.clear()
+                self._key_aliases.clear()
+                self._sorted_keys = []
+                self._title_order = []
                 self._loaded = True
                 self._load_error = None
                 try:
@@ -272,11 +402,14 @@ class OfflineDDGStore:
                 except Exception:
                     pass
                 return
-            with self.index_file.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _read_json(self.index_file) if self.index_file.is_file() else {}
+            journal, journal_clean = self._journal.read()
         except FileNotFoundError:
             self._entries.clear()
             self._alias_map.clear()
+            self._key_aliases.clear()
+            self._sorted_keys = []
+            self._title_order = []
             self._loaded = True
             self._load_error = None
             try:
@@ -287,80 +420,84 @@ class OfflineDDGStore:
         except Exception as exc:
             self._entries.clear()
             self._alias_map.clear()
+            self._key_aliases.clear()
+            self._sorted_keys = []
+            self._title_order = []
             self._loaded = True
             self._load_error = f"Failed to load index: {exc}"
             return
 
         entries_raw = data.get("entries") if isinstance(data, dict) else []
+        rows: Dict[str, Dict[str, object]] = {}
+        for row in entries_raw or []:
+            if isinstance(row, dict):
+                rows[_normalize(row.get("key"))] = row
+        replay(rows, journal, _normalize)
         entries: Dict[str, _IndexEntry] = {}
-        alias_map: Dict[str, str] = {}
-        for entry in entries_raw or []:
-            if not isinstance(entry, dict):
-                continue
-            key = _normalize(entry.get("key"))
-            query = entry.get("query") or entry.get("title") or ""
-            path_raw = entry.get("path") or ""
-            summary = entry.get("summary") or ""
-            source = entry.get("source") or None
-            fetched_at = entry.get("fetched_at") or None
-            aliases = entry.get("aliases") or []
-            language = entry.get("language") or None
-            if not key or not path_raw:
+        self._alias_map = {}
+        self._key_aliases = {}
+        base_dir = self.base_dir
+        for key, row in rows.items():
+            idx_entry = _entry_from_row(key, row, base_dir)
+            if idx_entry is None:
                 continue
-            path = self.base_dir / Path(path_raw)
-            idx_entry = _IndexEntry(
-                key=key,
-                query=query,
-                title=entry.get("title") or query,
-                path=path,
-                summary=summary,
-                source=source,
-                fetched_at=fetched_at,
-                aliases=tuple(_normalize(alias) for alias in aliases if alias),
-                language=language,
-            )
             entries[key] = idx_entry
-            alias_map[_normalize(query)] = key
+            self._add_alias(_normalize(idx_entry.query), key)
             for alias in idx_entry.aliases:
                 if alias:
-                    alias_map[alias] = key
+                    self._add_alias(alias, key)
         self._entries = entries
-        self._alias_map = alias_map
+        self._sorted_keys = sorted(entries)
+        self._title_order = sorted((entry.title.lower(), key) for key, entry in entries.items())
+        self._journal.pending = len(journal)
         self._loaded = True
         self._load_error = None if entries else "Index has no entries"
-
-    def _write_index(self) -> None:
-        entries = []
-        for entry in sorted(self._entries.values(), key=lambda e: e.title.lower()):
-            rel_path = entry.path
+        if not journal_clean:
+            # Fold the log now so new appends don't land on a torn line
             try:
-                rel_path = entry.path.relative_to(self.base_dir)
+                self._write_index()
             except Exception:
-                rel_path = entry.path
-            entries.append(
-                {
-                    "key": entry.key,
-                    "query": entry.query,
-                    "title": entry.title,
-                    "path": rel_path.as_posix(),
-                    "summary": entry.summary,
-                    "source": entry.source,
-                    "fetched_at": entry.fetched_at,
-                    "language": entry.language,
-                    "aliases": [alias for alias in entry.aliases if alias],
-                }
-            )
+                pass
+
+    def _scan_base_dir(self) -> Dict[str, os.DirEntry]:
+        """One readdir of the archive dir; DirEntry caches each file's stat."""
+        try:
+            with os.scandir(self.base_dir) as it:
+                return {de.path: de for de in it}
+        except OSError:
+            return {}
+
+    def _append_journal(self, ops: List[Dict[str, object]]) -> None:
+        """Record index changes without rewriting index.json; compact when the log grows."""
+        if not ops:
+            return
+        self._journal.append(ops)
+        if self._journal.needs_compaction(len(self._entries)):
+            self._write_index()
+
+    def _entry_row(self, entry: _IndexEntry) -> Dict[str, object]:
+        return {
+            "key": entry.key,
+            "query": entry.query,
+            "title": entry.title,
+            "path": self._rel_posix(entry.path),
+            "summary": entry.summary,
+            "source": entry.source,
+            "fetched_at": entry.fetched_at,
+            "language": entry.language,
+            "aliases": [alias for alias in entry.aliases if alias],
+        }
+
+    def _write_index(self) -> None:
+        entries = [self._entry_row(self._entries[key]) for _, key in self._title_order]
         payload = {"entries": entries}
-        self.index_file.parent.mkdir(parents=True, exist_ok=True)
-        with self.index_file.open("w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False)
-            f.write("\n")
+        _write_atomic(self.index_file, _dump_json(payload))
+        # Everything in the journal is now folded into index.json
+        self._journal.clear()
 
     def _load_record(self, entry: _IndexEntry) -> Optional[OfflineDDGRecord]:
-        try:
-            with entry.path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-        except Exception:
+        data = self._read_record_data(entry.path)
+        if data is None:
             return None
         query = data.get("query") or entry.query
         title = data.get("title") or query
@@ -375,44 +512,312 @@ class OfflineDDGStore:
             title=title,
             summary=summary,
             context=context,
-            results=list(results) if isinstance(results, list) else [],
+            # Result dicts are copied so callers can't edit the cached payload
+            results=[dict(item) if isinstance(item, dict) else item for item in results]
+            if isinstance(results, list) else [],
             source=source,
             fetched_at=fetched_at,
             language=language,
         )
 
+    def _read_record_data(self, path: Path) -> Optional[Dict[str, object]]:
+        """Return a record payload, reusing the parsed copy while the record is unchanged.
+
+        The result is a shallow copy; the cached payload itself never leaves
+        the store.
+        """
+        cache_key = str(path)
+        if self._db is not None:
+            archive_key = self._archive_key(path)
+            with self._record_lock:
+                row = self._db.execute("SELECT mtime FROM records WHERE path = ?", (archive_key,)).fetchone()
+                if row is None:
+                    blob = None
+                else:
+                    cached = self._record_cache.get(cache_key)
+                    if cached is not None and cached[0] == row[0]:
+                        self._record_cache.move_to_end(cache_key)
+                        return dict(cached[1])
+                    blob = self._db.execute("SELECT payload FROM records WHERE path = ?", (archive_key,)).fetchone()
+            if row is None:
+                return self._read_legacy_record(path)
+            try:
+                data = _loads(bytes(blob[0])) if blob else None
+            except Exception:
+                return None
+            return self._remember_record(cache_key, row[0], data)
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except Exception:
+            with self._record_lock:
+                self._record_cache.pop(cache_key, None)
+            return None
+        with self._record_lock:
+            cached = self._record_cache.get(cache_key)
+            if cached is not None and cached[0] == mtime_ns:
+                self._record_cache.move_to_end(cache_key)
+                return dict(cached[1])
+        try:
+            data = _read_json(path)
+        except Exception:
+            return None
+        return self._remember_record(cache_key, mtime_ns, data)
+
+    def _remember_record(self, cache_key: str, version: object, data: object) -> Optional[Dict[str, object]]:
+        if not isinstance(data, dict):
+            return None
+        with self._record_lock:
+            self._record_cache[cache_key] = (version, data)
+            self._record_cache.move_to_end(cache_key)
+            while len(self._record_cache) > _RECORD_CACHE_SIZE:
+                self._record_cache.popitem(last=False)
+        return dict(data)
+
+    # ------------------------------------------------------------------
+    # Record storage (JSON files or the SQLite archive)
+    # ------------------------------------------------------------------
+    def _open_archive(self) -> Optional[sqlite3.Connection]:
+        try:
+            self.base_dir.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(self.archive_file), check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                "path TEXT PRIMARY KEY, payload BLOB NOT NULL, mtime REAL NOT NULL)"
+            )
+            db.commit()
+            return db
+        except Exception:
+            # Fall back to per-file records rather than losing the store
+            return None
+
+    def _archive_key(self, path: Path) -> str:
+        return self._rel_posix(path)
+
+    def _rel_posix(self, path: Path) -> str:
+        text = path.as_posix()
+        prefix = self._base_posix
+        return text[len(prefix):] if text.startswith(prefix) else text
+
+    def _put_record(self, path: Path, data: bytes, mtime: Optional[float] = None) -> None:
+        if self._db is None:
+            _write_atomic(path, data)
+            return
+        with self._record_lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO records (path, payload, mtime) VALUES (?, ?, ?)",
+                (self._archive_key(path), data, time.time() if mtime is None else mtime),
+            )
+
+    def _drop_records(self, paths: List[Path]) -> None:
+        with self._record_lock:
+            for path in paths:
+                self._record_cache.pop(str(path), None)
+            if self._db is not None:
+                with self._db:
+                    self._db.executemany("DELETE FROM records WHERE path = ?", [(self._archive_key(p),) for p in paths])
+        # Also unlink record files (the only copy in file mode, legacy leftovers otherwise)
+        if len(paths) >= _PARALLEL_UNLINK_MIN:
+            # Large prunes overlap the unlink syscalls; small ones aren't worth a pool
+            with ThreadPoolExecutor(max_workers=_UNLINK_WORKERS) as pool:
+                list(pool.map(_unlink_quietly, paths))
+        else:
+            for path in paths:
+                _unlink_quietly(path)
+
+    def _archive_stats(self) -> Optional[Dict[str, Tuple[int, float]]]:
+        """Map archive keys to (size, mtime), or None when records are plain files."""
+        if self._db is None:
+            return None
+        with self._record_lock:
+            rows = self._db.execute("SELECT path, length(payload), mtime FROM records").fetchall()
+        return {path: (int(size or 0), mtime) for path, size, mtime in rows}
+
+    def _read_legacy_record(self, path: Path) -> Optional[Dict[str, object]]:
+        """Read a pre-archive JSON record file and queue it for migration.
+
+        Runs under the shared lock, so the file is only read here; moving it
+        into the archive happens in ``_migrate_records`` under the write lock.
+        """
+        try:
+            raw = path.read_bytes()
+            mtime = path.stat().st_mtime
+            data = _loads(raw)
+        except Exception:
+            return None
+        if not isinstance(data, dict):
+            return None
+        with self._record_lock:
+            self._unmigrated.add(path)
+        return self._remember_record(str(path), mtime, data)
+
+    def _migrate_records(self) -> None:
+        """Move queued legacy JSON record files into the SQLite archive."""
+        with self._lock.write():
+            with self._record_lock:
+                paths, self._unmigrated = self._unmigrated, set()
+            for path in paths:
+                try:
+                    raw = path.read_bytes()
+                    mtime = path.stat().st_mtime
+                except Exception:
+                    continue  # Deleted or already migrated
+                try:
+                    # Same mtime as the cached copy, so the cache entry stays valid
+                    self._put_record(path, raw, mtime=mtime)
+                    _unlink_quietly(path)
+                except Exception:
+                    pass
+
     def _suggest(self, normalized: str) -> List[str]:
         if not self._entries:
             return []
-        keys = list(self._entries.keys())
-        import difflib
-
-        close_matches = difflib.get_close_matches(normalized, keys, n=5, cutoff=0.6)
+        keys = self._sorted_keys
+        if _rf_process is not None:
+            matches = _rf_process.extract(normalized, keys, scorer=_rf_fuzz.WRatio, limit=5, score_cutoff=60)
+            close_matches = [match[0] for match in matches]
+        else:
+            close_matches = _get_difflib().get_close_matches(normalized, keys, n=5, cutoff=0.6)
         titles = [self._entries[k].title for k in close_matches]
         if titles:
             return titles
-        prefix_matches = [entry.title for entry in self._entries.values() if entry.key.startswith(normalized[:4])][:5]
+        # Keys are kept sorted, so prefix matches form one contiguous run
+        prefix = normalized[:4]
+        prefix_matches: List[str] = []
+        for pos in range(bisect.bisect_left(keys, prefix), len(keys)):
+            key = keys[pos]
+            if not key.startswith(prefix) or len(prefix_matches) >= 5:
+                break
+            prefix_matches.append(self._entries[key].title)
         return prefix_matches
 
 
+def _remove_sorted(items: List, value: object) -> None:
+    pos = bisect.bisect_left(items, value)
+    if pos < len(items) and items[pos] == value:
+        del items[pos]
+
+
+def _entry_from_row(key: str, row: Dict[str, object], base_dir: Path) -> Optional[_IndexEntry]:
+    """Build an index entry from a manifest/journal row, or None if it is unusable."""
+    path_raw = row.get("path")
+    if not key or not path_raw:
+        return None
+    query = row.get("query") or row.get("title") or ""
+    aliases = row.get("aliases") or []
+    return _IndexEntry(
+        key=key,
+        query=query,
+        title=row.get("title") or query,
+        path=base_dir / path_raw,
+        summary=row.get("summary") or "",
+        source=row.get("source") or None,
+        fetched_at=row.get("fetched_at") or None,
+        aliases=tuple(_normalize(alias) for alias in aliases if alias),
+        language=row.get("language") or None,
+    )
+
+
+def _unlink_quietly(path: Path) -> None:
+    try:
+        path.unlink(missing_ok=True)
+    except Exception:
+        pass
+
+
+def _stat_stale(entry: _IndexEntry, now: float, ttl: float = _STAT_TTL) -> bool:
+    cached = entry._stat_cache
+    return cached is None or now - cached[2] >= ttl
+
+
+def _cached_stat(
+    entry: _IndexEntry,
+    ttl: float = _STAT_TTL,
+    *,
+    scan: Optional[Dict[str, os.DirEntry]] = None,
+) -> Tuple[int, Optional[float]]:
+    """Return (size, mtime) for an entry's record file, reusing a recent stat.
+
+    ``scan`` maps paths to ``os.DirEntry`` objects from a directory scan;
+    files found there are stat'ed through the entry instead of by path.
+    """
+    now = time.monotonic()
+    cached = entry._stat_cache
+    if cached is not None and now - cached[2] < ttl:
+        return cached[0], cached[1]
+    try:
+        dir_entry = scan.get(str(entry.path)) if scan else None
+        st = dir_entry.stat() if dir_entry is not None else entry.path.stat()
+        size = int(getattr(st, "st_size", 0))
+        mtime = getattr(st, "st_mtime", None)
+    except Exception:
+        size = 0
+        mtime = None
+    entry._stat_cache = (size, mtime, now)
+    return size, mtime
+
+
 def _normalize(value: Optional[str]) -> str:
     if not value:
         return ""
-    lowered = unidecode(str(value)).lower()
-    return " ".join(lowered.split())
+    return _normalize_text(value if isinstance(value, str) else str(value))
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_text(value: str) -> str:
+    # Interned so keys/aliases repeated across the index and lookups share one object.
+    # unidecode is the identity on ASCII, so most queries skip it entirely.
+    lowered = value.lower() if value.isascii() else unidecode(value).lower()
+    return sys.intern(" ".join(lowered.split()))
+
+
+# Quotes vanish; every other non-alphanumeric ASCII character becomes a dash
+_SLUG_TABLE = {code: (None if chr(code) in "'\"" else "-") for code in range(128) if not chr(code).isalnum()}
+_SLUG_DASHES = re.compile(r"-+")
 
 
 def _slugify(value: str) -> str:
-    slug = unidecode(value or "").lower()
-    slug = slug.replace("'", "")
-    slug = slug.replace("\"", "")
-    slug = slug.replace("/", " ")
-    slug = slug.replace("\\", " ")
-    slug = "".join(ch if ch.isalnum() else "-" for ch in slug)
-    slug = "-".join(part for part in slug.split('-') if part)
+    slug = unidecode(value or "").lower().translate(_SLUG_TABLE)
+    if not slug.isascii():
+        # Only reachable without unidecode; keep the Unicode-aware rule
+        slug = "".join(ch if ch.isalnum() else "-" for ch in slug)
+    slug = _SLUG_DASHES.sub("-", slug).strip("-")
     return slug or "search"
 
 
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.tmp")
+    with tmp.open("wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _read_json(path: Path) -> object:
+    if orjson is None:
+        return _loads(path.read_bytes())
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+            return orjson.loads(f.read())
+        # orjson parses straight from the mapped pages, skipping the read() copy
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def _loads(data: bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_json(payload: object) -> bytes:
+    """Serialize as indented UTF-8 JSON with a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(payload, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
 def _isoformat(value: datetime) -> str:
     if value.tzinfo is None:
         value = value.replace(tzinfo=timezone.utc)
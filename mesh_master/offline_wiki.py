@@ -28,15 +28,25 @@ optional ``summary`` override and ``source`` string can also be provided.
 
 Large deployments can shard the content into multiple subdirectories so long as
 ``path`` points to the correct relative location.  Everything is read lazily, so
-only the metadata lives in memory.
+only the metadata lives in memory.  Very large indexes may instead be written
+as ``index.jsonl`` with one entry object per line; they are parsed line by line
+rather than as one document, and a truncated last line is skipped.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 import difflib
+import functools
+import heapq
 import json
+import marshal
+import mmap
+import os
+import re
+import sys
 import threading
 
 try:
@@ -45,6 +55,23 @@ except Exception:  # pragma: no cover - unidecode is part of the runtime deps
     def unidecode(value: str) -> str:
         return value
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - orjson is optional; stdlib json is the fallback
+    orjson = None  # type: ignore
+
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+except Exception:  # pragma: no cover - rapidfuzz is optional; difflib is the fallback
+    _rf_fuzz = None  # type: ignore
+    _rf_process = None  # type: ignore
+
+# Smaller article files are cheaper to read() than to map
+_MMAP_MIN_BYTES = 16 * 1024
+# Suggestions only score keys sharing the most trigrams with the query
+_SUGGEST_CANDIDATES = 64
+_TRIGRAM_MIN_SCORE = 0.2
+
 
 @dataclass
 class OfflineWikiArticle:
@@ -57,29 +84,61 @@ class OfflineWikiArticle:
     matched_alias: Optional[str] = None
 
 
-@dataclass
+# dataclass(slots=...) needs Python 3.10; older interpreters keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class _IndexEntry:
-    """Metadata stored in memory for quick lookups."""
+    """Metadata stored in memory for quick lookups.
+
+    Immutable: updates build a replacement entry.
+    """
 
     key: str
     title: str
     path: Path
     summary: Optional[str] = None
     aliases: Tuple[str, ...] = field(default_factory=tuple)
+    rel_path: str = ""  # posix path relative to base_dir, as stored in the index
+    title_lower: str = ""  # listing sort key, computed once
+
+    def __post_init__(self) -> None:
+        if not self.title_lower:
+            object.__setattr__(self, "title_lower", self.title.lower())
 
 
 class OfflineWikiStore:
     """Loads the offline index and resolves topics on demand."""
 
-    def __init__(self, index_file: Path, *, base_dir: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        index_file: Path,
+        *,
+        base_dir: Optional[Path] = None,
+    ) -> None:
         self.index_file = Path(index_file)
         self.base_dir = Path(base_dir) if base_dir else self.index_file.parent
+        # Parsed index kept in marshal form; reused only while the index's
+        # (mtime_ns, size) still matches the stamp stored with it
+        self.cache_file = self.index_file.with_name(f"{self.index_file.name}.cache")
         self._entries: Dict[str, _IndexEntry] = {}
         self._alias_map: Dict[str, str] = {}
+        self._key_aliases: Dict[str, Set[str]] = {}  # reverse of _alias_map
+        # Canonical keys and aliases -> entry, so a lookup resolves in one probe
+        self._lookup: Dict[str, _IndexEntry] = {}
+        self._trigram_index: Dict[str, Set[str]] = {}  # trigram -> canonical keys
+        # Bumped on every index change; lock-free readers use it to spot stale snapshots
+        self._version = 0
+        self._suggest_keys: Optional[Tuple[int, Tuple[str, ...]]] = None  # (version, keys)
+        # list_entries() snapshot, valid while (index mtime, entry count) is unchanged
+        self._list_cache: Optional[List[Dict[str, object]]] = None
+        self._list_cache_key: Optional[Tuple[Optional[float], int]] = None
         self._loaded = False
         self._load_error: Optional[str] = None
         self._index_mtime: Optional[float] = None
-        self._lock = threading.RLock()
+        # Serializes mutations and index writes; lookup() reads without it
+        self._lock = threading.Lock()
         # Eagerly load metadata so we can report readiness immediately
         self._load_index()
 
@@ -104,27 +163,27 @@ class OfflineWikiStore:
         with self._lock:
             if not self._loaded:
                 self._load_index()
-            for key, entry in sorted(self._entries.items(), key=lambda kv: kv[1].title.lower()):
+            cache_key = (self._index_mtime, len(self._entries))
+            if self._list_cache is not None and self._list_cache_key == cache_key:
+                return [dict(item) for item in self._list_cache]
+            now = datetime.now(tz=timezone.utc)
+            scan = self._scan_base_dir()
+            for key, entry in sorted(self._entries.items(), key=lambda kv: kv[1].title_lower):
                 try:
-                    st = entry.path.stat()
+                    dir_entry = scan.get(str(entry.path))
+                    st = dir_entry.stat() if dir_entry is not None else entry.path.stat()
                     size = int(getattr(st, "st_size", 0))
                     mtime = getattr(st, "st_mtime", None)
                 except Exception:
                     size = 0
                     mtime = None
-                rel_path = entry.path
-                try:
-                    rel_path = entry.path.relative_to(self.base_dir)
-                except Exception:
-                    rel_path = entry.path
                 mtime_iso = None
                 age_days = None
                 if isinstance(mtime, (int, float)) and mtime > 0:
                     try:
-                        import datetime as _dt
-                        mdt = _dt.datetime.utcfromtimestamp(mtime).replace(tzinfo=_dt.timezone.utc)
+                        mdt = datetime.fromtimestamp(mtime, tz=timezone.utc)
                         mtime_iso = mdt.isoformat()
-                        age_days = int(max(0, (_dt.datetime.now(tz=_dt.timezone.utc) - mdt).days))
+                        age_days = int(max(0, (now - mdt).days))
                     except Exception:
                         mtime_iso, age_days = None, None
                 entries.append(
@@ -133,13 +192,15 @@ class OfflineWikiStore:
                         "title": entry.title,
                         "summary": entry.summary or "",
                         "aliases": list(entry.aliases) if entry.aliases else [],
-                        "path": rel_path.as_posix(),
+                        "path": entry.rel_path,
                         "size_bytes": size,
                         "mtime_iso": mtime_iso,
                         "age_days": age_days,
                     }
                 )
-        return entries
+            self._list_cache = entries
+            self._list_cache_key = cache_key
+        return [dict(item) for item in entries]
 
     def lookup(
         self,
@@ -154,39 +215,30 @@ class OfflineWikiStore:
         if not normalized:
             return None, []
 
-        with self._lock:
-            if not self._loaded:
-                self._load_index()
-
-            key = self._resolve_key(normalized)
-            matched_alias = None
-            if key is None:
-                suggestions = self._suggest(normalized)
-                return None, suggestions
-
-            if key != normalized:
-                matched_alias = normalized
-
-            entry = self._entries.get(key)
-            if not entry:
-                suggestions = self._suggest(normalized)
-                return None, suggestions
-
-            article = self._load_article(entry)
-            if not article:
-                suggestions = self._suggest(normalized)
-                return None, suggestions
-
-            summary = article.summary or entry.summary or _fallback_summary(article.content, summary_limit)
-            summary = _clip(summary, summary_limit)
-            content = _clip(article.content, max(2000, context_limit))
-            return OfflineWikiArticle(
-                title=article.title or entry.title,
-                summary=summary,
-                content=content,
-                source=article.source,
-                matched_alias=matched_alias,
-            ), []
+        # Lock-free: writers only swap or update single dict slots, which the
+        # GIL makes atomic, so a reader sees either the old or the new entry.
+        entry = self._lookup.get(normalized)
+        if entry is None:
+            suggestions = self._suggest(normalized)
+            return None, suggestions
+
+        matched_alias = normalized if entry.key != normalized else None
+
+        article = self._load_article(entry)
+        if not article:
+            suggestions = self._suggest(normalized)
+            return None, suggestions
+
+        summary = article.summary or entry.summary or _fallback_summary(article.content, summary_limit)
+        summary = _clip(summary, summary_limit)
+        content = _clip(article.content, max(2000, context_limit))
+        return OfflineWikiArticle(
+            title=article.title or entry.title,
+            summary=summary,
+            content=content,
+            source=article.source,
+            matched_alias=matched_alias,
+        ), []
 
     def delete(self, title_or_key: str) -> bool:
         """Delete an article from disk and remove from the index.
@@ -217,8 +269,10 @@ class OfflineWikiStore:
                 pass
             # Remove entry and its aliases
             self._entries.pop(key, None)
-            # Rebuild alias map excluding any alias pointing to the removed key
-            self._alias_map = {a: tgt for a, tgt in self._alias_map.items() if tgt != key}
+            self._unindex_trigrams(key)
+            self._drop_aliases(key)
+            self._unlink_entry(entry)
+            self._invalidate_views()
             self._write_index()
             self._load_error = None
             return True
@@ -236,27 +290,34 @@ class OfflineWikiStore:
             before = len(items)
             if before <= max_articles:
                 return {"before": before, "removed": 0, "after": before}
-            # Sort by mtime (oldest first); fallback to path name for stability
+            # Oldest by mtime first; fallback to path name for stability
+            scan = self._scan_base_dir()
+
             def sort_key(kv: Tuple[str, _IndexEntry]):
                 entry = kv[1]
                 try:
-                    mtime = entry.path.stat().st_mtime
+                    dir_entry = scan.get(str(entry.path))
+                    st = dir_entry.stat() if dir_entry is not None else entry.path.stat()
+                    mtime = st.st_mtime
                 except Exception:
                     mtime = 0
                 return (mtime, entry.path.as_posix())
 
-            items.sort(key=sort_key)
             to_remove = before - max_articles
+            # Partial selection: O(N log R) instead of sorting every entry
+            victims = heapq.nsmallest(to_remove, items, key=sort_key)
             removed = 0
-            for key, entry in items[:to_remove]:
+            for key, entry in victims:
                 try:
                     entry.path.unlink(missing_ok=True)
                 except Exception:
                     pass
                 self._entries.pop(key, None)
+                self._unindex_trigrams(key)
+                self._drop_aliases(key)
+                self._unlink_entry(entry)
                 removed += 1
-            # Rebuild alias map
-            self._alias_map = {a: tgt for a, tgt in self._alias_map.items() if tgt in self._entries}
+            self._invalidate_views()
             self._write_index()
             after = len(self._entries)
             return {"before": before, "removed": removed, "after": after}
@@ -298,10 +359,14 @@ class OfflineWikiStore:
                     path=existing.path,
                     summary=existing.summary,
                     aliases=existing.aliases + new_aliases,
+                    rel_path=existing.rel_path,
+                    title_lower=existing.title_lower,
                 )
                 self._entries[normalized] = updated_entry
+                self._invalidate_views()
                 for alias in new_aliases:
-                    self._alias_map[alias] = normalized
+                    self._add_alias(alias, normalized)
+                self._link_entry(updated_entry, replaces=existing)
                 self._write_index()
                 self._load_error = None
                 return True
@@ -316,9 +381,8 @@ class OfflineWikiStore:
             }
             if source:
                 payload["source"] = source
-            with target.open("w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2, ensure_ascii=False)
-                f.write("\n")
+            # Atomic, since lookup reads articles without the lock
+            _write_atomic(target, _dump_json(payload))
 
             entry = _IndexEntry(
                 key=normalized,
@@ -326,11 +390,16 @@ class OfflineWikiStore:
                 path=target,
                 summary=summary_clipped,
                 aliases=tuple(alias for alias in normalized_aliases if alias and alias != normalized),
+                rel_path=rel_path.as_posix(),
             )
             self._entries[normalized] = entry
+            if existing is None:
+                self._index_trigrams(normalized)
+            self._invalidate_views()
             for alias in entry.aliases:
                 if alias:
-                    self._alias_map[alias] = normalized
+                    self._add_alias(alias, normalized)
+            self._link_entry(entry, replaces=existing)
             self._write_index()
             self._load_error = None
             return True
@@ -338,13 +407,64 @@ class OfflineWikiStore:
     # ------------------------------------------------------------------
     # Internals
     # ------------------------------------------------------------------
+    def _scan_base_dir(self) -> Dict[str, os.DirEntry]:
+        """One readdir of the article dir; DirEntry caches each file's stat.
+
+        Articles sharded into subdirectories are not listed and fall back to
+        a per-path stat.
+        """
+        try:
+            with os.scandir(self.base_dir) as it:
+                return {de.path: de for de in it}
+        except OSError:
+            return {}
+
+    def _invalidate_views(self) -> None:
+        self._version += 1
+        self._suggest_keys = None
+        self._list_cache = None
+
     def _resolve_key(self, normalized: str) -> Optional[str]:
-        if normalized in self._entries:
-            return normalized
-        alias_target = self._alias_map.get(normalized)
-        if alias_target:
-            return alias_target
-        return None
+        entry = self._lookup.get(normalized)
+        return entry.key if entry else None
+
+    def _add_alias(self, alias: str, key: str) -> None:
+        previous = self._alias_map.get(alias)
+        if previous is not None and previous != key:
+            self._key_aliases.get(previous, set()).discard(alias)
+        self._alias_map[alias] = key
+        self._key_aliases.setdefault(key, set()).add(alias)
+
+    def _drop_aliases(self, key: str) -> None:
+        for alias in self._key_aliases.pop(key, ()):
+            if self._alias_map.get(alias) == key:
+                del self._alias_map[alias]
+                if alias not in self._entries:
+                    self._lookup.pop(alias, None)
+
+    def _rebuild_lookup(self) -> None:
+        lookup = {alias: self._entries[key] for alias, key in self._alias_map.items() if key in self._entries}
+        # Canonical keys win over aliases of other entries
+        lookup.update(self._entries)
+        self._lookup = lookup
+
+    def _link_entry(self, entry: _IndexEntry, *, replaces: Optional[_IndexEntry] = None) -> None:
+        """Point the entry's key and aliases at it in the lookup table."""
+        self._lookup[entry.key] = entry
+        # Aliases of a replaced entry keep resolving to its key, as before
+        aliases = entry.aliases + replaces.aliases if replaces is not None else entry.aliases
+        for alias in aliases:
+            if alias and alias not in self._entries and self._alias_map.get(alias) == entry.key:
+                self._lookup[alias] = entry
+
+    def _unlink_entry(self, entry: _IndexEntry) -> None:
+        # Aliases are already gone via _drop_aliases; only the key remains
+        if self._lookup.get(entry.key) is entry:
+            del self._lookup[entry.key]
+        # The removed key may still be another entry's alias
+        target = self._entries.get(self._alias_map.get(entry.key, ""))
+        if target is not None:
+            self._lookup[entry.key] = target
 
     def _load_index(self) -> None:
         """Load metadata from the index file, reloading if the file changed."""
@@ -367,17 +487,31 @@ class OfflineWikiStore:
             if not self.index_file.is_file():
                 self._load_error = f"Offline wiki index missing: {self.index_file}"
                 self._entries.clear()
+                self._invalidate_views()
                 self._alias_map.clear()
+                self._key_aliases.clear()
+                self._lookup.clear()
+                self._trigram_index.clear()
                 self._index_mtime = None
                 self._loaded = True
                 return
 
-            with self.index_file.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            stamp = self._index_stamp()
+            data = self._read_index_cache(stamp)
+            if data is None:
+                if self.index_file.suffix == ".jsonl":
+                    data = {"entries": list(_iter_jsonl(self.index_file))}
+                else:
+                    data = _read_json(self.index_file)
+                self._write_index_cache(data, stamp)
         except Exception as exc:  # pragma: no cover - file system failures
             self._load_error = f"Failed to load offline wiki index: {exc}"
             self._entries.clear()
+            self._invalidate_views()
             self._alias_map.clear()
+            self._key_aliases.clear()
+            self._lookup.clear()
+            self._trigram_index.clear()
             self._index_mtime = None
             self._loaded = True
             return
@@ -386,13 +520,18 @@ class OfflineWikiStore:
         if not isinstance(entries, list):
             self._load_error = "Offline wiki index is malformed (expected entries array)."
             self._entries.clear()
+            self._invalidate_views()
             self._alias_map.clear()
+            self._key_aliases.clear()
+            self._lookup.clear()
+            self._trigram_index.clear()
             self._index_mtime = current_mtime
             self._loaded = True
             return
 
         temp_entries: Dict[str, _IndexEntry] = {}
         temp_alias_map: Dict[str, str] = {}
+        temp_key_aliases: Dict[str, Set[str]] = {}
         for raw in entries:
             if not isinstance(raw, dict):
                 continue
@@ -407,27 +546,66 @@ class OfflineWikiStore:
                 path=self.base_dir / path_value,
                 summary=str(raw.get("summary") or "").strip() or None,
                 aliases=tuple(_normalize(alias) for alias in raw.get("aliases", []) if isinstance(alias, str)),
+                rel_path=Path(path_value).as_posix(),
             )
             temp_entries[key] = entry
             for alias in entry.aliases:
                 if alias and alias not in temp_alias_map:
                     temp_alias_map[alias] = key
+                    temp_key_aliases.setdefault(key, set()).add(alias)
 
         self._entries = temp_entries
+        trigram_index: Dict[str, Set[str]] = {}
+        for key in temp_entries:
+            for tri in _trigrams(key):
+                trigram_index.setdefault(tri, set()).add(key)
+        self._trigram_index = trigram_index
         self._alias_map = temp_alias_map
+        self._key_aliases = temp_key_aliases
+        self._rebuild_lookup()
+        self._invalidate_views()
         self._load_error = None
         self._index_mtime = current_mtime
         self._loaded = True
 
-    def _load_article(self, entry: _IndexEntry) -> Optional[OfflineWikiArticle]:
+    def _index_stamp(self) -> Optional[Tuple[int, int]]:
         try:
-            with entry.path.open("r", encoding="utf-8") as f:
-                payload = json.load(f)
-        except FileNotFoundError:
-            self._load_error = f"Offline wiki content missing: {entry.path}"
+            st = self.index_file.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _read_index_cache(self, stamp: Optional[Tuple[int, int]]) -> Optional[Dict[str, object]]:
+        """Return the cached index if it was built from exactly this index file.
+
+        Comparing mtimes by order is not enough: cp -p, rsync -a and tar all
+        install an index with an older mtime than an existing cache.
+        """
+        if stamp is None:
+            return None
+        try:
+            cached = marshal.loads(self.cache_file.read_bytes())
+        except Exception:
             return None
-        except Exception as exc:  # pragma: no cover - JSON parsing errors
-            self._load_error = f"Offline wiki content unreadable ({entry.path}): {exc}"
+        if not isinstance(cached, dict) or tuple(cached.get("stamp") or ()) != stamp:
+            return None
+        data = cached.get("data")
+        return data if isinstance(data, dict) else None
+
+    def _write_index_cache(self, payload: object, stamp: Optional[Tuple[int, int]]) -> None:
+        if stamp is None:
+            return
+        try:
+            _write_atomic(self.cache_file, marshal.dumps({"stamp": stamp, "data": payload}))
+        except Exception:
+            pass
+
+    def _load_article(self, entry: _IndexEntry) -> Optional[OfflineWikiArticle]:
+        # Called without the lock, so a missing or unreadable article is just
+        # a miss for this lookup; it must not flip the whole store's state
+        try:
+            payload = _read_json(entry.path)
+        except Exception:
             return None
 
         if isinstance(payload, dict):
@@ -439,36 +617,78 @@ class OfflineWikiStore:
                 return OfflineWikiArticle(title=title, summary=summary, content=content, source=source)
         return None
 
+    def _index_trigrams(self, key: str) -> None:
+        for tri in _trigrams(key):
+            self._trigram_index.setdefault(tri, set()).add(key)
+
+    def _unindex_trigrams(self, key: str) -> None:
+        for tri in _trigrams(key):
+            keys = self._trigram_index.get(tri)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._trigram_index[tri]
+
+    def _trigram_candidates(self, normalized: str) -> List[str]:
+        """Keys sharing the most trigrams with ``normalized``, best first."""
+        index = self._trigram_index
+        counts: Dict[str, int] = {}
+        for tri in _trigrams(normalized):
+            # tuple() snapshots the posting set in one C call; writers may be mid-update
+            for key in tuple(index.get(tri, ())):
+                counts[key] = counts.get(key, 0) + 1
+        return heapq.nlargest(_SUGGEST_CANDIDATES, counts, key=counts.__getitem__)
+
     def _suggest(self, normalized: str) -> List[str]:
         if not self._entries:
             return []
-        keys = list(self._entries.keys())
-        close_matches = difflib.get_close_matches(normalized, keys, n=5, cutoff=0.6)
-        titles = [self._entries[k].title for k in close_matches]
+        entries = self._entries
+        candidates = self._trigram_candidates(normalized)
+        if _rf_process is not None:
+            cached = self._suggest_keys
+            version = self._version
+            if cached is not None and cached[0] == version:
+                keys = cached[1]
+            else:
+                # tuple() copies the dict in one C call, so concurrent writers can't break it
+                keys = tuple(entries)
+                self._suggest_keys = (version, keys)
+            matches = _rf_process.extract(normalized, keys, scorer=_rf_fuzz.WRatio, limit=5, score_cutoff=60)
+            close_matches = [match[0] for match in matches]
+        else:
+            # SequenceMatcher is pure Python; only run it on trigram candidates
+            close_matches = difflib.get_close_matches(normalized, candidates, n=5, cutoff=0.6)
+        titles = [entries[k].title for k in close_matches if k in entries]
         if titles:
             return titles
-        # Fall back to prefix matches for looser suggestions
-        prefix_matches = [entry.title for entry in self._entries.values() if entry.key.startswith(normalized[:4])][:5]
-        return prefix_matches
+        # Looser fallback: best trigram overlap, wherever in the topic the typo sits
+        query = _trigrams(normalized)
+        scored = []
+        for key in candidates:
+            grams = _trigrams(key)
+            score = len(query & grams) / len(query | grams)
+            if score >= _TRIGRAM_MIN_SCORE:
+                scored.append((score, key))
+        return [entries[k].title for _, k in heapq.nlargest(5, scored) if k in entries]
 
     def _write_index(self) -> None:
-        entries = []
-        for entry in sorted(self._entries.values(), key=lambda e: e.title.lower()):
-            rel_path = entry.path.relative_to(self.base_dir)
-            entries.append(
-                {
-                    "key": entry.key,
-                    "title": entry.title,
-                    "path": rel_path.as_posix(),
-                    "summary": entry.summary,
-                    "aliases": [alias for alias in entry.aliases if alias],
-                }
-            )
-        payload = {"entries": entries}
-        self.index_file.parent.mkdir(parents=True, exist_ok=True)
-        with self.index_file.open("w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False)
-            f.write("\n")
+        entries = [
+            {
+                "key": entry.key,
+                "title": entry.title,
+                "path": entry.rel_path,
+                "summary": entry.summary,
+                "aliases": [alias for alias in entry.aliases if alias],
+            }
+            for entry in sorted(self._entries.values(), key=lambda e: e.title_lower)
+        ]
+        if self.index_file.suffix == ".jsonl":
+            data = b"".join(_dump_json_line(row) for row in entries)
+        else:
+            data = _dump_json({"entries": entries})
+        # Readers (and other processes) never see a half-written index
+        _write_atomic(self.index_file, data)
+        self._write_index_cache({"entries": entries}, self._index_stamp())
         try:
             self._index_mtime = self.index_file.stat().st_mtime
         except Exception:
@@ -478,26 +698,110 @@ class OfflineWikiStore:
 def _normalize(value: Optional[str]) -> str:
     if not value:
         return ""
-    lowered = unidecode(str(value)).lower()
-    return " ".join(lowered.split())
+    return _normalize_text(value if isinstance(value, str) else str(value))
+
+
+_intern = sys.intern
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_text(value: str) -> str:
+    # Topics and aliases recur across lookups, so results are memoized (bounded
+    # at 4096 strings). unidecode passes every code point below 0x80 through
+    # unchanged, so skipping it for ASCII input cannot change the result.
+    # Results are interned so keys and aliases repeated across entries, the
+    # lookup tables and incoming queries share one object and compare by identity.
+    if value.isascii():
+        # Quick check (inlined, it runs on every miss): stored keys and aliases
+        # are usually already lowercase, printable, single-spaced and trimmed
+        if value.islower() and value.isprintable() and "  " not in value and value[0] != " " and value[-1] != " ":
+            return _intern(value)
+        lowered = value.lower()
+    else:
+        lowered = unidecode(value).lower()
+    # split()/join() beats re.sub(r"\s+") ~3x on topic-length strings
+    return _intern(" ".join(lowered.split()))
+
+
+# Quotes vanish; every other non-alphanumeric ASCII character becomes a dash
+_SLUG_TABLE = {code: (None if chr(code) in "'\"" else "-") for code in range(128) if not chr(code).isalnum()}
+_SLUG_DASHES = re.compile(r"-+")
 
 
 def _slugify(value: str) -> str:
-    slug = unidecode(value or "").lower()
-    slug = slug.replace("'", "")
-    slug = slug.replace("\"", "")
-    slug = slug.replace("/", " ")
-    slug = slug.replace("\\", " ")
-    slug = "".join(ch if ch.isalnum() else "-" for ch in slug)
-    slug = "-".join(part for part in slug.split('-') if part)
+    slug = unidecode(value or "").lower().translate(_SLUG_TABLE)
+    if not slug.isascii():
+        # Only reachable without unidecode; keep the Unicode-aware rule
+        slug = "".join(ch if ch.isalnum() else "-" for ch in slug)
+    slug = _SLUG_DASHES.sub("-", slug).strip("-")
     return slug or "article"
 
 
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.tmp")
+    with tmp.open("wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _trigrams(value: str) -> Set[str]:
+    # Padded so short keys and word edges still produce trigrams
+    padded = f"  {value} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _read_json(path: Path) -> object:
+    if orjson is None:
+        return json.loads(path.read_bytes())
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+            return orjson.loads(f.read())
+        # orjson parses straight from the mapped pages, skipping the read() copy
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def _iter_jsonl(path: Path) -> Iterator[object]:
+    """Yield one parsed object per line, skipping blank or unparseable lines."""
+    loads = orjson.loads if orjson is not None else json.loads
+    with path.open("rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield loads(line)
+            except ValueError:
+                continue
+
+
+def _dump_json_line(payload: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _dump_json(payload: object) -> bytes:
+    """Serialize as indented UTF-8 JSON with a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(payload, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+_ELLIPSIS = "…"
+
+
 def _clip(text: str, limit: int) -> str:
-    limit = max(1, int(limit))
+    if type(limit) is not int:
+        limit = int(limit)
+    # Most calls fit already; only clamp the limit when a clip is actually needed
+    if len(text) <= limit:
+        return text
+    limit = max(1, limit)
     if len(text) <= limit:
         return text
-    return text[: limit - 1].rstrip() + "…"
+    return text[: limit - 1].rstrip() + _ELLIPSIS
 
 
 def _fallback_summary(content: str, limit: int) -> str:
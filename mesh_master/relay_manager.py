@@ -7,30 +7,279 @@ ACKs from all chunks and provides real-time confirmation.
 
 Features:
 - Multi-chunk message support with per-chunk ACK tracking
-- Queue-based architecture (3 workers, 100-item queue)
+- Queue-based architecture (2-12 adaptive workers, 100-item queue)
 - 20-second ACK timeout
 - Thread-safe shortname cache
 - Cross-network bridge capabilities
 """
 
+import itertools
+import os
 import queue
 import threading
 import time
-from typing import Any, Dict, Optional
+from collections import deque
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    from mesh_master.telegram_notify import send_telegram_notification as _send_tg
+except Exception:  # pragma: no cover - Telegram support is optional
+    _send_tg = None
+
+
+class RelayRing:
+    """Bounded multi-producer/multi-consumer FIFO for relay tasks.
+
+    ``deque.append``/``popleft`` are atomic under the GIL, so the non-empty
+    paths take no lock; an Event only parks consumers when the ring is empty.
+    The bound is checked without a lock and may overshoot by a few items
+    under concurrent puts, which is fine for back-pressure.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._items: deque = deque()
+        self._ready = threading.Event()
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def put(self, item, block: bool = False, force: bool = False) -> None:
+        """Append ``item``; raises ``queue.Full`` at capacity (never blocks).
+
+        ``force`` skips the capacity check, for control sentinels.
+        """
+        if not force and len(self._items) >= self.maxsize:
+            raise queue.Full
+        self._items.append(item)
+        self._ready.set()
+
+    def get(self, timeout: Optional[float] = None):
+        """Pop the oldest item, waiting up to ``timeout`` seconds (None = forever)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self._items.popleft()
+            except IndexError:
+                pass
+            self._ready.clear()
+            if self._items:
+                # A put raced with the clear; retry before sleeping
+                continue
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise queue.Empty
+            self._ready.wait(remaining)
+
+    def drain(self, max_items: int, stop: Any = None) -> List[Any]:
+        """Pop up to ``max_items`` more items without waiting.
+
+        Draining ends at the first ``stop`` item, which is left at the head
+        of the ring for the next ``get``.
+        """
+        batch = []
+        popleft = self._items.popleft
+        while len(batch) < max_items:
+            try:
+                item = popleft()
+            except IndexError:
+                break
+            if stop is not None and item is stop:
+                self._items.appendleft(item)
+                self._ready.set()
+                break
+            batch.append(item)
+        return batch
+
+
+class _SendTimeout(Exception):
+    """A send overran its bound on a ``_SendThread``."""
+
+
+class _SendThread:
+    """Daemon thread that runs one relay worker's ``sendText`` calls in turn.
+
+    Reused across sends so a relay doesn't spawn a thread per chunk. A call
+    that overruns its bound cannot be interrupted, so the thread running it
+    is abandoned (it exits once the call returns) and later calls go to a
+    fresh one. Daemon, so a hung send never holds up interpreter exit.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._generation = 0
+        self._jobs: Optional[queue.SimpleQueue] = None
+        self._restart()
+
+    def _restart(self) -> None:
+        if self._jobs is not None:
+            self._jobs.put(None)
+        self._generation += 1
+        self._jobs = queue.SimpleQueue()
+        threading.Thread(
+            target=self._run,
+            args=(self._jobs,),
+            daemon=True,
+            name=f"{self._name}-{self._generation}",
+        ).start()
+
+    @staticmethod
+    def _run(jobs) -> None:
+        while True:
+            job = jobs.get()
+            if job is None:
+                return
+            func, args, kwargs, outcome, done = job
+            try:
+                outcome.append((func(*args, **kwargs), None))
+            except Exception as e:
+                outcome.append((None, e))
+            done.set()
+
+    def call(self, timeout: float, func, *args, **kwargs):
+        """Run ``func`` on the send thread; raises ``_SendTimeout`` after ``timeout``s."""
+        outcome: List[Tuple[Any, Optional[Exception]]] = []
+        done = threading.Event()
+        self._jobs.put((func, args, kwargs, outcome, done))
+        if not done.wait(timeout):
+            self._restart()
+            raise _SendTimeout
+        result, error = outcome[0]
+        if error is not None:
+            raise error
+        return result
+
+    def close(self) -> None:
+        self._jobs.put(None)
+
 
 # Global state
+# Copy-on-write: readers use whatever dict the name currently points at with
+# no lock; writers copy, modify, and rebind under SHORTNAME_CACHE_LOCK.
 SHORTNAME_TO_NODE_CACHE: Dict[str, str] = {}
 SHORTNAME_CACHE_LOCK = threading.Lock()
 
-RELAY_QUEUE: queue.Queue = queue.Queue(maxsize=100)
-RELAY_WORKERS_COUNT = 3
-RELAY_WORKERS_STARTED = False
+# Reverse index of interface.nodes (shortname.lower() -> (node_id, shortName)),
+# rebuilt on a cache miss only when the node table looks stale.
+_NODE_INDEX: Dict[str, Any] = {}
+_NODE_INDEX_STAMP: Any = None  # (id(nodes), len(nodes), monotonic build time)
+_NODE_INDEX_MAX_AGE = 5.0  # seconds
 
-PENDING_RELAY_ACKS: Dict[int, Dict[str, Any]] = {}
-RELAY_ACK_LOCK = threading.Lock()
+RELAY_QUEUE = RelayRing(maxsize=100)
+RELAY_WORKERS_MIN = 2
+RELAY_WORKERS_MAX = 12
+RELAY_WORKERS_STARTED = False
+RELAY_SUPERVISOR_INTERVAL = 2.0  # seconds between queue-depth samples
+RELAY_GROW_SAMPLES = 3  # consecutive >50%-full samples before adding a worker
+RELAY_IDLE_SHRINK_AFTER = 30.0  # seconds of empty queue before retiring one
+_RELAY_POOL_LOCK = threading.Lock()
+_RELAY_WORKERS_ALIVE = 0
+_RELAY_WORKERS_RETIRING = 0
+_RELAY_WORKER_IDS = itertools.count(1)
+_RETIRE_WORKER = object()  # queue sentinel: the worker that takes it exits
+_RELAY_SHUTDOWN = threading.Event()
+# Debug-only logger (mesh-master's dprint), set by start_relay_workers
+_DEBUG_LOG_FUNC = None
+# Minimum spacing between a relay's chunk sends (MESH_MASTER_RELAY_CHUNK_GAP_MS)
+try:
+    RELAY_CHUNK_GAP = max(0.0, float(os.environ.get("MESH_MASTER_RELAY_CHUNK_GAP_MS", "200")) / 1000.0)
+except ValueError:
+    RELAY_CHUNK_GAP = 0.2
+RELAY_DRAIN_BATCH = 10  # tasks a worker takes per queue wakeup
+RELAY_SEND_TIMEOUT = 2.0  # seconds one sendText() may take
+_SEND_TIMEOUT_ERROR = "send timed out"
+
+# Pending ACKs are sharded by packet ID so ACK callbacks and relay workers
+# only contend when they touch the same shard.
+_ACK_SHARD_COUNT = 16
+_ACK_SHARD_MASK = _ACK_SHARD_COUNT - 1
+_ACK_SHARDS: List[Dict[int, Dict[str, Any]]] = [{} for _ in range(_ACK_SHARD_COUNT)]
+_ACK_SHARD_LOCKS = [threading.Lock() for _ in range(_ACK_SHARD_COUNT)]
 RELAY_ACK_TIMEOUT = 20  # seconds
 
 
+class _AckLatch:
+    """Count-down latch shared by every chunk of one relay.
+
+    ``remaining`` counts chunks still awaiting an ACK and ``ack_node`` keeps
+    the last node that named itself in one, so readiness is an O(1) check.
+    """
+
+    __slots__ = ("remaining", "ack_node", "_lock")
+
+    def __init__(self, count: int):
+        self.remaining = count
+        self.ack_node = None
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        """Every chunk is ACKed and an ACKing node is known."""
+        return self.remaining <= 0 and self.ack_node is not None
+
+    def count_down(self, ack_node=None, first=True) -> bool:
+        """Record an ACK; ``first`` is False for repeats of a counted chunk.
+
+        Returns True when this ACK made the latch ready.
+        """
+        with self._lock:
+            was_ready = self.ready
+            if ack_node:
+                self.ack_node = ack_node
+            if first:
+                self.remaining -= 1
+            return self.ready and not was_ready
+
+
+# node_id -> (expires_at, shortname) for ACK replies; node names change rarely
+_ACK_SHORTNAME_MEMO: Dict[str, Tuple[float, str]] = {}
+_ACK_SHORTNAME_MEMO_SIZE = 256
+_ACK_SHORTNAME_TTL = 60.0  # seconds
+
+# (sender_id, target_node_id) pairs with a relay queued or awaiting ACKs
+_IN_FLIGHT: Set[Tuple[str, str]] = set()
+_IN_FLIGHT_LOCK = threading.Lock()
+
+# Sent relays awaiting ACKs; the janitor thread finalizes them
+_ACK_JANITOR_CV = threading.Condition()
+_AWAITING_ACKS: List[Dict[str, Any]] = []
+
+
+def _release_relay(relay_task) -> None:
+    """Let the sender relay to this target again."""
+    relay_key = relay_task.get('relay_key')
+    if relay_key is None:
+        return
+    with _IN_FLIGHT_LOCK:
+        _IN_FLIGHT.discard(relay_key)
+
+
+def _track_relay(tracking) -> None:
+    with _ACK_JANITOR_CV:
+        _AWAITING_ACKS.append(tracking)
+        _ACK_JANITOR_CV.notify()
+
+
+def _wake_ack_janitor() -> None:
+    with _ACK_JANITOR_CV:
+        _ACK_JANITOR_CV.notify()
+
+
+def _ack_shard_index(packet_id) -> int:
+    return hash(packet_id) & _ACK_SHARD_MASK
+
+
+def _group_by_shard(packet_ids) -> Dict[int, List[int]]:
+    """Group packet IDs so each shard lock is taken once per batch."""
+    groups: Dict[int, List[int]] = {}
+    for packet_id in packet_ids:
+        groups.setdefault(_ack_shard_index(packet_id), []).append(packet_id)
+    return groups
+
+
 def update_shortname_cache(node_id, shortname=None, get_node_shortname_func=None):
     """Update the shortname-to-node_id cache. Auto-extracts shortname if not provided."""
     global SHORTNAME_TO_NODE_CACHE
@@ -43,252 +292,547 @@ def update_shortname_cache(node_id, shortname=None, get_node_shortname_func=None
 
     # Only cache real shortnames (not "Node_xxx" fallbacks)
     if shortname and not shortname.startswith("Node_"):
+        key = shortname.lower()
+        value = str(node_id)
         with SHORTNAME_CACHE_LOCK:
-            SHORTNAME_TO_NODE_CACHE[shortname.lower()] = str(node_id)
+            if SHORTNAME_TO_NODE_CACHE.get(key) == value:
+                return
+            updated = dict(SHORTNAME_TO_NODE_CACHE)
+            updated[key] = value
+            SHORTNAME_TO_NODE_CACHE = updated
 
 
 def get_node_id_from_shortname(shortname, interface=None, update_cache_func=None):
     """Lookup node_id by shortname (case-insensitive). Returns None if not found."""
     if not shortname:
         return None
+    shortname_lower = shortname.lower()
 
-    # First check cache
-    with SHORTNAME_CACHE_LOCK:
-        cached = SHORTNAME_TO_NODE_CACHE.get(shortname.lower())
+    # First check cache (lock-free; see SHORTNAME_TO_NODE_CACHE)
+    cached = SHORTNAME_TO_NODE_CACHE.get(shortname_lower)
     if cached:
         return cached
 
-    # Fallback: search interface.nodes directly
+    # Fallback: reverse index over interface.nodes
     if interface and hasattr(interface, "nodes"):
-        shortname_lower = shortname.lower()
-        for node_id, node_data in interface.nodes.items():
-            user_dict = node_data.get("user", {})
-            node_short = user_dict.get("shortName", "")
-            if node_short.lower() == shortname_lower:
-                # Cache it for next time
-                if update_cache_func:
-                    update_cache_func(node_id, node_short)
-                return str(node_id)
+        match = _node_shortname_index(interface.nodes).get(shortname_lower)
+        if match:
+            node_id, node_short = match
+            # Cache it for next time
+            if update_cache_func:
+                update_cache_func(node_id, node_short)
+            return str(node_id)
 
     return None
 
 
-def _relay_worker(interface, split_message_func, send_direct_chunks_func,
-                  get_node_shortname_func, same_node_id_func, clean_log_func):
-    """Worker thread that processes relay queue items."""
-    while True:
+def _node_shortname_index(nodes) -> Dict[str, Any]:
+    """Return the reverse shortname index for ``nodes``, rebuilding if stale.
+
+    The index is rebuilt when the node table is a different object, has
+    changed size, or is older than ``_NODE_INDEX_MAX_AGE`` (renames keep the
+    size unchanged), so repeated misses cost one O(N) pass at most per window.
+    """
+    global _NODE_INDEX, _NODE_INDEX_STAMP
+    now = time.monotonic()
+    stamp = _NODE_INDEX_STAMP
+    if (stamp is not None and stamp[0] == id(nodes) and stamp[1] == len(nodes)
+            and now - stamp[2] < _NODE_INDEX_MAX_AGE):
+        return _NODE_INDEX
+
+    index: Dict[str, Any] = {}
+    for node_id, node_data in list(nodes.items()):
+        node_short = node_data.get("user", {}).get("shortName", "")
+        if node_short:
+            # First node wins, matching the old linear scan
+            index.setdefault(node_short.lower(), (node_id, node_short))
+    _NODE_INDEX = index
+    _NODE_INDEX_STAMP = (id(nodes), len(nodes), now)
+    return index
+
+
+def _ack_shortname(node_id, get_node_shortname_func):
+    """Resolve an ACKing node's shortname through a small TTL memo.
+
+    Only the ACK janitor calls this, so the memo needs no lock.
+    """
+    now = time.monotonic()
+    hit = _ACK_SHORTNAME_MEMO.get(node_id)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    shortname = get_node_shortname_func(node_id)
+    if node_id not in _ACK_SHORTNAME_MEMO and len(_ACK_SHORTNAME_MEMO) >= _ACK_SHORTNAME_MEMO_SIZE:
+        # Evict the oldest insertion
+        _ACK_SHORTNAME_MEMO.pop(next(iter(_ACK_SHORTNAME_MEMO)))
+    _ACK_SHORTNAME_MEMO[node_id] = (now + _ACK_SHORTNAME_TTL, shortname)
+    return shortname
+
+
+def _notify_relay_sender(relay_task, text, interface, send_direct_chunks_func, clean_log_func):
+    sender_id = relay_task['sender_id']
+    # Telegram senders get their ACK via Telegram instead of mesh
+    if relay_task['is_telegram']:
+        if _send_tg is None:
+            clean_log_func("Telegram ACK notify failed: telegram_notify unavailable", "❌")
+            return
         try:
-            # Get relay task from queue (blocks until available)
-            relay_task = RELAY_QUEUE.get(timeout=1)
+            _send_tg(sender_id, text)
+        except Exception as e:
+            clean_log_func(f"Telegram ACK notify failed: {e}", "❌")
+    else:
+        send_direct_chunks_func(interface, text, sender_id)
 
-            sender_id = relay_task['sender_id']
-            target_shortname = relay_task['target_shortname']
-            target_node_id = relay_task['target_node_id']
-            relay_text = relay_task['relay_text']
-            message = relay_task['message']
 
-            # Send message and track packet ID for ACK monitoring
-            try:
-                if not interface:
-                    send_direct_chunks_func(interface, "❌ Radio interface not available", sender_id)
-                    continue
-
-                # Split message into chunks to handle long messages
-                chunks = split_message_func(relay_text)
-                if not chunks:
-                    failure_msg = f"❌ Failed to prepare relay to {target_shortname}"
-                    send_direct_chunks_func(interface, failure_msg, sender_id)
-                    continue
-
-                # Send all chunks and collect packet IDs
-                packet_ids = []
-                send_errors = []
-
-                for chunk_idx, chunk in enumerate(chunks):
-                    send_result = {'packet_id': None, 'error': None}
-
-                    def _send_relay_chunk(chunk_text=chunk):
-                        try:
-                            mesh_packet = interface.sendText(chunk_text, destinationId=target_node_id, wantAck=True)
-                            # Extract packet ID from MeshPacket object
-                            if hasattr(mesh_packet, 'id'):
-                                send_result['packet_id'] = mesh_packet.id
-                            elif isinstance(mesh_packet, int):
-                                send_result['packet_id'] = mesh_packet
-                        except Exception as e:
-                            send_result['error'] = str(e)
-
-                    send_thread = threading.Thread(target=_send_relay_chunk, daemon=True)
-                    send_thread.start()
-                    send_thread.join(timeout=2.0)
-
-                    if send_result['packet_id']:
-                        packet_ids.append(send_result['packet_id'])
-                        clean_log_func(f"Relay chunk {chunk_idx + 1}/{len(chunks)} sent (ID={send_result['packet_id']})", "📨", show_always=False)
-                    elif send_result['error']:
-                        send_errors.append(f"Chunk {chunk_idx + 1}: {send_result['error']}")
-
-                    # Small delay between chunks
-                    if chunk_idx < len(chunks) - 1:
-                        time.sleep(0.5)
-
-                if not packet_ids:
-                    # All chunks failed
-                    failure_msg = f"❌ Failed to send to {target_shortname}"
-                    send_direct_chunks_func(interface, failure_msg, sender_id)
-                    clean_log_func(f"Relay send error: {'; '.join(send_errors)}", "⚠️")
-                    continue
-
-                # Create shared ACK tracking event for all chunks
-                ack_events = []
-                for packet_id in packet_ids:
-                    chunk_ack_event = threading.Event()
-                    ack_events.append(chunk_ack_event)
-                    with RELAY_ACK_LOCK:
-                        PENDING_RELAY_ACKS[packet_id] = {
-                            'sender_id': sender_id,
-                            'target_shortname': target_shortname,
-                            'target_node_id': target_node_id,
-                            'message': message,
-                            'ack_event': chunk_ack_event,
-                            'ack_node': None,
-                            'timestamp': time.time()
-                        }
-
-                # Wait up to 20 seconds for ACKs from all chunks
-                start_time = time.time()
-                final_ack_node = None
-                all_acks_received = False
-
-                while (time.time() - start_time) < RELAY_ACK_TIMEOUT:
-                    # Check if all chunks have ACKed
-                    all_acked = all(event.is_set() for event in ack_events)
-
-                    if all_acked:
-                        # All chunks ACKed - get the ACK node from any chunk
-                        with RELAY_ACK_LOCK:
-                            for packet_id in packet_ids:
-                                if packet_id in PENDING_RELAY_ACKS:
-                                    ack_node = PENDING_RELAY_ACKS[packet_id].get('ack_node')
-                                    if ack_node:
-                                        final_ack_node = ack_node
-                                        if same_node_id_func(ack_node, target_node_id):
-                                            # Full ACK from intended recipient
-                                            all_acks_received = True
-                                            break
-
-                        if all_acks_received:
-                            break
-
-                        # Got ACKs but not from target - keep waiting
-                        if final_ack_node:
-                            all_acks_received = True
-                            break
-
-                    time.sleep(1.0)
-
-                # Clean up tracking entries
-                with RELAY_ACK_LOCK:
-                    for packet_id in packet_ids:
-                        ack_info = PENDING_RELAY_ACKS.pop(packet_id, None)
-                        if ack_info and not final_ack_node:
-                            final_ack_node = ack_info.get('ack_node')
-
-                if all_acks_received and final_ack_node:
-                    # All chunks ACKed
-                    ack_shortname = get_node_shortname_func(final_ack_node)
-                    success_msg = f"✅ ACK by {ack_shortname}"
-
-                    # Check if sender is Telegram user - send ACK via Telegram instead of mesh
-                    if isinstance(sender_id, str) and sender_id.startswith("telegram_"):
-                        try:
-                            from mesh_master.telegram_notify import send_telegram_notification
-                            send_telegram_notification(sender_id, success_msg)
-                        except Exception as e:
-                            clean_log_func(f"Telegram ACK notify failed: {e}", "❌")
-                    else:
-                        send_direct_chunks_func(interface, success_msg, sender_id)
+def _send_chunk(sender, interface, chunk, target_node_id):
+    """Send one chunk bounded by ``RELAY_SEND_TIMEOUT``; returns ``(packet_id, error)``.
 
-                    clean_log_func(f"Relay ACK: {ack_shortname} ({len(packet_ids)} chunks)", "✅")
-                else:
-                    # Timeout or partial ACKs
-                    failure_msg = f"❌ No ACK from {target_shortname}\n\nMessage: \"{message}\""
-
-                    # Check if sender is Telegram user
-                    if isinstance(sender_id, str) and sender_id.startswith("telegram_"):
-                        try:
-                            from mesh_master.telegram_notify import send_telegram_notification
-                            send_telegram_notification(sender_id, failure_msg)
-                        except Exception as e:
-                            clean_log_func(f"Telegram ACK notify failed: {e}", "❌")
-                    else:
-                        send_direct_chunks_func(interface, failure_msg, sender_id)
+    A ``sendText`` that times out cannot be stopped; it may still reach the
+    radio, but its packet ID is never tracked, and the error is
+    ``_SEND_TIMEOUT_ERROR``. ``sender`` moves on to a fresh thread, so the
+    next send is not stuck behind the hung one.
+    """
+    try:
+        mesh_packet = sender.call(
+            RELAY_SEND_TIMEOUT, interface.sendText, chunk, destinationId=target_node_id, wantAck=True
+        )
+    except _SendTimeout:
+        return None, _SEND_TIMEOUT_ERROR
+    except Exception as e:
+        return None, str(e)
+    # Extract packet ID from MeshPacket object
+    if hasattr(mesh_packet, 'id'):
+        return mesh_packet.id, None
+    if isinstance(mesh_packet, int):
+        return mesh_packet, None
+    return None, None
+
+
+def _record_relay(record_relay_func, target_node_id) -> None:
+    if record_relay_func is None:
+        return
+    try:
+        record_relay_func(target_node_id)
+    except Exception:
+        pass  # Stats must never fail a relay
 
-                    clean_log_func(f"Relay timeout: {target_shortname} (no ACK after {RELAY_ACK_TIMEOUT}s)", "⏱️")
 
-            except Exception as e:
-                # Unexpected error in worker
-                print(f"Relay worker exception: {e}")
-                failure_msg = f"❌ Relay error to {target_shortname}"
-                send_direct_chunks_func(interface, failure_msg, sender_id)
-
-        except queue.Empty:
-            # Queue empty, loop will continue
-            continue
-        finally:
+def _send_relay(relay_task, interface, sender, split_message_func,
+                send_direct_chunks_func, clean_log_func, record_relay_func=None):
+    """Send a relay's chunks and register their packet IDs for ACK tracking.
+
+    ``record_relay_func(target_node_id)`` is called once the first chunk is
+    out. Returns the tracking record for ``_finish_relay``, or None when the
+    relay was already answered (nothing could be sent).
+    """
+    sender_id = relay_task['sender_id']
+    target_shortname = relay_task['target_shortname']
+    target_node_id = relay_task['target_node_id']
+
+    if not interface:
+        send_direct_chunks_func(interface, "❌ Radio interface not available", sender_id)
+        return None
+
+    # Split message into chunks to handle long messages
+    chunks = split_message_func(relay_task['relay_text'])
+    if not chunks:
+        failure_msg = f"❌ Failed to prepare relay to {target_shortname}"
+        send_direct_chunks_func(interface, failure_msg, sender_id)
+        return None
+
+    # Send all chunks and collect packet IDs
+    packet_ids = []
+    send_errors = []
+
+    if len(chunks) == 1:
+        # Single-chunk fast path: no pacing or per-chunk bookkeeping
+        packet_id, error = _send_chunk(sender, interface, chunks[0], target_node_id)
+        if packet_id:
+            packet_ids.append(packet_id)
+            clean_log_func(f"Relay chunk 1/1 sent (ID={packet_id})", "📨", show_always=False)
+            _record_relay(record_relay_func, target_node_id)
+        elif error:
+            send_errors.append(f"Chunk 1: {error}")
+    else:
+        last_chunk = len(chunks) - 1
+        for chunk_idx, chunk in enumerate(chunks):
+            send_started = time.monotonic()
+            packet_id, error = _send_chunk(sender, interface, chunk, target_node_id)
+            if packet_id:
+                packet_ids.append(packet_id)
+                clean_log_func(f"Relay chunk {chunk_idx + 1}/{len(chunks)} sent (ID={packet_id})", "📨", show_always=False)
+                if chunk_idx == 0:
+                    _record_relay(record_relay_func, target_node_id)
+            elif error:
+                send_errors.append(f"Chunk {chunk_idx + 1}: {error}")
+                if error is _SEND_TIMEOUT_ERROR and chunk_idx < last_chunk:
+                    # The radio is likely wedged; don't pile more hung sends
+                    # on it for a relay that is already incomplete
+                    send_errors.append(f"Chunks {chunk_idx + 2}-{len(chunks)}: skipped")
+                    break
+
+            # Pace chunks: only sleep for whatever part of the minimum gap the
+            # send itself didn't already take
+            if chunk_idx < last_chunk:
+                pause = RELAY_CHUNK_GAP - (time.monotonic() - send_started)
+                if pause > 0:
+                    time.sleep(pause)
+
+    if not packet_ids:
+        # All chunks failed
+        failure_msg = f"❌ Failed to send to {target_shortname}"
+        send_direct_chunks_func(interface, failure_msg, sender_id)
+        clean_log_func(f"Relay send error: {'; '.join(send_errors)}", "⚠️")
+        return None
+
+    # One latch tracks every chunk; it opens as soon as the last ACK lands.
+    latch = _AckLatch(len(packet_ids))
+    ack_infos = {}
+    for packet_id in packet_ids:
+        ack_infos[packet_id] = {
+            'sender_id': sender_id,
+            'target_shortname': target_shortname,
+            'target_node_id': target_node_id,
+            'message': relay_task['message'],
+            'acked': False,
+            'ack_node': None,
+            'latch': latch,
+            'timestamp': time.time()
+        }
+    if len(packet_ids) == 1:
+        # One entry lands in one shard; skip the grouping pass
+        shard_groups = {_ack_shard_index(packet_ids[0]): packet_ids}
+    else:
+        shard_groups = _group_by_shard(packet_ids)
+    for shard_idx, shard_pids in shard_groups.items():
+        shard = _ACK_SHARDS[shard_idx]
+        with _ACK_SHARD_LOCKS[shard_idx]:
+            for packet_id in shard_pids:
+                shard[packet_id] = ack_infos[packet_id]
+
+    return {
+        'task': relay_task,
+        'packet_ids': packet_ids,
+        'shard_groups': shard_groups,
+        'ack_infos': ack_infos,
+        'latch': latch,
+        'deadline': time.monotonic() + RELAY_ACK_TIMEOUT,
+    }
+
+
+def _finish_relay(tracking, interface, send_direct_chunks_func,
+                  get_node_shortname_func, same_node_id_func, clean_log_func,
+                  no_ack_message_func=None):
+    """Report a settled (fully ACKed or expired) relay to its sender.
+
+    ``no_ack_message_func(relay_task)``, when given, decides what to do with
+    an unACKed relay (e.g. queue it for later) and returns the sender notice.
+    """
+    relay_task = tracking['task']
+    target_shortname = relay_task['target_shortname']
+    target_node_id = relay_task['target_node_id']
+    packet_ids = tracking['packet_ids']
+    ack_infos = tracking['ack_infos']
+
+    # ACKs from all chunks, at least one of which names the ACKing node
+    all_acks_received = tracking['latch'].ready
+
+    # One critical section per shard both drops the tracking entries and
+    # collects the ACKing nodes recorded on them
+    ack_nodes = []
+    for shard_idx, shard_pids in tracking['shard_groups'].items():
+        shard = _ACK_SHARDS[shard_idx]
+        with _ACK_SHARD_LOCKS[shard_idx]:
+            for packet_id in shard_pids:
+                shard.pop(packet_id, None)
+                ack_node = ack_infos[packet_id]['ack_node']
+                if ack_node:
+                    ack_nodes.append(ack_node)
+
+    final_ack_node = None
+    if all_acks_received:
+        # Prefer an ACK from the intended recipient
+        final_ack_node = next(
+            (node for node in ack_nodes if same_node_id_func(node, target_node_id)),
+            ack_nodes[0] if ack_nodes else tracking['latch'].ack_node,
+        )
+
+    if all_acks_received and final_ack_node:
+        # All chunks ACKed
+        ack_shortname = _ack_shortname(final_ack_node, get_node_shortname_func)
+        success_msg = f"✅ ACK by {ack_shortname}"
+        _notify_relay_sender(relay_task, success_msg, interface, send_direct_chunks_func, clean_log_func)
+        clean_log_func(f"Relay ACK: {ack_shortname} ({len(packet_ids)} chunks)", "✅")
+    else:
+        # Timeout or partial ACKs
+        if no_ack_message_func is not None:
+            failure_msg = no_ack_message_func(relay_task)
+        else:
+            failure_msg = f"❌ No ACK from {target_shortname}\n\nMessage: \"{relay_task['message']}\""
+            clean_log_func(f"Relay timeout: {target_shortname} (no ACK after {RELAY_ACK_TIMEOUT}s)", "⏱️")
+        _notify_relay_sender(relay_task, failure_msg, interface, send_direct_chunks_func, clean_log_func)
+
+
+def _debug_log(message: str) -> None:
+    if _DEBUG_LOG_FUNC is not None:
+        _DEBUG_LOG_FUNC(message)
+
+
+def _relay_error(relay_task, exc, interface, send_direct_chunks_func):
+    """Tell the sender a relay failed; never raises, so callers stay alive."""
+    # Unexpected error in worker
+    _debug_log(f"Relay worker exception: {exc}")
+    failure_msg = f"❌ Relay error to {relay_task['target_shortname']}"
+    try:
+        send_direct_chunks_func(interface, failure_msg, relay_task['sender_id'])
+    except Exception as e:
+        # Typically the radio is down; the failure notice is lost with it
+        _debug_log(f"Relay error notice failed: {e}")
+
+
+def _relay_ack_janitor(get_interface, send_direct_chunks_func,
+                       get_node_shortname_func, same_node_id_func, clean_log_func,
+                       no_ack_message_func=None):
+    """Finalize sent relays once fully ACKed or past their ACK deadline.
+
+    Sleeps on ``_ACK_JANITOR_CV`` until a latch opens, a new relay is tracked,
+    or the earliest deadline passes, so workers never block on ACKs.
+    """
+    while True:
+        with _ACK_JANITOR_CV:
+            while True:
+                now = time.monotonic()
+                settled = []
+                waiting = []
+                next_deadline = None
+                for tracking in _AWAITING_ACKS:
+                    if tracking['latch'].ready or tracking['deadline'] <= now:
+                        settled.append(tracking)
+                    else:
+                        waiting.append(tracking)
+                        if next_deadline is None or tracking['deadline'] < next_deadline:
+                            next_deadline = tracking['deadline']
+                if settled:
+                    _AWAITING_ACKS[:] = waiting
+                    break
+                _ACK_JANITOR_CV.wait(None if next_deadline is None else next_deadline - now)
+
+        # Each relay is settled on its own; one failure must not stop the
+        # only thread that times out and finalizes pending relays
+        interface = get_interface()
+        for tracking in settled:
             try:
-                RELAY_QUEUE.task_done()
-            except Exception:
-                pass
+                _finish_relay(tracking, interface, send_direct_chunks_func,
+                              get_node_shortname_func, same_node_id_func, clean_log_func,
+                              no_ack_message_func)
+            except Exception as e:
+                _relay_error(tracking['task'], e, interface, send_direct_chunks_func)
+            finally:
+                _release_relay(tracking['task'])
+
+
+def _relay_worker(get_interface, split_message_func, send_direct_chunks_func, clean_log_func,
+                  record_relay_func=None):
+    """Worker thread that processes relay queue items.
+
+    Each wakeup drains up to ``RELAY_DRAIN_BATCH`` tasks and sends them back
+    to back; ACK tracking is handed to the janitor so the worker goes straight
+    back to the queue. A worker that takes a ``_RETIRE_WORKER`` sentinel
+    exits; batches stop short of sentinels so each one reaches its own worker.
+    """
+    global _RELAY_WORKERS_ALIVE, _RELAY_WORKERS_RETIRING
+    # One long-lived send thread per worker bounds sendText() without
+    # spawning a fresh thread for every chunk
+    sender = _SendThread(f"{threading.current_thread().name}-send")
+    retire = False
+    try:
+        while True:
+            # Block until work (or a retire sentinel) arrives; idle workers
+            # stay asleep instead of waking every second
+            relay_task = RELAY_QUEUE.get()
+            if relay_task is _RETIRE_WORKER:
+                retire = True
+                break
+            batch = [relay_task]
+            batch.extend(RELAY_QUEUE.drain(RELAY_DRAIN_BATCH - 1, stop=_RETIRE_WORKER))
+
+            # The interface is looked up per batch so reconnects are picked up
+            interface = get_interface()
+            # Send message and track packet IDs for ACK monitoring
+            for relay_task in batch:
+                try:
+                    tracking = _send_relay(relay_task, interface, sender, split_message_func,
+                                           send_direct_chunks_func, clean_log_func, record_relay_func)
+                except Exception as e:
+                    _relay_error(relay_task, e, interface, send_direct_chunks_func)
+                    tracking = None
+                if tracking is not None:
+                    _track_relay(tracking)
+                else:
+                    _release_relay(relay_task)
+    finally:
+        sender.close()
+        with _RELAY_POOL_LOCK:
+            _RELAY_WORKERS_ALIVE -= 1
+            if retire:
+                _RELAY_WORKERS_RETIRING -= 1
+
+
+def _spawn_relay_worker(worker_args) -> None:
+    """Start one more relay worker. Caller holds ``_RELAY_POOL_LOCK``."""
+    global _RELAY_WORKERS_ALIVE
+    worker = threading.Thread(
+        target=_relay_worker,
+        args=worker_args,
+        daemon=True,
+        name=f"RelayWorker-{next(_RELAY_WORKER_IDS)}"
+    )
+    worker.start()
+    _RELAY_WORKERS_ALIVE += 1
+
+
+def _relay_supervisor(worker_args, clean_log_func):
+    """Grow the worker pool under sustained backlog and shrink it when idle."""
+    global _RELAY_WORKERS_RETIRING
+    busy_samples = 0
+    idle_since = None
+    while not _RELAY_SHUTDOWN.wait(RELAY_SUPERVISOR_INTERVAL):
+        depth = RELAY_QUEUE.qsize()
+        now = time.monotonic()
+
+        busy_samples = busy_samples + 1 if depth > RELAY_QUEUE.maxsize // 2 else 0
+        if depth:
+            idle_since = None
+        elif idle_since is None:
+            idle_since = now
+
+        with _RELAY_POOL_LOCK:
+            active = _RELAY_WORKERS_ALIVE - _RELAY_WORKERS_RETIRING
+            if busy_samples >= RELAY_GROW_SAMPLES and active < RELAY_WORKERS_MAX:
+                _spawn_relay_worker(worker_args)
+                busy_samples = 0
+                clean_log_func(f"Relay backlog {depth}: scaled up to {active + 1} workers", "📨", show_always=False)
+            elif (idle_since is not None and now - idle_since >= RELAY_IDLE_SHRINK_AFTER
+                    and active > RELAY_WORKERS_MIN):
+                # Forced like the shutdown path: a capacity error here would
+                # kill the supervisor and leave the retiring count inflated
+                RELAY_QUEUE.put(_RETIRE_WORKER, force=True)
+                _RELAY_WORKERS_RETIRING += 1
+                idle_since = now
+                clean_log_func(f"Relay queue idle: scaling down to {active - 1} workers", "📨", show_always=False)
 
 
 def start_relay_workers(interface, split_message_func, send_direct_chunks_func,
-                       get_node_shortname_func, same_node_id_func, clean_log_func):
-    """Start relay worker pool (called once at startup)."""
-    global RELAY_WORKERS_STARTED
+                       get_node_shortname_func, same_node_id_func, clean_log_func,
+                       *, get_interface_func=None, record_relay_func=None,
+                       no_ack_message_func=None, debug_log_func=None):
+    """Start relay worker pool, its supervisor and the ACK janitor (called once at startup).
+
+    Pass ``get_interface_func`` instead of a fixed ``interface`` when the
+    radio interface can be replaced (reconnects); it is called per batch.
+    ``debug_log_func(message)`` receives worker exceptions, which are
+    otherwise not printed.
+    """
+    global RELAY_WORKERS_STARTED, _DEBUG_LOG_FUNC
     if RELAY_WORKERS_STARTED:
         return
 
-    for i in range(RELAY_WORKERS_COUNT):
-        worker = threading.Thread(
-            target=_relay_worker,
-            args=(interface, split_message_func, send_direct_chunks_func,
-                  get_node_shortname_func, same_node_id_func, clean_log_func),
+    get_interface = get_interface_func or (lambda: interface)
+    worker_args = (get_interface, split_message_func, send_direct_chunks_func, clean_log_func,
+                   record_relay_func)
+    with _RELAY_POOL_LOCK:
+        if RELAY_WORKERS_STARTED:
+            return
+        _DEBUG_LOG_FUNC = debug_log_func
+        threading.Thread(
+            target=_relay_ack_janitor,
+            args=(get_interface, send_direct_chunks_func,
+                  get_node_shortname_func, same_node_id_func, clean_log_func,
+                  no_ack_message_func),
             daemon=True,
-            name=f"RelayWorker-{i+1}"
-        )
-        worker.start()
+            name="RelayAckJanitor"
+        ).start()
+        for _ in range(RELAY_WORKERS_MIN):
+            _spawn_relay_worker(worker_args)
+        threading.Thread(
+            target=_relay_supervisor,
+            args=(worker_args, clean_log_func),
+            daemon=True,
+            name="RelaySupervisor"
+        ).start()
+        RELAY_WORKERS_STARTED = True
+    clean_log_func(f"Started {RELAY_WORKERS_MIN} relay workers (max {RELAY_WORKERS_MAX})", "📨", show_always=False)
 
-    RELAY_WORKERS_STARTED = True
-    clean_log_func(f"Started {RELAY_WORKERS_COUNT} relay workers", "📨", show_always=False)
+
+def stop_relay_workers() -> None:
+    """Retire every relay worker once the tasks already queued are sent.
+
+    Each worker takes one ``_RETIRE_WORKER`` sentinel from the queue and
+    exits; the supervisor stops too. The pool is not restarted afterwards.
+    """
+    global _RELAY_WORKERS_RETIRING
+    _RELAY_SHUTDOWN.set()
+    with _RELAY_POOL_LOCK:
+        active = _RELAY_WORKERS_ALIVE - _RELAY_WORKERS_RETIRING
+        _RELAY_WORKERS_RETIRING += active
+        for _ in range(active):
+            RELAY_QUEUE.put(_RETIRE_WORKER, force=True)
+
+
+def enqueue_relay(relay_task) -> None:
+    """Queue a prepared relay task; raises ``queue.Full`` when the queue is full.
+
+    ``relay_task`` needs sender_id, target_shortname, target_node_id,
+    relay_text and message. Tasks queued here directly (e.g. retries) carry
+    no ``relay_key`` and skip the in-flight duplicate check.
+    """
+    sender_id = relay_task['sender_id']
+    relay_task.setdefault('is_telegram', isinstance(sender_id, str) and sender_id.startswith("telegram_"))
+    RELAY_QUEUE.put(relay_task, block=False)
 
 
 def handle_shortname_relay(sender_id, sender_key, target_shortname, target_node_id,
                            message, get_node_shortname_func, start_workers_func):
     """Handle shortname-first relay: 'snmo hello' -> relay to SnMo with reply option."""
-    sender_short = get_node_shortname_func(sender_id)
-
-    # Ensure relay workers are started
-    start_workers_func()
-
-    # Send the relay message to target - no mail system involvement
-    relay_text = f"📨 Relay from {sender_short}:\n{message}\n\n💬 To reply: {sender_short.lower()} <your message>"
+    # One relay per sender/target pair at a time; repeats would only queue
+    # more copies behind the first and tie up workers
+    relay_key = (str(sender_id), str(target_node_id))
+    with _IN_FLIGHT_LOCK:
+        duplicate = relay_key in _IN_FLIGHT
+        if not duplicate:
+            _IN_FLIGHT.add(relay_key)
+    if duplicate:
+        from mesh_master.replies import PendingReply
+        return PendingReply(f"⏳ Relay already in flight to {target_shortname}", "shortname relay")
 
-    # Add to relay queue (non-blocking with timeout)
     relay_task = {
         'sender_id': sender_id,
         'target_shortname': target_shortname,
         'target_node_id': target_node_id,
-        'relay_text': relay_text,
-        'message': message
+        'message': message,
+        'relay_key': relay_key,
     }
 
+    # Until the task is queued nothing else will release the key, so any
+    # failure here must, or the pair stays blocked until restart
     try:
-        RELAY_QUEUE.put(relay_task, block=False)
+        sender_short = get_node_shortname_func(sender_id)
+
+        # Ensure relay workers are started
+        start_workers_func()
+
+        # Send the relay message to target - no mail system involvement
+        relay_task['relay_text'] = f"📨 Relay from {sender_short}:\n{message}\n\n💬 To reply: {sender_short.lower()} <your message>"
+
+        # Add to relay queue (non-blocking)
+        enqueue_relay(relay_task)
     except queue.Full:
         # Queue is full - reject relay
+        _release_relay(relay_task)
         from mesh_master.replies import PendingReply
         return PendingReply(f"⚠️ Relay queue full. Try again in a moment.", "shortname relay")
+    except Exception:
+        _release_relay(relay_task)
+        raise
 
     # Return None - no immediate response
     # User will get "✅ ACK by {shortname}" or "❌ No ACK from {shortname}" async
@@ -300,12 +844,21 @@ def handle_relay_ack(request_id, sender_node):
     if not request_id:
         return
 
-    with RELAY_ACK_LOCK:
-        if request_id in PENDING_RELAY_ACKS:
-            # This is an ACK for a relay we're tracking
-            relay_info = PENDING_RELAY_ACKS[request_id]
-            # Convert sender_node to string to avoid unhashable type issues
-            relay_info['ack_node'] = str(sender_node) if sender_node else None
-            ack_event = relay_info.get('ack_event')
-            if ack_event:
-                ack_event.set()  # Signal the waiting relay worker
+    shard_idx = _ack_shard_index(request_id)
+    with _ACK_SHARD_LOCKS[shard_idx]:
+        relay_info = _ACK_SHARDS[shard_idx].get(request_id)
+        if relay_info is None:
+            return
+        # This is an ACK for a relay we're tracking
+        # Convert sender_node to string to avoid unhashable type issues
+        ack_node = str(sender_node) if sender_node else None
+        relay_info['ack_node'] = ack_node
+        first = not relay_info['acked']
+        if not first and not ack_node:
+            return  # Duplicate ACK for this chunk with nothing new
+        relay_info['acked'] = True
+        latch = relay_info['latch']
+
+    # Wake the ACK janitor (outside the shard lock) once the relay settles
+    if latch.count_down(ack_node, first):
+        _wake_ack_janitor()
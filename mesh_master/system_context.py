@@ -14,13 +14,137 @@ Context includes:
 - Feature explanations
 """
 
+import functools
 import time
-from typing import Dict, Any, Optional
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from .help_database import HELP_DATABASE
 
-
+# HELP_DATABASE is static at runtime, so the rendered command reference is
+# built on first use and reused afterwards.
+_COMMANDS_CACHE: Optional[str] = None
+_COMMANDS_BY_CATEGORY: Optional[Dict[str, List[str]]] = None
+
+# Recently rendered settings sections, keyed by the values they show
+_SETTINGS_CACHE: Dict[tuple, str] = {}
+_SETTINGS_CACHE_SIZE = 8
+
+# (id(interface.channels), len(interface.channels), rendered channel list)
+_CHANNELS_CACHE: Tuple[int, int, str] = (0, 0, "")
+
+# Meshtastic LoRa modem presets, indexed by enum value
+MODEM_PRESET_NAMES = (
+    "LONG_FAST",
+    "LONG_SLOW",
+    "VERY_LONG_SLOW",
+    "MEDIUM_SLOW",
+    "MEDIUM_FAST",
+    "SHORT_SLOW",
+    "SHORT_FAST",
+    "LONG_MODERATE",
+    "SHORT_TURBO",
+)
+
+
+def _read_git_refs(git_dir: Path) -> Dict[str, str]:
+    """Map ref names to SHAs from packed-refs (tags resolve to their commit)."""
+    refs: Dict[str, str] = {}
+    try:
+        lines = (git_dir / "packed-refs").read_text().splitlines()
+    except OSError:
+        return refs
+    last_ref = None
+    for line in lines:
+        if line.startswith("^") and last_ref:
+            # Peeled line: the commit an annotated tag points at
+            refs[last_ref] = line[1:].strip()
+        elif line and not line.startswith("#"):
+            sha, _, ref = line.partition(" ")
+            refs[ref.strip()] = sha
+            last_ref = ref.strip()
+    return refs
+
+
+def _peel_git_tag(git_dir: Path, sha: str) -> Optional[str]:
+    """Follow a loose tag ref to its commit, reading annotated tag objects.
+
+    Returns None when the object is not stored loose (e.g. it lives in a
+    packfile), so the caller can defer to ``git describe``.
+    """
+    for _ in range(8):  # tags of tags are legal; bound the chain
+        try:
+            raw = zlib.decompress((git_dir / "objects" / sha[:2] / sha[2:]).read_bytes())
+        except (OSError, zlib.error):
+            return None
+        header, _, body = raw.partition(b"\0")
+        if not header.startswith(b"tag "):
+            return sha
+        first_line = body.split(b"\n", 1)[0].decode("ascii", "replace")
+        if not first_line.startswith("object "):
+            return None
+        sha = first_line[len("object "):].strip()
+    return None
+
+
+def _read_git_head(git_dir: Optional[Path] = None) -> Optional[str]:
+    """Resolve HEAD from the .git directory without spawning git.
+
+    Returns the tag name when HEAD sits exactly on a tag, the short commit SHA
+    in an untagged repository, or None when only ``git describe`` can answer
+    (unknown layout, an unpeelable tag, or HEAD past the nearest tag).
+    """
+    if git_dir is None:
+        git_dir = Path(__file__).resolve().parent.parent / ".git"
+    try:
+        if git_dir.is_file():
+            # Worktrees/submodules: ".git" is a "gitdir: <path>" pointer
+            pointer = git_dir.read_text().strip()
+            if not pointer.startswith("gitdir:"):
+                return None
+            git_dir = (git_dir.parent / pointer[len("gitdir:"):].strip()).resolve()
+        head = (git_dir / "HEAD").read_text().strip()
+        packed = _read_git_refs(git_dir)
+        if head.startswith("ref:"):
+            ref = head[len("ref:"):].strip()
+            ref_file = git_dir / ref
+            sha = ref_file.read_text().strip() if ref_file.is_file() else packed.get(ref)
+        else:
+            sha = head
+        if not sha or len(sha) < 7:
+            return None
+
+        # Match `git describe --tags` when HEAD is exactly a tag. packed-refs
+        # already carries peeled commits; loose annotated tags are peeled here.
+        tags = {
+            ref[len("refs/tags/"):]: ref_sha
+            for ref, ref_sha in packed.items()
+            if ref.startswith("refs/tags/")
+        }
+        tags_dir = git_dir / "refs" / "tags"
+        if tags_dir.is_dir():
+            for tag_file in tags_dir.iterdir():
+                if tag_file.is_file():
+                    tags[tag_file.name] = _peel_git_tag(git_dir, tag_file.read_text().strip())
+        for name in sorted(tags):
+            if tags[name] == sha:
+                return name
+        if tags:
+            # Unpeelable tag, or HEAD is past a tag: only `git describe` can
+            # produce its "<tag>-<n>-g<sha>" answer
+            return None
+        return sha[:7]
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
 def get_github_version() -> str:
-    """Get current GitHub version/commit if available."""
+    """Get current GitHub version/commit if available (resolved once per process)."""
+    version = _read_git_head()
+    if version:
+        return version
     try:
         import subprocess
         result = subprocess.run(
@@ -37,43 +161,55 @@ def get_github_version() -> str:
 
 
 def get_active_channels(interface) -> str:
-    """Get comma-separated list of active channels."""
+    """Get comma-separated list of active channels.
+
+    The result is cached against the identity and size of
+    ``interface.channels``, which only change when the radio is reconfigured.
+    """
+    global _CHANNELS_CACHE
+    channels = getattr(interface, "channels", None) if interface else None
+    if channels:
+        try:
+            stamp = (id(channels), len(channels))
+        except TypeError:
+            stamp = None
+        if stamp is not None and _CHANNELS_CACHE[:2] == stamp:
+            return _CHANNELS_CACHE[2]
+    else:
+        stamp = None
+
     channel_names = []
     try:
-        if interface and hasattr(interface, "channels") and interface.channels:
-            channels = interface.channels
-            if isinstance(channels, dict):
-                for ch_idx, ch_data in channels.items():
-                    if isinstance(ch_data, dict):
-                        settings = ch_data.get("settings", {})
-                        if isinstance(settings, dict):
-                            ch_name = settings.get("name", "")
-                            if ch_name and ch_name not in channel_names:
-                                channel_names.append(ch_name)
+        if channels and isinstance(channels, dict):
+            for ch_idx, ch_data in channels.items():
+                if isinstance(ch_data, dict):
+                    settings = ch_data.get("settings", {})
+                    if isinstance(settings, dict):
+                        ch_name = settings.get("name", "")
+                        if ch_name and ch_name not in channel_names:
+                            channel_names.append(ch_name)
     except Exception:
         pass
-    return ", ".join(channel_names) if channel_names else "None detected"
+    result = ", ".join(channel_names) if channel_names else "None detected"
+    if stamp is not None:
+        _CHANNELS_CACHE = (stamp[0], stamp[1], result)
+    return result
 
 
 def get_modem_preset_name(preset_num: Optional[int]) -> str:
     """Convert modem preset number to readable name."""
-    presets = {
-        0: "LONG_FAST",
-        1: "LONG_SLOW",
-        2: "VERY_LONG_SLOW",
-        3: "MEDIUM_SLOW",
-        4: "MEDIUM_FAST",
-        5: "SHORT_SLOW",
-        6: "SHORT_FAST",
-        7: "LONG_MODERATE",
-        8: "SHORT_TURBO"
-    }
-    return presets.get(preset_num, f"Unknown ({preset_num})")
+    if isinstance(preset_num, int) and 0 <= preset_num < len(MODEM_PRESET_NAMES):
+        return MODEM_PRESET_NAMES[preset_num]
+    return f"Unknown ({preset_num})"
 
 
-def build_commands_section() -> str:
-    """Build comprehensive commands documentation from help database."""
-    sections = {
+def _commands_by_category() -> Dict[str, List[str]]:
+    """Group formatted command docs by category (built once, on first use)."""
+    global _COMMANDS_BY_CATEGORY
+    if _COMMANDS_BY_CATEGORY is not None:
+        return _COMMANDS_BY_CATEGORY
+
+    sections: Dict[str, List[str]] = {
         "AI & Conversation": [],
         "Network": [],
         "Logs & Reports": [],
@@ -92,26 +228,38 @@ def build_commands_section() -> str:
         examples = info.get("examples", [])
         aliases = info.get("aliases", [])
 
-        cmd_doc = f"  {cmd}: {desc}\n    Usage: {usage}"
+        doc_lines = [f"  {cmd}: {desc}", f"    Usage: {usage}"]
         if examples:
-            cmd_doc += f"\n    Examples: {', '.join(examples)}"
+            doc_lines.append(f"    Examples: {', '.join(examples)}")
         if aliases:
-            cmd_doc += f"\n    Aliases: {', '.join(aliases)}"
+            doc_lines.append(f"    Aliases: {', '.join(aliases)}")
+
+        sections[category].append("\n".join(doc_lines))
+
+    _COMMANDS_BY_CATEGORY = sections
+    return sections
 
-        sections[category].append(cmd_doc)
 
-    output = "AVAILABLE COMMANDS\n" + "=" * 80 + "\n\n"
-    for category, commands in sections.items():
+def build_commands_section() -> str:
+    """Build comprehensive commands documentation from help database."""
+    global _COMMANDS_CACHE
+    if _COMMANDS_CACHE is not None:
+        return _COMMANDS_CACHE
+
+    rule = "-" * 80
+    out_parts = ["AVAILABLE COMMANDS\n", "=" * 80, "\n\n"]
+    for category, commands in _commands_by_category().items():
         if commands:
-            output += f"\n[{category}]\n" + "-" * 80 + "\n"
-            output += "\n\n".join(commands) + "\n"
+            out_parts.append(f"\n[{category}]\n{rule}\n")
+            out_parts.append("\n\n".join(commands))
+            out_parts.append("\n")
+    output = "".join(out_parts)
 
+    _COMMANDS_CACHE = output
     return output
 
 
-def build_architecture_section() -> str:
-    """Build architecture and system flow documentation."""
-    return """
+_ARCHITECTURE_SECTION = """
 SYSTEM ARCHITECTURE
 ================================================================================
 
@@ -139,23 +287,25 @@ RELAY SYSTEM
 ------------
 Multi-Network Message Bridging with ACK Tracking
 
-Architecture:
-- Uses daemon threads for non-blocking sends
-- Tracks pending ACKs in PENDING_RELAY_ACKS dict (keyed by packet_id)
-- 20-second timeout per message chunk
+Architecture (mesh_master/relay_manager.py):
+- Relay queue served by 2-12 worker threads, sized from queue depth
+- Each worker sends through its own daemon send thread (2s bound per send)
+- Tracks pending ACKs in 16 sharded dicts keyed by packet_id, each with its own lock
+- One ACK janitor thread finalizes relays; 20-second ACK timeout per relay
 - Multi-chunk support for long messages (splits at ~200 chars)
+- One relay per sender/target pair in flight at a time
 
 Flow:
 1. User sends: "shortname: message"
 2. System extracts target shortname and message
 3. Looks up node_id from shortname cache
 4. Splits message into chunks if needed
-5. Sends each chunk via sendText(wantAck=True) in separate thread
+5. Sends each chunk via sendText(wantAck=True) on the worker's send thread
 6. Extracts packet_id from MeshPacket.id field
-7. Creates threading.Event per chunk for ACK waiting
+7. Registers each packet_id in its ACK shard; all chunks share one count-down latch
 8. on_receive() detects ROUTING_APP packets with matching requestId
-9. Sets event to signal ACK received
-10. Worker waits for all chunks to ACK or timeout
+9. handle_relay_ack() counts the latch down and wakes the janitor once every chunk is ACKed
+10. Janitor reports "ACK by" or, after the timeout, "No ACK" to the sender
 
 Auto-Reply Feature:
 - When user receives relay, system stores sender in LAST_RELAY_SENDER
@@ -294,63 +444,33 @@ Configuration:
 """
 
 
-def build_settings_section(config: Dict[str, Any], interface=None) -> str:
-    """Build current settings snapshot."""
-
-    # LLM Settings
-    llm_provider = config.get("llm_provider", "unknown")
-    llm_model = config.get("llm_model", "unknown")
-    api_key_status = "Configured" if config.get("api_key") else "Not set"
-
-    # Connection Settings
-    connection_type = config.get("connection_type", "unknown")
-    if connection_type == "serial":
-        conn_detail = f"Serial: {config.get('serial_port', 'auto-detect')}"
-    else:
-        conn_detail = f"WiFi: {config.get('wifi_host', '192.168.0.1')}"
-
-    # Channel Info
-    channels = get_active_channels(interface)
-
-    # Modem Preset
-    modem_preset = None
-    if interface and hasattr(interface, "localNode"):
-        local_node = interface.localNode
-        if hasattr(local_node, "localConfig"):
-            lora_config = getattr(local_node.localConfig, "lora", None)
-            if lora_config:
-                modem_preset = getattr(lora_config, "modem_preset", None)
-
-    modem_name = get_modem_preset_name(modem_preset)
-
-    # Relay Status
-    relay_enabled = "Enabled (ACK tracking active)" if config.get("relay_enabled", True) else "Disabled"
+def build_architecture_section() -> str:
+    """Build architecture and system flow documentation."""
+    return _ARCHITECTURE_SECTION
 
-    # Dashboard
-    dashboard_port = config.get("dashboard_port", 5000)
 
-    return f"""
+_SETTINGS_TMPL = """
 CURRENT SETTINGS
 ================================================================================
 
 VERSION
 -------
-GitHub Build: {get_github_version()}
-Install Date: {config.get('install_date', 'Unknown')}
+GitHub Build: {version}
+Install Date: {install_date}
 
 LLM CONFIGURATION
 -----------------
 Provider: {llm_provider}
 Model: {llm_model}
 API Key: {api_key_status}
-Temperature: {config.get('temperature', 0.7)}
-Max Tokens: {config.get('max_tokens', 500)}
+Temperature: {temperature}
+Max Tokens: {max_tokens}
 
 CONNECTION
 ----------
 Type: {connection_type}
 Details: {conn_detail}
-Status: {"Connected" if interface else "Disconnected"}
+Status: {connection_status}
 
 NETWORK
 -------
@@ -361,13 +481,98 @@ FEATURES
 --------
 Relay System: {relay_enabled}
 Dashboard: http://localhost:{dashboard_port}/dashboard
-Onboarding: {config.get('onboarding_completed', 'Not completed')}
+Onboarding: {onboarding}
 """
 
 
-def build_features_section() -> str:
-    """Build detailed feature explanations."""
-    return """
+def build_settings_section(config: Dict[str, Any], interface=None) -> str:
+    """Build current settings snapshot.
+
+    The rendered text is memoized on the handful of values it reads, so
+    repeated onboarding refreshes with unchanged settings skip formatting.
+    """
+
+    cfg_get = config.get
+
+    # LLM Settings
+    llm_provider = cfg_get("llm_provider", "unknown")
+    llm_model = cfg_get("llm_model", "unknown")
+    api_key_set = bool(cfg_get("api_key"))
+    temperature = cfg_get("temperature", 0.7)
+    max_tokens = cfg_get("max_tokens", 500)
+
+    # Connection Settings
+    connection_type = cfg_get("connection_type", "unknown")
+    if connection_type == "serial":
+        conn_detail = f"Serial: {cfg_get('serial_port', 'auto-detect')}"
+    else:
+        conn_detail = f"WiFi: {cfg_get('wifi_host', '192.168.0.1')}"
+
+    # Channel Info
+    channels = get_active_channels(interface)
+
+    # Modem Preset
+    modem_preset = None
+    if interface and hasattr(interface, "localNode"):
+        local_node = interface.localNode
+        if hasattr(local_node, "localConfig"):
+            lora_config = getattr(local_node.localConfig, "lora", None)
+            if lora_config:
+                modem_preset = getattr(lora_config, "modem_preset", None)
+
+    relay_on = bool(cfg_get("relay_enabled", True))
+    dashboard_port = cfg_get("dashboard_port", 5000)
+    install_date = cfg_get("install_date", "Unknown")
+    onboarding = cfg_get("onboarding_completed", "Not completed")
+
+    key = (
+        llm_provider, llm_model, api_key_set, temperature, max_tokens,
+        connection_type, conn_detail, channels, modem_preset, relay_on,
+        dashboard_port, install_date, onboarding, bool(interface),
+    )
+    try:
+        cached = _SETTINGS_CACHE.get(key)
+    except TypeError:
+        # Unhashable config value; render without caching
+        key = None
+        cached = None
+    if cached is not None:
+        return cached
+
+    api_key_status = "Configured" if api_key_set else "Not set"
+    modem_name = get_modem_preset_name(modem_preset)
+
+    # Relay Status
+    relay_enabled = "Enabled (ACK tracking active)" if relay_on else "Disabled"
+    connection_status = "Connected" if interface else "Disconnected"
+    version = get_github_version()
+
+    rendered = _SETTINGS_TMPL.format_map({
+        "version": version,
+        "install_date": install_date,
+        "llm_provider": llm_provider,
+        "llm_model": llm_model,
+        "api_key_status": api_key_status,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "connection_type": connection_type,
+        "conn_detail": conn_detail,
+        "connection_status": connection_status,
+        "channels": channels,
+        "modem_name": modem_name,
+        "relay_enabled": relay_enabled,
+        "dashboard_port": dashboard_port,
+        "onboarding": onboarding,
+    })
+    if key is not None:
+        if len(_SETTINGS_CACHE) >= _SETTINGS_CACHE_SIZE:
+            # Settings rarely churn; start over rather than track recency
+            _SETTINGS_CACHE.clear()
+        _SETTINGS_CACHE[key] = rendered
+    return rendered
+
+
+_FEATURES_SECTION = """
 FEATURE DEEP-DIVE
 ================================================================================
 
@@ -563,7 +768,22 @@ This enables asynchronous messaging across mesh networks.
 """
 
 
-def build_system_context(config: Dict[str, Any], interface=None, user_query: Optional[str] = None) -> str:
+def build_features_section() -> str:
+    """Build detailed feature explanations."""
+    return _FEATURES_SECTION
+
+
+# Section name -> builder(config, interface); see build_system_context
+_SECTION_BUILDERS = {
+    "settings": build_settings_section,
+    "commands": lambda config, interface: build_commands_section(),
+    "architecture": lambda config, interface: _ARCHITECTURE_SECTION,
+    "features": lambda config, interface: _FEATURES_SECTION,
+}
+
+
+def build_system_context(config: Dict[str, Any], interface=None, user_query: Optional[str] = None,
+                         sections: Iterable[str] = ("commands",)) -> str:
     """
     Build complete system context for AI injection.
 
@@ -571,75 +791,87 @@ def build_system_context(config: Dict[str, Any], interface=None, user_query: Opt
         config: Current system configuration dict
         interface: Meshtastic interface object (optional)
         user_query: User's question for context (optional)
+        sections: Which of "settings", "commands", "architecture" and
+            "features" to include, in order. Only these are built.
 
     Returns:
-        Complete context string (~50k tokens)
+        Context string (~50k tokens with every section)
     """
 
-    # Lightweight context - only commands to avoid Ollama timeout on RPi
-    context_parts = [
-        "=" * 80,
-        "MESH-MASTER COMMAND REFERENCE",
-        "=" * 80,
-        "",
-        build_commands_section(),
-        "",
-        "=" * 80,
-    ]
+    # Lightweight context by default - only commands to avoid Ollama timeout
+    # on RPi. A lone section (the usual case) is interpolated once into a
+    # single f-string rather than copied through a parts list (or StringIO,
+    # which copies it twice).
+    builders = []
+    for name in sections:
+        builder = _SECTION_BUILDERS.get(name)
+        if builder is None:
+            raise ValueError(f"Unknown system context section: {name!r}")
+        builders.append(builder)
+    if len(builders) == 1:
+        body = builders[0](config, interface)
+    else:
+        body = "\n".join(builder(config, interface) for builder in builders)
 
+    rule = "=" * 80
     if user_query:
-        context_parts.extend([
-            "",
-            f"USER QUERY: {user_query}",
-            "",
-            "Please answer the user's question using the system context above.",
-            "Be specific, cite relevant commands and features, and provide examples.",
-            "=" * 80,
-        ])
+        return (
+            f"{rule}\nMESH-MASTER COMMAND REFERENCE\n{rule}\n\n{body}\n\n{rule}\n"
+            f"\nUSER QUERY: {user_query}\n\n"
+            "Please answer the user's question using the system context above.\n"
+            "Be specific, cite relevant commands and features, and provide examples.\n"
+            f"{rule}"
+        )
 
-    return "\n".join(context_parts)
+    return f"{rule}\nMESH-MASTER COMMAND REFERENCE\n{rule}\n\n{body}\n\n{rule}"
 
 
 # Context activation state
-SYSTEM_CONTEXT_ACTIVE = False
-SYSTEM_CONTEXT_TIMESTAMP = 0
 SYSTEM_CONTEXT_TIMEOUT = 1800  # 30 minutes
-SYSTEM_CONTEXT_SINGLE_USE = False  # Single-use mode for /help and /menu follow-ups
+
+
+@dataclass
+class _ContextState:
+    active: bool = False
+    timestamp: float = 0.0
+    single_use: bool = False  # Single-use mode for /help and /menu follow-ups
+
+
+_STATE = _ContextState()
 
 
 def activate_system_context():
     """Activate system context for onboarding or /system command (persistent)."""
-    global SYSTEM_CONTEXT_ACTIVE, SYSTEM_CONTEXT_TIMESTAMP, SYSTEM_CONTEXT_SINGLE_USE
-    SYSTEM_CONTEXT_ACTIVE = True
-    SYSTEM_CONTEXT_TIMESTAMP = time.time()
-    SYSTEM_CONTEXT_SINGLE_USE = False
+    state = _STATE
+    state.active = True
+    state.timestamp = time.time()
+    state.single_use = False
 
 
 def activate_system_context_singleuse():
     """Activate system context for one question only (/help and /menu follow-ups)."""
-    global SYSTEM_CONTEXT_ACTIVE, SYSTEM_CONTEXT_TIMESTAMP, SYSTEM_CONTEXT_SINGLE_USE
-    SYSTEM_CONTEXT_ACTIVE = True
-    SYSTEM_CONTEXT_TIMESTAMP = time.time()
-    SYSTEM_CONTEXT_SINGLE_USE = True
+    state = _STATE
+    state.active = True
+    state.timestamp = time.time()
+    state.single_use = True
 
 
 def deactivate_system_context():
     """Deactivate system context (onboarding complete or timeout)."""
-    global SYSTEM_CONTEXT_ACTIVE, SYSTEM_CONTEXT_TIMESTAMP, SYSTEM_CONTEXT_SINGLE_USE
-    SYSTEM_CONTEXT_ACTIVE = False
-    SYSTEM_CONTEXT_TIMESTAMP = 0
-    SYSTEM_CONTEXT_SINGLE_USE = False
+    state = _STATE
+    state.active = False
+    state.timestamp = 0.0
+    state.single_use = False
 
 
 def is_system_context_active() -> bool:
     """Check if system context should be injected."""
-    global SYSTEM_CONTEXT_ACTIVE, SYSTEM_CONTEXT_TIMESTAMP
-
-    if not SYSTEM_CONTEXT_ACTIVE:
+    state = _STATE
+    if not state.active:
         return False
 
     # Check timeout
-    if time.time() - SYSTEM_CONTEXT_TIMESTAMP > SYSTEM_CONTEXT_TIMEOUT:
+    if time.time() - state.timestamp > SYSTEM_CONTEXT_TIMEOUT:
         deactivate_system_context()
         return False
 
@@ -651,15 +883,13 @@ def consume_system_context() -> bool:
     Check if context is active and consume it if single-use.
     Returns True if context should be injected.
     """
-    global SYSTEM_CONTEXT_SINGLE_USE
-
     active = is_system_context_active()
 
     if not active:
         return False
 
     # If single-use mode, deactivate after this use
-    if SYSTEM_CONTEXT_SINGLE_USE:
+    if _STATE.single_use:
         deactivate_system_context()
 
     return True
@@ -667,6 +897,6 @@ def consume_system_context() -> bool:
 
 def refresh_system_context_timeout():
     """Refresh timeout when user interacts (only for persistent mode)."""
-    global SYSTEM_CONTEXT_TIMESTAMP, SYSTEM_CONTEXT_SINGLE_USE
-    if SYSTEM_CONTEXT_ACTIVE and not SYSTEM_CONTEXT_SINGLE_USE:
-        SYSTEM_CONTEXT_TIMESTAMP = time.time()
+    state = _STATE
+    if state.active and not state.single_use:
+        state.timestamp = time.time()
@@ -1,27 +1,38 @@
 """Telegram notification helper for relay ACKs and other notifications."""
 
-def send_telegram_notification(sender_id: str, message: str):
-    """Send a notification to a Telegram user.
+import sys
+import threading
 
-    Args:
-        sender_id: Telegram sender ID in format "telegram_{chat_id}"
-        message: Message to send
-    """
-    if not sender_id.startswith("telegram_"):
-        raise ValueError(f"Invalid Telegram sender_id: {sender_id}")
+# One pooled HTTP session so repeated notifications reuse the keep-alive TLS
+# connection to api.telegram.org instead of handshaking every time.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+_PREFIX = "telegram_"
+_PREFIX_LEN = len(_PREFIX)
+
+# sendMessage URL (embeds the bot token), resolved on first use
+_CACHED_URL = None
+
+
+def _get_session():
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                import requests
+                _SESSION = requests.Session()
+    return _SESSION
 
-    try:
-        chat_id = int(sender_id.replace("telegram_", ""))
-    except ValueError:
-        raise ValueError(f"Invalid Telegram chat_id in sender_id: {sender_id}")
 
-    # Import here to avoid circular dependencies
-    import sys
-    import os
-    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+def _get_send_url() -> str:
+    """Resolve the bot's sendMessage URL once from the main module's telegram_app."""
+    global _CACHED_URL
+    url = _CACHED_URL
+    if url is not None:
+        return url
 
     # Get telegram_app from main module
-    import importlib
     main_module = sys.modules.get('__main__')
     if not main_module:
         raise RuntimeError("Cannot access main module")
@@ -31,13 +42,49 @@ def send_telegram_notification(sender_id: str, message: str):
         raise RuntimeError("Telegram app not available")
 
     # Send via HTTP to avoid async issues
-    import requests
     bot_token = telegram_app.bot.token
     url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+    _CACHED_URL = url
+    return url
 
-    response = requests.post(
-        url,
-        json={"chat_id": chat_id, "text": message},
-        timeout=10
+
+def _clear_send_url() -> None:
+    global _CACHED_URL
+    _CACHED_URL = None
+
+
+def parse_chat_id(sender_id: str) -> int:
+    """Return the numeric chat id from a ``telegram_{chat_id}`` sender id."""
+    if not sender_id.startswith(_PREFIX):
+        raise ValueError(f"Invalid Telegram sender_id: {sender_id}")
+
+    try:
+        return int(sender_id[_PREFIX_LEN:])
+    except ValueError:
+        raise ValueError(f"Invalid Telegram chat_id in sender_id: {sender_id}")
+
+
+def post_message(chat_id, text: str, *, timeout: float = 10):
+    """POST ``text`` to ``chat_id`` over the shared session and return the response.
+
+    A non-2xx response clears the cached URL so a restarted bot's new token is
+    picked up on the next call; callers decide whether to raise or log.
+    """
+    response = _get_session().post(
+        _get_send_url(),
+        json={"chat_id": chat_id, "text": text},
+        timeout=timeout
     )
-    response.raise_for_status()
+    if not response.ok:
+        _clear_send_url()
+    return response
+
+
+def send_telegram_notification(sender_id: str, message: str):
+    """Send a notification to a Telegram user.
+
+    Args:
+        sender_id: Telegram sender ID in format "telegram_{chat_id}"
+        message: Message to send
+    """
+    post_message(parse_chat_id(sender_id), message).raise_for_status()
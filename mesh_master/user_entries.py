@@ -5,15 +5,26 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
+import bisect
+import functools
 import json
+import os
+import re
 import threading
 
+from .index_journal import IndexJournal, replay
+
 try:
     from unidecode import unidecode
 except Exception:  # pragma: no cover
     def unidecode(value: str) -> str:  # type: ignore
         return value
 
+try:
+    import orjson
+except Exception:  # pragma: no cover - orjson is optional; stdlib json is the fallback
+    orjson = None  # type: ignore
+
 
 @dataclass
 class UserEntryRecord:
@@ -48,7 +59,12 @@ class UserEntryStore:
     def __init__(self, index_file: Path, *, base_dir: Optional[Path] = None) -> None:
         self.index_file = Path(index_file)
         self.base_dir = Path(base_dir) if base_dir else self.index_file.parent
+        # Append-only log of index changes since index.json was last written
+        self._journal = IndexJournal(self.index_file)
+        self.journal_file = self._journal.path
         self._entries: Dict[str, _IndexEntry] = {}
+        # (created_at, key) ascending, kept in step with _entries
+        self._order: List[Tuple[str, str]] = []
         self._lock = threading.RLock()
         self._loaded = False
         self._load_error: Optional[str] = None
@@ -68,13 +84,16 @@ class UserEntryStore:
             if not self._loaded:
                 self._load_index()
             result: List[Dict[str, object]] = []
-            for entry in sorted(self._entries.values(), key=lambda e: e.created_at, reverse=True):
+            scan = self._scan_base_dir()
+            for _, key in reversed(self._order):
+                entry = self._entries[key]
                 # Filter by author_id if specified
                 if author_id is not None and entry.author_id != author_id:
                     continue
+                dir_entry = scan.get(str(entry.path))
                 try:
-                    st = entry.path.stat()
-                    size = int(getattr(st, "st_size", 0))
+                    st = dir_entry.stat() if dir_entry is not None else entry.path.stat()
+                    size = st.st_size
                 except Exception:
                     size = 0
                 rel_path = entry.path
@@ -124,8 +143,7 @@ class UserEntryStore:
             if author_id is not None and entry.author_id != author_id:
                 return None
             try:
-                with entry.path.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = _loads(entry.path.read_bytes())
             except Exception:
                 return None
             return UserEntryRecord(
@@ -154,7 +172,8 @@ class UserEntryStore:
             except Exception:
                 pass
             self._entries.pop(normalized, None)
-            self._write_index()
+            _remove_sorted(self._order, (entry.created_at, normalized))
+            self._append_journal([{"op": "del", "key": normalized}])
             self._load_error = None
             return True
 
@@ -163,20 +182,23 @@ class UserEntryStore:
         with self._lock:
             if not self._loaded:
                 self._load_index()
-            items = list(self._entries.items())
-            before = len(items)
+            before = len(self._entries)
             if before <= max_entries:
                 return {"before": before, "removed": 0, "after": before}
-            items.sort(key=lambda kv: kv[1].created_at)
+            victims = self._order[: before - max_entries]
+            del self._order[: before - max_entries]
             removed = 0
-            for key, entry in items[: before - max_entries]:
+            ops = []
+            for _, key in victims:
+                entry = self._entries[key]
                 try:
                     entry.path.unlink(missing_ok=True)
                 except Exception:
                     pass
                 self._entries.pop(key, None)
+                ops.append({"op": "del", "key": key})
                 removed += 1
-            self._write_index()
+            self._append_journal(ops)
             after = len(self._entries)
             return {"before": before, "removed": removed, "after": after}
 
@@ -212,9 +234,7 @@ class UserEntryStore:
             "aliases": list(aliases or []),
         }
         with self._lock:
-            with target.open("w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2, ensure_ascii=False)
-                f.write("\n")
+            target.write_bytes(_dump_json(payload))
             entry = _IndexEntry(
                 key=key,
                 title=title,
@@ -226,8 +246,12 @@ class UserEntryStore:
                 language=language,
                 group=slug,
             )
+            existing = self._entries.get(key)
+            if existing is not None:
+                _remove_sorted(self._order, (existing.created_at, key))
+            bisect.insort(self._order, (created_iso, key))
             self._entries[key] = entry
-            self._write_index()
+            self._append_journal([dict(self._entry_row(entry), op="put")])
             self._load_error = None
             return {"key": key, "slug": slug, "created_at": created_iso}
 
@@ -237,31 +261,43 @@ class UserEntryStore:
     def _load_index(self) -> None:
         if self._loaded:
             return
+        # Journals were briefly written as index.jsonl; pick one up under the shared name
+        legacy_journal = self.index_file.with_suffix(".jsonl")
+        if legacy_journal.is_file() and not self.journal_file.exists():
+            try:
+                os.replace(legacy_journal, self.journal_file)
+            except OSError:
+                pass
         try:
-            if not self.index_file.is_file():
+            if not self.index_file.is_file() and not self.journal_file.is_file():
                 self._entries.clear()
+                self._order = []
                 self._loaded = True
                 self._load_error = "Index missing"
                 return
-            with self.index_file.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _loads(self.index_file.read_bytes()) if self.index_file.is_file() else {}
+            journal, journal_clean = self._journal.read()
         except FileNotFoundError:
             self._entries.clear()
+            self._order = []
             self._loaded = True
             self._load_error = "Index missing"
             return
         except Exception as exc:
             self._entries.clear()
+            self._order = []
             self._loaded = True
             self._load_error = f"Failed to load index: {exc}"
             return
 
         entries_raw = data.get("entries") if isinstance(data, dict) else []
-        entries: Dict[str, _IndexEntry] = {}
+        rows: Dict[str, Dict[str, object]] = {}
         for item in entries_raw or []:
-            if not isinstance(item, dict):
-                continue
-            key = _normalize(item.get("key"))
+            if isinstance(item, dict):
+                rows[_normalize(item.get("key"))] = item
+        replay(rows, journal, _normalize)
+        entries: Dict[str, _IndexEntry] = {}
+        for key, item in rows.items():
             title = item.get("title") or ""
             path_raw = item.get("path") or ""
             summary = item.get("summary") or ""
@@ -285,55 +321,113 @@ class UserEntryStore:
                 group=group,
             )
         self._entries = entries
+        self._order = sorted((entry.created_at, key) for key, entry in entries.items())
+        self._journal.pending = len(journal)
         self._loaded = True
         self._load_error = None
-
-    def _write_index(self) -> None:
-        entries = []
-        for entry in sorted(self._entries.values(), key=lambda e: e.created_at, reverse=True):
-            rel_path = entry.path
+        if not journal_clean:
+            # Fold the log now so new appends don't land on a torn line
             try:
-                rel_path = entry.path.relative_to(self.base_dir)
+                self._write_index()
             except Exception:
-                rel_path = entry.path
-            entries.append(
-                {
-                    "key": entry.key,
-                    "title": entry.title,
-                    "summary": entry.summary,
-                    "author": entry.author,
-                    "author_id": entry.author_id,
-                    "created_at": entry.created_at,
-                    "language": entry.language,
-                    "group": entry.group,
-                    "path": rel_path.as_posix(),
-                }
-            )
+                pass
+
+    def _scan_base_dir(self) -> Dict[str, os.DirEntry]:
+        """One readdir of the entry dir; DirEntry caches each file's stat."""
+        try:
+            with os.scandir(self.base_dir) as it:
+                return {de.path: de for de in it}
+        except OSError:
+            return {}
+
+    def _append_journal(self, ops: List[Dict[str, object]]) -> None:
+        """Record index changes without rewriting index.json; compact when the log grows."""
+        if not ops:
+            return
+        self._journal.append(ops)
+        if self._journal.needs_compaction(len(self._entries)):
+            self._write_index()
+
+    def _entry_row(self, entry: _IndexEntry) -> Dict[str, object]:
+        rel_path = entry.path
+        try:
+            rel_path = entry.path.relative_to(self.base_dir)
+        except Exception:
+            rel_path = entry.path
+        return {
+            "key": entry.key,
+            "title": entry.title,
+            "summary": entry.summary,
+            "author": entry.author,
+            "author_id": entry.author_id,
+            "created_at": entry.created_at,
+            "language": entry.language,
+            "group": entry.group,
+            "path": rel_path.as_posix(),
+        }
+
+    def _write_index(self) -> None:
+        entries = [self._entry_row(self._entries[key]) for _, key in reversed(self._order)]
         payload = {"entries": entries}
-        self.index_file.parent.mkdir(parents=True, exist_ok=True)
-        with self.index_file.open("w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False)
-            f.write("\n")
+        _write_atomic(self.index_file, _dump_json(payload))
+        # Everything in the journal is now folded into index.json
+        self._journal.clear()
 
 
 def _normalize(value: Optional[str]) -> str:
     if not value:
         return ""
-    lowered = unidecode(str(value)).lower()
+    return _normalize_text(value if isinstance(value, str) else str(value))
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_text(value: str) -> str:
+    lowered = unidecode(value).lower()
     return " ".join(lowered.split())
 
 
+# Quotes vanish; every other non-alphanumeric ASCII character becomes a dash
+_SLUG_TABLE = {code: (None if chr(code) in "'\"" else "-") for code in range(128) if not chr(code).isalnum()}
+_SLUG_DASHES = re.compile(r"-+")
+
+
+@functools.lru_cache(maxsize=4096)
 def _slugify(value: str) -> str:
-    slug = unidecode(value or "").lower()
-    slug = slug.replace("'", "")
-    slug = slug.replace("\"", "")
-    slug = slug.replace("/", " ")
-    slug = slug.replace("\\", " ")
-    slug = "".join(ch if ch.isalnum() else "-" for ch in slug)
-    slug = "-".join(part for part in slug.split('-') if part)
+    slug = unidecode(value or "").lower().translate(_SLUG_TABLE)
+    if not slug.isascii():
+        # Only reachable without unidecode; keep the Unicode-aware rule
+        slug = "".join(ch if ch.isalnum() else "-" for ch in slug)
+    slug = _SLUG_DASHES.sub("-", slug).strip("-")
     return slug or "entry"
 
 
+def _remove_sorted(items: List, value: object) -> None:
+    pos = bisect.bisect_left(items, value)
+    if pos < len(items) and items[pos] == value:
+        del items[pos]
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.tmp")
+    with tmp.open("wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _loads(data: bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dump_json(payload: object) -> bytes:
+    """Serialize as indented UTF-8 JSON with a trailing newline."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(payload, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+
 def _clip_text(value: str, limit: int) -> str:
     text = (value or "").strip()
     limit = max(1, int(limit))
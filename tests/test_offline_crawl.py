@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+import marshal
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from unittest import mock
+import unittest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from mesh_master import offline_crawl
+from mesh_master.offline_crawl import OfflineCrawlStore
+
+
+class OfflineCrawlIndexCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = Path(tempfile.mkdtemp(prefix="offline_crawl_test_"))
+        self.addCleanup(lambda: shutil.rmtree(self.tmp_dir, ignore_errors=True))
+        self.index = self.tmp_dir / "index.json"
+        store = self._store()
+        store.store_crawl(title="Example Site", summary="An example", context="Example body text")
+        store.flush_index()
+        self.cache = store.cache_file
+
+    def _store(self) -> OfflineCrawlStore:
+        return OfflineCrawlStore(self.index, base_dir=self.tmp_dir)
+
+    def _titles(self, store: OfflineCrawlStore) -> list:
+        return [entry["title"] for entry in store.list_entries()]
+
+    def test_cache_records_the_index_stamp(self):
+        cached = marshal.loads(self.cache.read_bytes())
+        st = self.index.stat()
+        self.assertEqual(tuple(cached["stamp"]), (st.st_mtime_ns, st.st_size))
+        self.assertEqual(cached["data"], json.loads(self.index.read_text(encoding="utf-8")))
+
+    def test_matching_stamp_loads_from_cache(self):
+        with mock.patch.object(offline_crawl.json, "load", side_effect=AssertionError("parsed index.json")):
+            store = self._store()
+        self.assertEqual(self._titles(store), ["Example Site"])
+
+    def test_replaced_index_with_older_mtime_is_parsed(self):
+        payload = json.loads(self.index.read_text(encoding="utf-8"))
+        payload["entries"][0]["title"] = "Restored Site"
+        self.index.write_text(json.dumps(payload), encoding="utf-8")
+        older = self.cache.stat().st_mtime_ns - 10**9
+        os.utime(self.index, ns=(older, older))
+
+        store = self._store()
+        self.assertEqual(self._titles(store), ["Restored Site"])
+        # The sidecar is rebuilt for the index now on disk
+        st = self.index.stat()
+        self.assertEqual(tuple(marshal.loads(self.cache.read_bytes())["stamp"]), (st.st_mtime_ns, st.st_size))
+
+    def test_corrupt_cache_is_a_miss(self):
+        for garbage in (b"", b"\x00not marshal", marshal.dumps(["not", "a", "dict"])):
+            with self.subTest(garbage=garbage):
+                self.cache.write_bytes(garbage)
+                store = self._store()
+                self.assertEqual(self._titles(store), ["Example Site"])
+                self.assertIsInstance(marshal.loads(self.cache.read_bytes()), dict)
+
+    def test_cache_without_stamp_is_a_miss(self):
+        # Sidecars written before the stamp was stored hold the bare manifest
+        self.cache.write_bytes(marshal.dumps({"entries": []}))
+        store = self._store()
+        self.assertEqual(self._titles(store), ["Example Site"])
+
+
+if __name__ == "__main__":
+    unittest.main()
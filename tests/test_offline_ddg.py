@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import json
+import shutil
+import sys
+import tempfile
+import threading
+from pathlib import Path
+import unittest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from mesh_master import index_journal
+from mesh_master.offline_ddg import OfflineDDGStore
+
+
+class OfflineDDGJournalTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = Path(tempfile.mkdtemp(prefix="offline_ddg_test_"))
+        self.addCleanup(lambda: shutil.rmtree(self.tmp_dir, ignore_errors=True))
+        self.index = self.tmp_dir / "index.json"
+
+    def _store(self) -> OfflineDDGStore:
+        return OfflineDDGStore(self.index, base_dir=self.tmp_dir)
+
+    def _save(self, store: OfflineDDGStore, query: str) -> str:
+        saved = store.store_search(query=query, summary=f"{query} summary", context=f"{query} context")
+        return saved["key"]
+
+    def _journal_ops(self, store: OfflineDDGStore) -> list:
+        lines = store.journal_file.read_bytes().splitlines()
+        return [json.loads(line)["op"] for line in lines]
+
+    def test_changes_replay_from_journal_after_restart(self):
+        store = self._store()
+        index_before = self.index.read_bytes()
+        key = self._save(store, "raspberry pi")
+        self._save(store, "mount everest")
+
+        # Appends go to the journal; index.json is not rewritten per change
+        self.assertEqual(self.index.read_bytes(), index_before)
+        self.assertEqual(self._journal_ops(store), ["put", "put"])
+
+        reopened = self._store()
+        self.assertEqual(len(reopened.list_entries()), 2)
+        record, _ = reopened.lookup(key)
+        self.assertIsNotNone(record)
+        self.assertEqual(record.summary, "raspberry pi summary")
+        self.assertIsNotNone(reopened.lookup("mount everest")[0])
+
+    def test_deletes_replay_from_journal(self):
+        store = self._store()
+        key = self._save(store, "raspberry pi")
+        self._save(store, "mount everest")
+        self.assertTrue(store.delete(key))
+        self.assertEqual(self._journal_ops(store), ["put", "put", "del"])
+
+        reopened = self._store()
+        self.assertEqual([e["query"] for e in reopened.list_entries()], ["mount everest"])
+        self.assertIsNone(reopened.lookup(key)[0])
+
+    def test_truncated_last_line_is_skipped_and_folded(self):
+        store = self._store()
+        self._save(store, "raspberry pi")
+        with store.journal_file.open("ab") as f:
+            f.write(b'{"op": "put", "key": "torn')
+
+        reopened = self._store()
+        self.assertEqual([e["query"] for e in reopened.list_entries()], ["raspberry pi"])
+        # The torn log is folded into index.json so later appends start clean
+        self.assertFalse(store.journal_file.exists())
+        self._save(reopened, "mount everest")
+        self.assertEqual(len(self._store().list_entries()), 2)
+
+    def test_journal_compacts_into_index(self):
+        store = self._store()
+        limit = index_journal.JOURNAL_COMPACT_MIN
+        for i in range(limit + 1):
+            self._save(store, f"query {i}")
+
+        self.assertFalse(store.journal_file.exists())
+        payload = json.loads(self.index.read_text(encoding="utf-8"))
+        self.assertEqual(len(payload["entries"]), limit + 1)
+
+        self._save(store, "after compaction")
+        self.assertEqual(self._journal_ops(store), ["put"])
+        self.assertEqual(len(self._store().list_entries()), limit + 2)
+
+
+class OfflineDDGArchiveTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = Path(tempfile.mkdtemp(prefix="offline_ddg_archive_test_"))
+        self.addCleanup(lambda: shutil.rmtree(self.tmp_dir, ignore_errors=True))
+        self.index = self.tmp_dir / "index.json"
+
+    def _store(self, use_sqlite: bool = True) -> OfflineDDGStore:
+        store = OfflineDDGStore(self.index, base_dir=self.tmp_dir, use_sqlite=use_sqlite)
+        if store._db is not None:
+            self.addCleanup(store._db.close)
+        return store
+
+    def _save(self, store: OfflineDDGStore, query: str) -> str:
+        saved = store.store_search(
+            query=query,
+            summary=f"{query} summary",
+            context=f"{query} context",
+            results=[{"title": f"{query} result", "url": "https://example.com"}],
+        )
+        return saved["key"]
+
+    def test_records_live_in_the_archive(self):
+        store = self._store()
+        key = self._save(store, "raspberry pi")
+
+        self.assertTrue(store.archive_file.exists())
+        self.assertEqual(list(self.tmp_dir.glob("raspberry-pi-*.json")), [])
+        record, _ = self._store().lookup(key)
+        self.assertEqual(record.context, "raspberry pi context")
+        self.assertEqual(record.results[0]["title"], "raspberry pi result")
+        listed = store.list_entries()
+        self.assertEqual(len(listed), 1)
+        self.assertGreater(listed[0]["size_bytes"], 0)
+
+    def test_delete_and_prune_remove_archived_records(self):
+        store = self._store()
+        first = self._save(store, "raspberry pi")
+        self._save(store, "mount everest")
+        self._save(store, "apollo 11")
+
+        self.assertTrue(store.delete(first))
+        self.assertEqual(store.prune_by_max(1), {"before": 2, "removed": 1, "after": 1})
+        rows = store._db.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+        self.assertEqual(rows, 1)
+        self.assertIsNone(self._store().lookup(first)[0])
+
+    def test_legacy_json_record_moves_into_the_archive(self):
+        key = self._save(self._store(use_sqlite=False), "raspberry pi")
+        legacy = list(self.tmp_dir.glob("raspberry-pi-*.json"))
+        self.assertEqual(len(legacy), 1)
+
+        store = self._store()
+        # The shared-lock read path only reads the file; migration waits for the write lock
+        record, _ = store._lookup(key)
+        self.assertEqual(record.summary, "raspberry pi summary")
+        self.assertTrue(legacy[0].exists())
+
+        record, _ = store.lookup(key)
+        self.assertEqual(record.summary, "raspberry pi summary")
+        self.assertFalse(legacy[0].exists())
+        self.assertIsNotNone(self._store().lookup(key)[0])
+
+    def test_concurrent_lookups_of_legacy_record_never_miss(self):
+        keys = []
+        plain = self._store(use_sqlite=False)
+        for i in range(20):
+            keys.append(self._save(plain, f"query {i}"))
+        store = self._store()
+        misses = []
+
+        def read():
+            for key in keys:
+                if store.lookup(key)[0] is None:
+                    misses.append(key)
+
+        readers = [threading.Thread(target=read) for _ in range(8)]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+
+        self.assertEqual(misses, [])
+        self.assertEqual(list(self.tmp_dir.glob("query-*.json")), [])
+
+    def test_cached_record_is_not_shared_with_callers(self):
+        for use_sqlite in (False, True):
+            with self.subTest(use_sqlite=use_sqlite):
+                store = self._store(use_sqlite=use_sqlite)
+                key = self._save(store, f"query {use_sqlite}")
+                record, _ = store.lookup(key)
+                record.results[0]["title"] = "edited"
+                record.results.append({"title": "extra"})
+                store._read_record_data(store._entries[key].path)["context"] = "edited"
+
+                again, _ = store.lookup(key)
+                self.assertEqual(again.results, [{"title": f"query {use_sqlite} result", "url": "https://example.com"}])
+                self.assertEqual(again.context, f"query {use_sqlite} context")
+
+
+if __name__ == "__main__":
+    unittest.main()
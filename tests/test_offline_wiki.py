@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
 import sys
 import tempfile
+import threading
 from pathlib import Path
 import unittest
 
@@ -11,9 +13,22 @@ PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from mesh_master import offline_wiki
 from mesh_master.offline_wiki import OfflineWikiStore, OfflineWikiArticle
 
 
+def _reference_slugify(value: str) -> str:
+    """The replace/generator slug rule _slugify's translate table must match."""
+    slug = offline_wiki.unidecode(value or "").lower()
+    slug = slug.replace("'", "")
+    slug = slug.replace("\"", "")
+    slug = slug.replace("/", " ")
+    slug = slug.replace("\\", " ")
+    slug = "".join(ch if ch.isalnum() else "-" for ch in slug)
+    slug = "-".join(part for part in slug.split('-') if part)
+    return slug or "article"
+
+
 class OfflineWikiStoreTest(unittest.TestCase):
     def _make_dataset(self) -> tuple[Path, Path]:
         tmp_dir = Path(tempfile.mkdtemp(prefix="offline_wiki_test_"))
@@ -125,6 +140,78 @@ class OfflineWikiStoreTest(unittest.TestCase):
         self.assertTrue(store.delete(remaining_title))
         self.assertFalse(store.list_entries())
 
+    def test_index_cache_ignores_replacement_with_older_mtime(self):
+        index, base_dir = self._make_dataset()
+        OfflineWikiStore(index, base_dir=base_dir)  # builds the parsed-index cache
+
+        # Install a different index the way cp -p / rsync -a would: older mtime
+        old_mtime = index.stat().st_mtime - 3600
+        replacement = {"entries": [{"key": "alpha", "title": "Alpha", "path": "alpha.json"}]}
+        index.write_text(json.dumps(replacement), encoding="utf-8")
+        os.utime(index, (old_mtime, old_mtime))
+
+        store = OfflineWikiStore(index, base_dir=base_dir)
+        self.assertEqual([entry["title"] for entry in store.list_entries()], ["Alpha"])
+
+    def test_slugify_matches_reference_rule(self):
+        samples = [
+            "Apollo 11",
+            "  Rock 'n' Roll  ",
+            'The "Great" Gatsby',
+            "AC/DC \\ Back in Black",
+            "C++ (programming language)",
+            "tabs\tand\nnewlines\r\nmixed",
+            "--leading--and--trailing--",
+            "a.b,c;d:e!f?g@h#i$j%k^l&m*n",
+            "'\"'\"",
+            "",
+            "___",
+            "Zürich – Café",
+        ]
+        for sample in samples:
+            with self.subTest(sample=sample):
+                self.assertEqual(offline_wiki._slugify(sample), _reference_slugify(sample))
+        self.assertEqual(offline_wiki._slugify("  Rock 'n' Roll  "), "rock-n-roll")
+        self.assertEqual(offline_wiki._slugify("AC/DC \\ Back in Black"), "ac-dc-back-in-black")
+        self.assertEqual(offline_wiki._slugify("'\"'\""), "article")
+
+    def test_missing_article_does_not_flip_store_state(self):
+        index, base_dir = self._make_dataset()
+        store = OfflineWikiStore(index, base_dir=base_dir)
+        (base_dir / "apollo-11.json").unlink()
+
+        article, _ = store.lookup("Apollo 11")
+
+        self.assertIsNone(article)
+        self.assertTrue(store.is_ready())
+        self.assertIsNone(store.error_message())
+
+    def test_lookup_never_sees_partial_overwrite(self):
+        index, base_dir = self._make_dataset()
+        store = OfflineWikiStore(index, base_dir=base_dir)
+        stop = threading.Event()
+        misses = []
+
+        def read():
+            while not stop.is_set():
+                article, _ = store.lookup("Apollo 11")
+                if article is None:
+                    misses.append(1)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        try:
+            for i in range(200):
+                store.store_article(title="Apollo 11", content=f"Revision {i} " * 2000, overwrite=True)
+        finally:
+            stop.set()
+            for reader in readers:
+                reader.join()
+
+        self.assertEqual(misses, [])
+        self.assertTrue(store.is_ready())
+
     def test_missing_index_sets_error_state(self):
         with tempfile.TemporaryDirectory(prefix="offline_wiki_missing_") as tmp:
             base_dir = Path(tmp)
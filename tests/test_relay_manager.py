@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import importlib
+import subprocess
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from mesh_master import relay_manager
+
+
+class _Packet:
+    def __init__(self, packet_id: int):
+        self.id = packet_id
+
+
+class _FakeInterface:
+    """sendText stand-in; hangs while ``hang`` is set, else returns a packet."""
+
+    def __init__(self, first_id: int = 100, hang: bool = False):
+        self.sent = []
+        self.hang = threading.Event()
+        if hang:
+            self.hang.set()
+        self._release = threading.Event()
+        self._next_id = first_id
+
+    def sendText(self, text, destinationId=None, wantAck=False):
+        if self.hang.is_set():
+            self._release.wait(30)
+        self.sent.append((text, destinationId))
+        packet_id = self._next_id
+        self._next_id += 1
+        return _Packet(packet_id)
+
+
+class RelayManagerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # Fresh module state (queue, ACK shards, in-flight set) per test
+        global relay_manager
+        relay_manager = importlib.reload(relay_manager)
+        relay_manager.RELAY_SEND_TIMEOUT = 0.2
+        relay_manager.RELAY_CHUNK_GAP = 0.0
+        self.notices = []
+        self.logs = []
+
+    def _send_direct(self, interface, text, sender_id):
+        self.notices.append((sender_id, text))
+
+    def _clean_log(self, message, emoji="", **kwargs):
+        self.logs.append(message)
+
+    def _task(self, sender_id="!sender", target="!target", message="hello"):
+        return {
+            'sender_id': sender_id,
+            'target_shortname': "b",
+            'target_node_id': target,
+            'relay_text': f"relay: {message}",
+            'message': message,
+            'is_telegram': False,
+        }
+
+    def _send(self, task, interface, sender, split=lambda text: [text]):
+        return relay_manager._send_relay(task, interface, sender, split,
+                                         self._send_direct, self._clean_log)
+
+    def _wait_for(self, predicate, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.02)
+        return predicate()
+
+    def _tracked(self, packet_id):
+        """True once a worker has registered ``packet_id`` for ACK tracking."""
+        shard = relay_manager._ACK_SHARDS[relay_manager._ack_shard_index(packet_id)]
+        return lambda: packet_id in shard
+
+    def test_hung_send_does_not_block_later_sends(self):
+        sender = relay_manager._SendThread("test-send")
+        self.addCleanup(sender.close)
+        hung = _FakeInterface(hang=True)
+        self.addCleanup(hung._release.set)
+        healthy = _FakeInterface(first_id=200)
+
+        self.assertIsNone(self._send(self._task(), hung, sender))
+        self.assertEqual(self.notices, [("!sender", "❌ Failed to send to b")])
+
+        tracking = self._send(self._task(message="again"), healthy, sender)
+        self.assertIsNotNone(tracking)
+        self.assertEqual(tracking['packet_ids'], [200])
+        self.assertEqual(healthy.sent, [("relay: again", "!target")])
+
+    def test_hung_send_does_not_hold_up_interpreter_exit(self):
+        script = (
+            "import sys, threading\n"
+            f"sys.path.insert(0, {str(PROJECT_ROOT)!r})\n"
+            "from mesh_master import relay_manager\n"
+            "sender = relay_manager._SendThread('exit-send')\n"
+            "try:\n"
+            "    sender.call(0.1, threading.Event().wait)\n"
+            "except relay_manager._SendTimeout:\n"
+            "    pass\n"
+        )
+        result = subprocess.run([sys.executable, "-c", script], timeout=20,
+                                capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_worker_recovers_after_interface_swap(self):
+        relay_manager.RELAY_WORKERS_MIN = 1
+        hung = _FakeInterface(hang=True)
+        self.addCleanup(hung._release.set)
+        healthy = _FakeInterface(first_id=300)
+        current = {'interface': hung}
+        relay_manager.start_relay_workers(
+            None, lambda text: [text], self._send_direct, lambda node_id: "b",
+            lambda a, b: a == b, self._clean_log,
+            get_interface_func=lambda: current['interface'],
+        )
+        self.addCleanup(relay_manager.stop_relay_workers)
+
+        relay_manager.enqueue_relay(self._task())
+        self.assertTrue(self._wait_for(lambda: self.notices))
+        self.assertEqual(self.notices, [("!sender", "❌ Failed to send to b")])
+
+        current['interface'] = healthy
+        relay_manager.enqueue_relay(self._task(message="again"))
+        self.assertTrue(self._wait_for(self._tracked(300)))
+        relay_manager.handle_relay_ack(300, "!target")
+        self.assertTrue(self._wait_for(lambda: len(self.notices) == 2))
+        self.assertEqual(self.notices[1], ("!sender", "✅ ACK by b"))
+
+    def test_supervisor_retires_idle_worker_with_ring_at_capacity(self):
+        relay_manager.RELAY_SUPERVISOR_INTERVAL = 0.05
+        relay_manager.RELAY_IDLE_SHRINK_AFTER = 0.0
+        relay_manager.start_relay_workers(
+            _FakeInterface(), lambda text: [text], self._send_direct, lambda node_id: "b",
+            lambda a, b: a == b, self._clean_log,
+        )
+        self.addCleanup(relay_manager.stop_relay_workers)
+        # Any unforced put would now raise queue.Full
+        relay_manager.RELAY_QUEUE.maxsize = 0
+        relay_manager.RELAY_WORKERS_MIN = 1
+
+        self.assertTrue(self._wait_for(lambda: relay_manager._RELAY_WORKERS_ALIVE == 1))
+        self.assertEqual(relay_manager._RELAY_WORKERS_RETIRING, 0)
+        supervisors = [t for t in threading.enumerate() if t.name == "RelaySupervisor"]
+        self.assertTrue(any(t.is_alive() for t in supervisors))
+
+    def _start(self, interface, split=lambda text: [text], **hooks):
+        relay_manager.start_relay_workers(
+            interface, split, self._send_direct, lambda node_id: "b",
+            lambda a, b: a == b, self._clean_log, **hooks,
+        )
+        self.addCleanup(relay_manager.stop_relay_workers)
+
+    def test_acked_relay_notifies_sender_and_records_stats(self):
+        interface = _FakeInterface(first_id=400)
+        recorded = []
+        self._start(interface, record_relay_func=recorded.append)
+
+        self.assertIsNone(self._handle())
+        self.assertTrue(self._wait_for(self._tracked(400)))
+        self.assertIn("hello", interface.sent[0][0])
+        self.assertEqual(recorded, ["!target"])
+
+        relay_manager.handle_relay_ack(400, "!target")
+        self.assertTrue(self._wait_for(lambda: self.notices))
+        self.assertEqual(self.notices, [("!sender", "✅ ACK by b")])
+        self.assertTrue(self._wait_for(lambda: not relay_manager._IN_FLIGHT))
+
+    def test_multi_chunk_relay_waits_for_every_ack(self):
+        interface = _FakeInterface(first_id=500)
+        self._start(interface, split=lambda text: ["part 1", "part 2"])
+
+        relay_manager.enqueue_relay(self._task())
+        self.assertTrue(self._wait_for(self._tracked(501)))
+        relay_manager.handle_relay_ack(500, "!target")
+        time.sleep(0.2)
+        self.assertEqual(self.notices, [])
+
+        relay_manager.handle_relay_ack(501, "!target")
+        self.assertTrue(self._wait_for(lambda: self.notices))
+        self.assertEqual(self.notices, [("!sender", "✅ ACK by b")])
+
+    def test_unacked_relay_times_out_with_default_notice(self):
+        relay_manager.RELAY_ACK_TIMEOUT = 0.2
+        self._start(_FakeInterface())
+
+        self.assertIsNone(self._handle())
+        self.assertTrue(self._wait_for(lambda: self.notices))
+        self.assertEqual(self.notices, [("!sender", "❌ No ACK from b\n\nMessage: \"hello\"")])
+        self.assertTrue(self._wait_for(lambda: not relay_manager._IN_FLIGHT))
+
+    def test_unacked_relay_uses_no_ack_hook(self):
+        relay_manager.RELAY_ACK_TIMEOUT = 0.2
+        hooked = []
+
+        def no_ack(relay_task):
+            hooked.append(relay_task['message'])
+            return "📬 Queued for later"
+
+        self._start(_FakeInterface(), no_ack_message_func=no_ack)
+        self.assertIsNone(self._handle())
+        self.assertTrue(self._wait_for(lambda: self.notices))
+        self.assertEqual(hooked, ["hello"])
+        self.assertEqual(self.notices, [("!sender", "📬 Queued for later")])
+
+    def test_relay_error_goes_to_debug_log(self):
+        debug = []
+
+        def broken_split(text):
+            raise RuntimeError("split failed")
+
+        self._start(_FakeInterface(), split=broken_split, debug_log_func=debug.append)
+        self.assertIsNone(self._handle())
+        self.assertTrue(self._wait_for(lambda: self.notices))
+        self.assertEqual(self.notices, [("!sender", "❌ Relay error to b")])
+        self.assertEqual(debug, ["Relay worker exception: split failed"])
+        self.assertTrue(self._wait_for(lambda: not relay_manager._IN_FLIGHT))
+
+    def _handle(self,shortname_func=lambda node_id: "A", start_func=lambda: None):
+        return relay_manager.handle_shortname_relay(
+            "!sender", None, "b", "!target", "hello", shortname_func, start_func)
+
+    def test_duplicate_relay_is_refused_while_in_flight(self):
+        self.assertIsNone(self._handle())
+        duplicate = self._handle()
+        self.assertEqual(duplicate.text, "⏳ Relay already in flight to b")
+
+        relay_manager._release_relay(relay_manager.RELAY_QUEUE.get(timeout=0))
+        self.assertIsNone(self._handle())
+
+    def test_failed_setup_releases_in_flight_key(self):
+        def broken_start():
+            raise RuntimeError("interface gone")
+
+        with self.assertRaises(RuntimeError):
+            self._handle(start_func=broken_start)
+        self.assertFalse(relay_manager._IN_FLIGHT)
+        self.assertIsNone(self._handle())
+
+    def test_full_queue_releases_in_flight_key(self):
+        relay_manager.RELAY_QUEUE.maxsize = 0
+        reply = self._handle()
+        self.assertEqual(reply.text, "⚠️ Relay queue full. Try again in a moment.")
+        self.assertFalse(relay_manager._IN_FLIGHT)
+
+
+if __name__ == "__main__":
+    unittest.main()
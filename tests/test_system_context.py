@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+import unittest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from mesh_master import system_context
+
+
+def _reference_context(body: str, user_query=None) -> str:
+    """The parts-list assembly build_system_context used before sections existed."""
+    context_parts = [
+        "=" * 80,
+        "MESH-MASTER COMMAND REFERENCE",
+        "=" * 80,
+        "",
+        body,
+        "",
+        "=" * 80,
+    ]
+    if user_query:
+        context_parts.extend([
+            "",
+            f"USER QUERY: {user_query}",
+            "",
+            "Please answer the user's question using the system context above.",
+            "Be specific, cite relevant commands and features, and provide examples.",
+            "=" * 80,
+        ])
+    return "\n".join(context_parts)
+
+
+class BuildSystemContextTest(unittest.TestCase):
+    def test_default_output_matches_previous_assembly(self):
+        commands = system_context.build_commands_section()
+        self.assertEqual(system_context.build_system_context({}), _reference_context(commands))
+        self.assertEqual(
+            system_context.build_system_context({}, user_query="how do I relay?"),
+            _reference_context(commands, "how do I relay?"),
+        )
+
+    def test_sections_are_built_in_the_requested_order(self):
+        expected_body = "\n".join([
+            system_context.build_features_section(),
+            system_context.build_commands_section(),
+        ])
+        self.assertEqual(
+            system_context.build_system_context({}, sections=("features", "commands")),
+            _reference_context(expected_body),
+        )
+
+    def test_unknown_section_is_rejected(self):
+        with self.assertRaises(ValueError):
+            system_context.build_system_context({}, sections=("commands", "bogus"))
+
+
+@unittest.skipUnless(shutil.which("git"), "git is not installed")
+class ReadGitHeadTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.repo = Path(tempfile.mkdtemp(prefix="system_context_git_"))
+        self.addCleanup(lambda: shutil.rmtree(self.repo, ignore_errors=True))
+        self._git("init", "-q")
+        self._commit("first")
+
+    def _git(self, *args: str) -> str:
+        result = subprocess.run(
+            ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+            cwd=self.repo, capture_output=True, text=True, check=True,
+        )
+        return result.stdout.strip()
+
+    def _commit(self, message: str) -> None:
+        self._git("commit", "-q", "--allow-empty", "-m", message)
+
+    def _describe(self) -> str:
+        return self._git("describe", "--tags", "--always")
+
+    def _read(self):
+        return system_context._read_git_head(self.repo / ".git")
+
+    def test_untagged_head_is_short_sha(self):
+        self.assertEqual(self._read(), self._describe())
+
+    def test_loose_lightweight_tag(self):
+        self._git("tag", "v1.0")
+        self.assertEqual(self._read(), "v1.0")
+
+    def test_loose_annotated_tag_is_peeled(self):
+        self._git("tag", "-a", "v1.1", "-m", "release")
+        self.assertEqual(self._read(), self._describe())
+        self.assertEqual(self._read(), "v1.1")
+
+    def test_packed_annotated_tag_is_peeled(self):
+        self._git("tag", "-a", "v1.2", "-m", "release")
+        self._git("pack-refs", "--all")
+        self.assertFalse((self.repo / ".git" / "refs" / "tags" / "v1.2").exists())
+        self.assertEqual(self._read(), "v1.2")
+
+    def test_tag_object_in_packfile_defers_to_git_describe(self):
+        self._git("tag", "-a", "v1.3", "-m", "release")
+        self._git("gc", "-q")
+        # gc packs refs too; restore a loose ref whose object is only in a pack
+        sha = self._git("rev-parse", "refs/tags/v1.3")
+        (self.repo / ".git" / "refs" / "tags" / "v1.3").write_text(sha + "\n")
+        self.assertIsNone(self._read())
+
+    def test_head_past_a_tag_defers_to_git_describe(self):
+        self._git("tag", "-a", "v1.4", "-m", "release")
+        self._commit("second")
+        self.assertIsNone(self._read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+import unittest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from mesh_master import index_journal
+from mesh_master.user_entries import UserEntryStore
+
+
+class UserEntryJournalTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = Path(tempfile.mkdtemp(prefix="user_entries_test_"))
+        self.addCleanup(lambda: shutil.rmtree(self.tmp_dir, ignore_errors=True))
+        self.index = self.tmp_dir / "index.json"
+
+    def _store(self) -> UserEntryStore:
+        return UserEntryStore(self.index, base_dir=self.tmp_dir)
+
+    def _save(self, store: UserEntryStore, title: str) -> str:
+        saved = store.store_entry(title=title, content=f"{title} body", author="Ann", author_id="!a1")
+        return saved["key"]
+
+    def _journal_ops(self, store: UserEntryStore) -> list:
+        lines = store.journal_file.read_bytes().splitlines()
+        return [json.loads(line)["op"] for line in lines]
+
+    def test_journal_shares_the_index_log_name(self):
+        store = self._store()
+        self.assertEqual(store.journal_file, self.tmp_dir / "index.log")
+
+    def test_changes_replay_from_journal_after_restart(self):
+        store = self._store()
+        key = self._save(store, "Field report")
+        self._save(store, "Radio log")
+
+        self.assertFalse(self.index.exists())
+        self.assertEqual(self._journal_ops(store), ["put", "put"])
+
+        reopened = self._store()
+        self.assertTrue(reopened.is_ready())
+        self.assertEqual([e["title"] for e in reopened.list_entries()], ["Radio log", "Field report"])
+        record = reopened.lookup(key)
+        self.assertIsNotNone(record)
+        self.assertEqual(record.content, "Field report body")
+
+    def test_deletes_replay_from_journal(self):
+        store = self._store()
+        key = self._save(store, "Field report")
+        self._save(store, "Radio log")
+        self.assertTrue(store.delete(key))
+        self.assertEqual(self._journal_ops(store), ["put", "put", "del"])
+
+        reopened = self._store()
+        self.assertEqual([e["title"] for e in reopened.list_entries()], ["Radio log"])
+        self.assertIsNone(reopened.lookup(key))
+
+    def test_truncated_last_line_is_skipped_and_folded(self):
+        store = self._store()
+        self._save(store, "Field report")
+        with store.journal_file.open("ab") as f:
+            f.write(b'{"op": "put", "key": "torn')
+
+        reopened = self._store()
+        self.assertEqual([e["title"] for e in reopened.list_entries()], ["Field report"])
+        self.assertFalse(store.journal_file.exists())
+        self.assertTrue(self.index.exists())
+        self._save(reopened, "Radio log")
+        self.assertEqual(len(self._store().list_entries()), 2)
+
+    def test_journal_compacts_into_index(self):
+        store = self._store()
+        limit = index_journal.JOURNAL_COMPACT_MIN
+        for i in range(limit + 1):
+            self._save(store, f"Report {i}")
+
+        self.assertFalse(store.journal_file.exists())
+        payload = json.loads(self.index.read_text(encoding="utf-8"))
+        self.assertEqual(len(payload["entries"]), limit + 1)
+
+        self._save(store, "After compaction")
+        self.assertEqual(self._journal_ops(store), ["put"])
+        self.assertEqual(len(self._store().list_entries()), limit + 2)
+
+    def test_legacy_jsonl_journal_is_picked_up(self):
+        store = self._store()
+        self._save(store, "Field report")
+        legacy = self.tmp_dir / "index.jsonl"
+        store.journal_file.rename(legacy)
+
+        reopened = self._store()
+        self.assertEqual([e["title"] for e in reopened.list_entries()], ["Field report"])
+        self.assertFalse(legacy.exists())
+        self.assertTrue(reopened.journal_file.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()